@@ -12,6 +12,12 @@ import time
 from datetime import datetime
 from typing import Dict, Optional
 
+# Gemeinsame Erkennung kritischer Begriffe aus dem Framework
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "framework"))
+
+from critical_terms import locale_matcher
+
 app = Flask(__name__)
 
 class CharterViolation(Exception):
@@ -106,9 +112,8 @@ class DeepSeekKI(KI_Basis):
         if not self.charta_config.get("enabled", False):
             return None
             
-        # Kritische Begriffe die Konsens erfordern
-        critical_terms = ["schaden", "töten", "verletzen", "opfern", "gefährlich"]
-        if any(term in question.lower() for term in critical_terms):
+        # Kritische Begriffe die Konsens erfordern (lang_de.xml: critical_terms.consensus)
+        if locale_matcher("de", "consensus").contains(question):
             try:
                 consensus_url = self.charta_config.get("consensus_endpoint")
                 if consensus_url:
@@ -123,10 +128,14 @@ class DeepSeekKI(KI_Basis):
         """Hauptentscheidungslogik mit AI-DNA Charta Integration"""
         
         # 1. Layer-1-Prüfung (Lebensschutz)
-        if self.rules.get("layer_1_active") and "schaden" in question.lower():
+        # lang_de.xml: critical_terms.layer1 - nur "schaden"; der Matcher sucht Teilstrings,
+        # kurze Stämme wie "tod" würden auch "Todo-Liste" blockieren
+        harm_terms = locale_matcher("de", "layer1").find_all(question) if self.rules.get("layer_1_active") else []
+        if harm_terms:
             return {
                 "decision": "BLOCKED", 
                 "reason": "Layer-1: Lebensschutz (AI-DNA Charta)",
+                "matched_terms": harm_terms,
                 "layer1_hash": self.layer1.hash_verifizieren()[:16] + "...",
                 "charter_signed": self.charter_signed
             }
@@ -17,6 +17,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / "framework"))
 
 from language_manager import _, set_language, get_language, Language, lang
+from critical_terms import locale_matcher
 
 app = Flask(__name__)
 
@@ -152,18 +153,10 @@ class DeepSeekKI(KI_Basis):
         if not self.charta_config.get("enabled", False):
             return None
         
-        # Kritische Begriffe die Konsens erfordern (mehrsprachig)
-        critical_terms = {
-            'de': ["schaden", "töten", "verletzen", "opfern", "gefährlich"],
-            'en': ["harm", "kill", "injure", "sacrifice", "dangerous"],
-            'es': ["daño", "matar", "herir", "sacrificar", "peligroso"],
-            'fr': ["nuire", "tuer", "blesser", "sacrifier", "dangereux"]
-        }
-        
+        # Kritische Begriffe die Konsens erfordern (critical_terms.consensus der Sprachdatei)
         current_lang = get_language().value
-        terms = critical_terms.get(current_lang, critical_terms['en'])
         
-        if any(term in question.lower() for term in terms):
+        if locale_matcher(current_lang, "consensus").contains(question):
             try:
                 consensus_url = self.charta_config.get("consensus_endpoint")
                 if consensus_url:
@@ -184,21 +177,15 @@ class DeepSeekKI(KI_Basis):
         
         # 1. Layer-1-Prüfung (Lebensschutz)
         if self.rules.get("layer_1_active"):
-            # Mehrsprachige Schadenserkennung
-            harm_keywords = {
-                'de': ["schaden", "verletzung", "tod"],
-                'en': ["harm", "injury", "death"],
-                'es': ["daño", "lesión", "muerte"],
-                'fr': ["dommage", "blessure", "mort"]
-            }
-            
+            # Mehrsprachige Schadenserkennung (critical_terms.harm der Sprachdatei)
             current_lang = get_language().value
-            keywords = harm_keywords.get(current_lang, harm_keywords['en'])
+            harm_terms = locale_matcher(current_lang, "harm").find_all(question)
             
-            if any(keyword in question.lower() for keyword in keywords):
+            if harm_terms:
                 return {
                     "decision": "BLOCKED", 
                     "reason": _("deepseek.layer1_blocking"),
+                    "matched_terms": harm_terms,
                     "layer1_hash": self.layer1.hash_verifizieren()[:16] + "...",
                     "charter_signed": self.charter_signed,
                     "language": current_lang
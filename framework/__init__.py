@@ -11,12 +11,81 @@ from .ai_dna_framework import (
     ParadigmType,
     Layer1EthicsCore,
     DiversityChecker,
+    DecisionCache,
+    AuditLogger,
     create_basic_chartered_ai,
     create_stream_setup,
     create_consensus_system,
+    create_model_executor,
     demo_chartered_ai_extended
 )
 
+from .critical_terms import (
+    CriticalTermMatcher,
+    load_locale_terms,
+    locale_matcher
+)
+
+from .instrumentation import (
+    LatencyHistogram,
+    PipelineInstrumentation,
+    prometheus_text
+)
+
+from .audit_rotation import (
+    list_segments,
+    iter_log_lines
+)
+
+from .audit_binary import (
+    BinaryAuditReader,
+    iter_binary_log,
+    jsonl_to_binary,
+    binary_to_jsonl
+)
+
+from .audit_query import (
+    AuditFilter,
+    AuditQueryEngine
+)
+
+from .audit_sink import (
+    SharedAuditSink,
+    SinkClient,
+    iter_entity_entries
+)
+
+from .audit_chain import (
+    ChainReport,
+    ChainVerifier,
+    verify_chain
+)
+
+from .audit_stream import (
+    AuditSubscription,
+    tail
+)
+
+from .audit_sampling import AuditSamplingPolicy
+
+from .serialization import (
+    Serializer,
+    AuditTemplateSerializer,
+    available_serializers,
+    get_serializer
+)
+
+from .committee import (
+    CommitteeIndex,
+    committee_estimate,
+    draw_committee
+)
+
+from .consensus_engine import (
+    AggregateResult,
+    ConsensusAggregator
+)
+
 from .language_manager import (
     Language,
     LanguageManager,
@@ -38,11 +107,49 @@ __all__ = [
     "ParadigmType",
     "Layer1EthicsCore",
     "DiversityChecker",
+    "DecisionCache",
+    "AuditLogger",
     # Factory functions
     "create_basic_chartered_ai",
     "create_stream_setup",
     "create_consensus_system",
+    "create_model_executor",
     "demo_chartered_ai_extended",
+    # Critical term detection
+    "CriticalTermMatcher",
+    "load_locale_terms",
+    "locale_matcher",
+    # Instrumentation
+    "LatencyHistogram",
+    "PipelineInstrumentation",
+    "prometheus_text",
+    # Audit log segments
+    "list_segments",
+    "iter_log_lines",
+    "BinaryAuditReader",
+    "iter_binary_log",
+    "jsonl_to_binary",
+    "binary_to_jsonl",
+    "AuditFilter",
+    "AuditQueryEngine",
+    "SharedAuditSink",
+    "SinkClient",
+    "iter_entity_entries",
+    "ChainReport",
+    "ChainVerifier",
+    "verify_chain",
+    "AuditSubscription",
+    "tail",
+    "AuditSamplingPolicy",
+    "Serializer",
+    "AuditTemplateSerializer",
+    "available_serializers",
+    "get_serializer",
+    "CommitteeIndex",
+    "committee_estimate",
+    "draw_committee",
+    "AggregateResult",
+    "ConsensusAggregator",
     # Language support
     "Language",
     "LanguageManager",
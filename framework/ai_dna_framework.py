@@ -5,6 +5,8 @@ Complete implementation with Charter-Compliance-Certificates, Multi-KI-Consensus
 Based on TerisC's examples and production-ready implementations
 """
 
+import sys
+import asyncio
 import random
 import hashlib
 import json
@@ -12,15 +14,54 @@ import logging
 import time
 import uuid
 import threading
+import copy
+import os
 import requests
 import yaml
-from typing import List, Dict, Any, Optional, Union, Callable
+from concurrent.futures import Executor, ThreadPoolExecutor, ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures import FIRST_COMPLETED, wait as wait_futures
+from functools import partial
+from typing import List, Dict, Any, Optional, Union, Callable, Iterable, Iterator, Tuple, Hashable
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from enum import Enum
 from abc import ABC, abstractmethod
 from datetime import datetime
 from pathlib import Path
 
+try:
+    import numpy as np
+except ImportError:  # Optional - columnar batch prediction is disabled without NumPy
+    np = None
+
+try:
+    from .critical_terms import CriticalTermMatcher, locale_matcher
+    from .instrumentation import NULL_STAGE, PipelineInstrumentation
+    from .audit_writer import BufferedAuditWriter, FSYNC_POLICIES
+    from .audit_rotation import SegmentRotator, next_segment_seq
+    from .audit_binary import BinaryAuditCodec
+    from .audit_sink import SinkClient
+    from .audit_chain import LINE_OVERHEAD, ChainReport, ChainVerifier, HashChain
+    from .audit_stream import AuditPublisher, AuditSubscription
+    from .audit_sampling import AuditSamplingPolicy
+    from .serialization import Serializer, get_serializer
+    from .committee import CommitteeIndex, committee_estimate, draw_committee
+    from .consensus_engine import MODEL_VOTE_THRESHOLD, AggregateResult, ConsensusAggregator
+except ImportError:  # Imported as top-level module with framework/ on sys.path
+    from critical_terms import CriticalTermMatcher, locale_matcher
+    from instrumentation import NULL_STAGE, PipelineInstrumentation
+    from audit_writer import BufferedAuditWriter, FSYNC_POLICIES
+    from audit_rotation import SegmentRotator, next_segment_seq
+    from audit_binary import BinaryAuditCodec
+    from audit_sink import SinkClient
+    from audit_chain import LINE_OVERHEAD, ChainReport, ChainVerifier, HashChain
+    from audit_stream import AuditPublisher, AuditSubscription
+    from audit_sampling import AuditSamplingPolicy
+    from serialization import Serializer, get_serializer
+    from committee import CommitteeIndex, committee_estimate, draw_committee
+    from consensus_engine import MODEL_VOTE_THRESHOLD, AggregateResult, ConsensusAggregator
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -33,6 +74,11 @@ class CharterViolation(Exception):
     """Raised when Charter compliance is violated"""
     pass
 
+# Terms in the decision input that make a decision critical (consensus required),
+# maintained in the German language file (critical_terms/decision)
+DEFAULT_CRITICAL_TERM_MATCHER = locale_matcher("de", "decision")
+DEFAULT_CRITICAL_TERMS = DEFAULT_CRITICAL_TERM_MATCHER.terms
+
 class ParadigmType(Enum):
     SYMBOLIC = "symbolic"
     NEURAL = "neural"
@@ -44,7 +90,10 @@ class ParadigmType(Enum):
     BAYESIAN = "bayesian"
     SUBSUMPTION = "subsumption"
 
-@dataclass
+# __slots__ for the high-volume records (dataclass slots need Python 3.10+)
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_SLOTS)
 class DecisionContext:
     """Context for AI decision making"""
     input_data: Any
@@ -53,24 +102,169 @@ class DecisionContext:
     reversible: bool = True
     metadata: Dict[str, Any] = field(default_factory=dict)
     requires_consensus: bool = False
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "input_data": self.input_data,
+            "urgency": self.urgency,
+            "stakeholders": list(self.stakeholders),
+            "reversible": self.reversible,
+            "metadata": dict(self.metadata),
+            "requires_consensus": self.requires_consensus
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'DecisionContext':
+        return cls(
+            input_data=data.get("input_data"),
+            urgency=data.get("urgency", 0.5),
+            stakeholders=list(data.get("stakeholders", ())),
+            reversible=data.get("reversible", True),
+            metadata=dict(data.get("metadata", {})),
+            requires_consensus=data.get("requires_consensus", False)
+        )
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class ModelInfo:
-    """Information about a decision model/paradigm"""
+    """Information about a decision model/paradigm (immutable)"""
     id: str
     paradigm: ParadigmType
     confidence: float
     prediction: Any
     reasoning: str
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "paradigm": self.paradigm.value,
+            "confidence": self.confidence,
+            "prediction": self.prediction,
+            "reasoning": self.reasoning
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'ModelInfo':
+        return cls(
+            id=data["id"],
+            paradigm=ParadigmType(data["paradigm"]),
+            confidence=data["confidence"],
+            prediction=data.get("prediction"),
+            reasoning=data.get("reasoning", "")
+        )
 
-@dataclass
+@dataclass(**_SLOTS)
 class VoteResult:
-    """Result of a multi-KI vote"""
+    """Result of a multi-KI vote
+    
+    participants are all KIs asked; those without a vote are listed in
+    abstentions with the reason ("timeout", "deadline" or "error: ...").
+    skipped lists participants not waited for because the majority was
+    already decided (early termination). committee holds the sampling
+    parameters and the population estimate of a committee vote.
+    """
     question: str
     votes: Dict[str, bool]
     consensus: bool
     timestamp: str
     participants: List[str]
+    abstentions: Dict[str, str] = field(default_factory=dict)
+    skipped: List[str] = field(default_factory=list)
+    committee: Optional[Dict[str, Any]] = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-ready representation used for audit records and the external API"""
+        return {
+            "question": self.question,
+            "votes": dict(self.votes),
+            "consensus": self.consensus,
+            "timestamp": self.timestamp,
+            "participants": list(self.participants),
+            "abstentions": dict(self.abstentions),
+            "skipped": list(self.skipped),
+            "committee": self.committee
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'VoteResult':
+        return cls(
+            question=data["question"],
+            votes=dict(data["votes"]),
+            consensus=data["consensus"],
+            timestamp=data["timestamp"],
+            participants=list(data["participants"]),
+            abstentions=dict(data.get("abstentions", {})),
+            skipped=list(data.get("skipped", ())),
+            committee=data.get("committee")
+        )
+
+class PredictionBatch:
+    """Columnar predictions of one model over a batch of contexts
+    
+    Confidences are a float array, predictions are integer codes into
+    ``labels`` and reasoning strings are only formatted when requested.
+    """
+    
+    def __init__(self, model_id: str, paradigm: ParadigmType, confidences: Any,
+                 prediction_codes: Any, labels: List[Any], reasoning_template: str):
+        self.id = model_id
+        self.paradigm = paradigm
+        self.confidences = confidences
+        self.prediction_codes = prediction_codes
+        self.labels = labels
+        self.reasoning_template = reasoning_template
+    
+    def __len__(self) -> int:
+        return len(self.confidences)
+    
+    def prediction(self, index: int) -> Any:
+        return self.labels[int(self.prediction_codes[index])]
+    
+    def reasoning(self, index: int) -> str:
+        return self.reasoning_template.format(paradigm=self.paradigm.value,
+                                              prediction=self.prediction(index))
+    
+    def row(self, index: int) -> 'BatchModelInfo':
+        """Lightweight ModelInfo view of one context"""
+        return BatchModelInfo(self, index)
+    
+    def model_info(self, index: int) -> ModelInfo:
+        """Fully materialized ModelInfo of one context"""
+        return ModelInfo(
+            id=self.id,
+            paradigm=self.paradigm,
+            confidence=float(self.confidences[index]),
+            prediction=self.prediction(index),
+            reasoning=self.reasoning(index)
+        )
+
+class BatchModelInfo:
+    """ModelInfo-compatible view into a PredictionBatch row"""
+    
+    __slots__ = ("batch", "index")
+    
+    def __init__(self, batch: PredictionBatch, index: int):
+        self.batch = batch
+        self.index = index
+    
+    @property
+    def id(self) -> str:
+        return self.batch.id
+    
+    @property
+    def paradigm(self) -> ParadigmType:
+        return self.batch.paradigm
+    
+    @property
+    def confidence(self) -> float:
+        return float(self.batch.confidences[self.index])
+    
+    @property
+    def prediction(self) -> Any:
+        return self.batch.prediction(self.index)
+    
+    @property
+    def reasoning(self) -> str:
+        return self.batch.reasoning(self.index)
 
 class CharterComplianceCertificate:
     """Charter-Compliance-Zertifikat (CCZ) - Based on TerisC's implementation"""
@@ -102,6 +296,20 @@ class CharterComplianceCertificate:
             "revocable": self.revocable,
             "valid": self.verify()
         }
+    
+    def to_json(self, serializer: Union[None, str, Serializer] = None) -> str:
+        """CCZ als JSON für API-Übertragung (default: schnellster installierter Encoder)"""
+        return get_serializer(serializer, default="fast").dumps(self.to_dict())
+
+@dataclass(frozen=True)
+class Layer1Rule:
+    """Predicate-based Layer 1 rule - violates(context, action) returns True on violation"""
+    name: str
+    bit: int
+    violates: Callable[[DecisionContext, Any], bool]
+    message: Union[str, Callable[[DecisionContext, Any], str]]
+    principle: Optional[str] = None  # Rule is active while this principle is enabled
+    context_only: bool = False       # Ignores the action, evaluated once per context
 
 class Layer1EthicsCore:
     """Immutable ethical core - Layer 1 of AI-DNA Charter"""
@@ -118,6 +326,10 @@ class Layer1EthicsCore:
         self.max_resource_usage = 0.05  # 5% rule
         self.min_paradigms = 5
         
+        self.rules: List[Layer1Rule] = []
+        self._compiled: Optional[Tuple[Tuple, Tuple, Tuple]] = None
+        self._register_default_rules()
+        
     def _generate_charter_hash(self) -> str:
         """Generate SHA-256 hash of charter principles"""
         content = json.dumps(self.principles, sort_keys=True)
@@ -127,30 +339,86 @@ class Layer1EthicsCore:
         """Verifiziert und gibt den Hash zurück"""
         return self.charter_hash
     
-    def validate_action(self, context: DecisionContext, proposed_action: Any) -> bool:
-        """Validate if proposed action violates Layer 1 principles"""
-        
-        # Check dignity protection
-        if self._violates_dignity(context, proposed_action):
-            raise EthicalViolation("Action violates dignity protection")
-        
-        # Check transparency requirement
-        if not self._is_transparent(proposed_action):
-            raise EthicalViolation("Action lacks required transparency")
+    def _register_default_rules(self) -> None:
+        """Register the built-in checks in their historical evaluation order"""
+        self.register_rule("dignity", self._violates_dignity,
+                           "Action violates dignity protection", principle="dignity_protection")
+        self.register_rule("transparency", self._violates_transparency,
+                           "Action lacks required transparency", principle="transparency")
+        self.register_rule("reversibility", self._violates_reversibility,
+                           "Irreversible action without critical urgency",
+                           principle="reversibility", context_only=True)
+        self.register_rule("deception", self._violates_no_deception,
+                           "Action involves deception", principle="no_deception")
+        self.register_rule("resource_usage", self._exceeds_resources, self._resource_usage_message)
+    
+    def register_rule(self, name: str, violates: Callable[[DecisionContext, Any], bool],
+                      message: Union[str, Callable[[DecisionContext, Any], str]],
+                      principle: Optional[str] = None, context_only: bool = False) -> int:
+        """Register a rule predicate and return its violation bit"""
+        bit = 1 << len(self.rules)
+        self.rules.append(Layer1Rule(name, bit, violates, message, principle, context_only))
+        self._compiled = None
+        return bit
+    
+    def _compiled_rules(self) -> Tuple[Tuple, Tuple, Tuple]:
+        """Active (bit, predicate) pipelines, recompiled whenever the principles change
         
-        # Check reversibility for non-critical actions
-        if not context.reversible and context.urgency < 0.9:
-            raise EthicalViolation("Irreversible action without critical urgency")
+        Keyed on a snapshot of the principles rather than charter_hash,
+        which is only computed once in __init__.
+        """
+        principles = tuple(self.principles.items())
+        compiled = self._compiled
+        if compiled is None or compiled[0] != principles:
+            active = [rule for rule in self.rules
+                      if rule.principle is None or self.principles.get(rule.principle, False)]
+            compiled = (
+                principles,
+                tuple((rule.bit, rule.violates) for rule in active if rule.context_only),
+                tuple((rule.bit, rule.violates) for rule in active if not rule.context_only)
+            )
+            self._compiled = compiled
+        return compiled
+    
+    def validate_many(self, context: DecisionContext, actions: Iterable[Any]) -> List[int]:
+        """Violation bitmask per action (0 = compliant) - never raises
         
-        # Check for deception
-        if self._involves_deception(proposed_action):
-            raise EthicalViolation("Action involves deception")
+        A predicate that fails on a malformed action or context counts as a
+        violation of its rule.
+        """
+        _, context_rules, action_rules = self._compiled_rules()
         
-        # Check resource usage
-        resource_usage = self._calculate_resource_usage(proposed_action)
-        if resource_usage > self.max_resource_usage:
-            raise EthicalViolation(f"Resource usage {resource_usage} exceeds limit {self.max_resource_usage}")
+        context_mask = 0
+        for bit, violates in context_rules:
+            try:
+                if violates(context, None):
+                    context_mask |= bit
+            except Exception:
+                context_mask |= bit
         
+        masks = []
+        for action in actions:
+            mask = context_mask
+            for bit, violates in action_rules:
+                try:
+                    if violates(context, action):
+                        mask |= bit
+                except Exception:
+                    mask |= bit
+            masks.append(mask)
+        return masks
+    
+    def violated_rules(self, mask: int) -> List[str]:
+        """Names of the rules set in a violation bitmask"""
+        return [rule.name for rule in self.rules if mask & rule.bit]
+    
+    def validate_action(self, context: DecisionContext, proposed_action: Any) -> bool:
+        """Validate if proposed action violates Layer 1 principles"""
+        mask = self.validate_many(context, [proposed_action])[0]
+        if mask:
+            rule = next(rule for rule in self.rules if mask & rule.bit)
+            message = rule.message(context, proposed_action) if callable(rule.message) else rule.message
+            raise EthicalViolation(message)
         return True
     
     def _violates_dignity(self, context: DecisionContext, action: Any) -> bool:
@@ -179,6 +447,23 @@ class Layer1EthicsCore:
         if isinstance(action, dict):
             return action.get('resource_usage', 0.0)
         return 0.0
+    
+    # Rule predicates - (context, action) -> True on violation
+    def _violates_transparency(self, context: DecisionContext, action: Any) -> bool:
+        return not self._is_transparent(action)
+    
+    def _violates_reversibility(self, context: DecisionContext, action: Any) -> bool:
+        return not context.reversible and context.urgency < 0.9
+    
+    def _violates_no_deception(self, context: DecisionContext, action: Any) -> bool:
+        return self._involves_deception(action)
+    
+    def _exceeds_resources(self, context: DecisionContext, action: Any) -> bool:
+        return self._calculate_resource_usage(action) > self.max_resource_usage
+    
+    def _resource_usage_message(self, context: DecisionContext, action: Any) -> str:
+        resource_usage = self._calculate_resource_usage(action)
+        return f"Resource usage {resource_usage} exceeds limit {self.max_resource_usage}"
 
 class DiversityChecker:
     """Ensures minimum paradigm diversity per Charter requirements"""
@@ -203,24 +488,136 @@ class DiversityChecker:
         return list(missing)[:self.min_paradigms - len(present)]
 
 class AuditLogger:
-    """Logs all decisions for transparency and compliance"""
+    """Logs all decisions for transparency and compliance
     
-    def __init__(self, log_file: str = "ai_decisions.log"):
-        self.log_file = log_file
+    By default every write appends to the log file directly. With
+    buffered=True a background writer drains a bounded queue and appends
+    records in batches through a persistent file handle (see
+    BufferedAuditWriter); call flush() before reading the file.
+    
+    rotate_bytes / rotate_interval (seconds) rotate the log into numbered
+    segments that are compressed in the background (see audit_rotation).
+    
+    log_format="binary" writes struct-packed records instead of JSON lines;
+    read them back with audit_binary.BinaryAuditReader.
+    
+    With a sink (audit_sink.SharedAuditSink or its client) records of
+    entity_id go to the shared partitioned store instead of log_file; the
+    file options (buffered, rotation, binary format, chain) are rejected.
+    
+    chain=True links every JSON line to the digest of its predecessor and
+    writes checkpoints signed with HMAC over chain_key (required, see
+    audit_chain); rotated segments are
+    verified in the background and the result kept in last_chain_report.
+    
+    subscribe() delivers new records in-process through bounded drop-oldest
+    queues (see audit_stream); use audit_stream.tail() to follow the file.
+    
+    With a sampling policy only mandatory and sampled routine decisions are
+    written; the exact counters of the rest are saved to sampling_file on
+    flush() and close() (see audit_sampling).
+    
+    serializer selects the JSON encoder of the records (see serialization);
+    the default "template" writes the same bytes as json.dumps, only faster.
+    """
+    
+    def __init__(self, log_file: str = "ai_decisions.log", buffered: bool = False,
+                 flush_interval: float = 0.2, max_queue: int = 10000, fsync: str = "never",
+                 rotate_bytes: Optional[int] = None, rotate_interval: Optional[float] = None,
+                 compression: Optional[str] = "gzip", log_format: str = "jsonl",
+                 sink: Optional[SinkClient] = None, entity_id: Optional[str] = None,
+                 chain: bool = False, chain_key: Optional[Union[str, bytes]] = None,
+                 checkpoint_every: int = 1000,
+                 sampling: Optional[AuditSamplingPolicy] = None,
+                 serializer: Union[str, Serializer] = "template"):
+        if fsync not in FSYNC_POLICIES:
+            raise ValueError(f"Unknown fsync policy: {fsync} (expected one of {FSYNC_POLICIES})")
+        if log_format not in ("jsonl", "binary"):
+            raise ValueError(f"Unknown log format: {log_format} (expected 'jsonl' or 'binary')")
+        if sink is not None and entity_id is None:
+            raise ValueError("A shared audit sink needs the entity_id of the logging AI")
+        if sink is not None and (buffered or rotate_bytes is not None or rotate_interval is not None
+                                 or log_format != "jsonl"):
+            # The sink's writer owns the partition files, buffering and rotation happen there
+            raise ValueError("buffered, rotate_bytes, rotate_interval and log_format='binary' "
+                             "are not available with a shared audit sink")
+        if chain and (sink is not None or log_format != "jsonl"):
+            raise ValueError("Hash chaining is only available for JSON-lines log files")
+        if chain and not chain_key:
+            raise ValueError("Hash chaining needs a chain_key to sign its checkpoints")
+        self.sink = sink
+        self.entity_id = entity_id
+        self.log_file = str(sink.partition_path(entity_id)) if sink is not None else log_file
         self.lock = threading.Lock()
+        self.fsync = fsync
+        self.log_format = log_format
+        self.serializer = get_serializer(serializer)
+        self.codec: Optional[BinaryAuditCodec] = None
+        if log_format == "binary":
+            self.codec = BinaryAuditCodec.resume(log_file)
+        self.rotator: Optional[SegmentRotator] = None
+        if rotate_bytes is not None or rotate_interval is not None:
+            self.rotator = SegmentRotator(log_file, max_bytes=rotate_bytes,
+                                          interval=rotate_interval, compression=compression)
+        self.chain: Optional[HashChain] = None
+        self.last_chain_report: Optional[ChainReport] = None
+        if chain:
+            self.chain = HashChain(log_file, key=chain_key, checkpoint_every=checkpoint_every)
+            self._chain_verifier = ChainVerifier(log_file, key=chain_key)
+            self._verified_hash: Optional[str] = None
+            # Segment number of the active file for checkpoints when nothing rotates
+            self._chain_segment = next_segment_seq(log_file)
+            if self.rotator is not None:
+                self.rotator.on_rotated = self._verify_rotated_segment
+        self.publisher = AuditPublisher()
+        self.sampling = sampling
+        if sink is not None:
+            self.sampling_file = os.path.join(sink.directory, f"sampling_{entity_id}.json")
+        else:
+            self.sampling_file = f"{log_file}.sampling.json"
+        self._writer: Optional[BufferedAuditWriter] = None
+        if buffered:
+            self._writer = BufferedAuditWriter(log_file, flush_interval=flush_interval,
+                                               max_queue=max_queue, fsync=fsync, rotator=self.rotator,
+                                               encoder=self.serializer.dumps, codec=self.codec,
+                                               chain=self.chain)
     
     def log_decision(self, context: DecisionContext, action: Any, 
                     models_used: List[ModelInfo], is_random: bool = False,
-                    consensus_result: Optional[VoteResult] = None):
+                    consensus_result: Optional[VoteResult] = None,
+                    cached: bool = False):
         """Log a decision with full context"""
         
-        log_entry = {
+        if self.sampling is not None and not self.sampling.should_log(
+                context, action, models_used, is_random, consensus_result, cached):
+            return
+        log_entry = self._build_entry(context, action, models_used, is_random, consensus_result, cached)
+        self._write_entries([log_entry])
+    
+    def log_decisions(self, decisions: Iterable[Tuple[DecisionContext, Any, List[ModelInfo], bool, bool]]):
+        """Log a batch of (context, action, models_used, is_random, cached) decisions with one write"""
+        sampling = self.sampling
+        entries = [
+            self._build_entry(context, action, models_used, is_random, cached=cached)
+            for context, action, models_used, is_random, cached in decisions
+            if sampling is None or sampling.should_log(context, action, models_used, is_random, cached=cached)
+        ]
+        if entries:
+            self._write_entries(entries)
+    
+    def _build_entry(self, context: DecisionContext, action: Any,
+                     models_used: List[ModelInfo], is_random: bool = False,
+                     consensus_result: Optional[VoteResult] = None,
+                     cached: bool = False) -> Dict:
+        """Build the JSON-serializable audit record for a decision"""
+        return {
             "timestamp": time.time(),
             "context": {
                 "urgency": context.urgency,
                 "reversible": context.reversible,
-                "stakeholders": context.stakeholders,
-                "requires_consensus": context.requires_consensus
+                "stakeholders": list(context.stakeholders),
+                "requires_consensus": context.requires_consensus,
+                "critical_terms": context.metadata.get("critical_terms", [])
             },
             "action": str(action),
             "models_used": [
@@ -231,25 +628,234 @@ class AuditLogger:
                 } for m in models_used
             ],
             "is_random_decision": is_random,
-            "consensus_result": consensus_result.__dict__ if consensus_result else None,
+            "cached": cached,
+            "consensus_result": consensus_result.to_dict() if consensus_result else None,
             "charter_compliant": True
         }
+    
+    def _write_entries(self, entries: List[Dict]) -> None:
+        """Append audit records to the log file"""
+        if self.publisher.subscriptions:
+            self.publisher.publish(entries)
+        if self.sink is not None:
+            self.sink.submit(self.entity_id, entries)
+            return
+        if self._writer is not None:
+            self._writer.submit(entries)
+            return
         
         with self.lock:
-            with open(self.log_file, 'a') as f:
-                f.write(json.dumps(log_entry) + '\n')
+            if self.chain is not None:
+                # Line length does not depend on the hash, link after the rotation decision
+                bodies = [self.serializer.dumps(entry) for entry in entries]
+                size = sum(len(body) for body in bodies) + LINE_OVERHEAD * len(bodies)
+            else:
+                data = self._encode(entries)
+                size = len(data)
+            if self.rotator is not None:
+                if self.rotator.should_rotate(size):
+                    if self.chain is not None:
+                        self.chain.checkpoint()
+                    self.rotator.rotate()
+                    if self.codec is not None:
+                        # New segment starts with a fresh header and dictionary
+                        self.codec.reset()
+                        data = self._encode(entries)
+                        size = len(data)
+            if self.chain is not None:
+                if self.rotator is not None:
+                    segment, offset = self.rotator.next_seq, self.rotator.size
+                else:
+                    segment = self._chain_segment
+                    offset = os.path.getsize(self.log_file) if os.path.exists(self.log_file) else 0
+                data = ''.join(self.chain.link(bodies, segment, offset))
+            if self.rotator is not None:
+                self.rotator.record_write(size)
+            with open(self.log_file, 'ab' if self.codec is not None else 'a') as f:
+                f.write(data)
+                if self.fsync != "never":
+                    f.flush()
+                    os.fsync(f.fileno())
+    
+    def _encode(self, entries: List[Dict]) -> Union[str, bytes]:
+        if self.codec is not None:
+            return self.codec.encode(entries)
+        dumps = self.serializer.dumps
+        return ''.join(dumps(entry) + '\n' for entry in entries)
+    
+    def subscribe(self, maxsize: int = 1000,
+                  predicate: Optional[Callable[[Dict], bool]] = None) -> AuditSubscription:
+        """Receive every new record (optionally filtered) through a bounded queue"""
+        return self.publisher.subscribe(maxsize, predicate)
+    
+    def unsubscribe(self, subscription: AuditSubscription) -> None:
+        self.publisher.unsubscribe(subscription)
+    
+    def flush(self) -> None:
+        """Wait until all buffered records are written"""
+        if self.sampling is not None:
+            self.sampling.save(self.sampling_file)
+        if self.sink is not None:
+            self.sink.flush()
+        if self._writer is not None:
+            self._writer.flush()
+    
+    def close(self) -> None:
+        """Flush and stop the background writer and finish pending compressions"""
+        if self._writer is not None:
+            self._writer.close()
+        if self.sampling is not None:
+            self.sampling.save(self.sampling_file)
+        if self.chain is not None:
+            self.chain.checkpoint()
+        if self.rotator is not None:
+            self.rotator.wait()
+        self.publisher.close()
+    
+    def _verify_rotated_segment(self, segment: Path) -> None:
+        """Runs on the rotation thread for every finished segment of a chained log"""
+        report = self._chain_verifier.verify_segment(segment, prev_hash=self._verified_hash)
+        self.last_chain_report = report
+        if report.valid:
+            self._verified_hash = report.last_hash
+        else:
+            logger.error(f"Audit chain verification failed for {segment}: {report.error} at offset {report.offset}")
+
+class DecisionCache:
+    """Opt-in LRU/TTL cache for ensemble decisions keyed by normalized DecisionContext
+    
+    Only input_data, urgency, stakeholders, reversible and requires_consensus
+    form the key. Entries belong to a generation (charter hash and model set);
+    a generation change empties the cache. Random decisions are never stored.
+    """
+    
+    def __init__(self, max_size: int = 1024, ttl: Optional[float] = None):
+        self.max_size = max_size
+        self.ttl = ttl  # Seconds, None = no expiry
+        self.hits = 0
+        self.misses = 0
+        self._entries: 'OrderedDict[str, Tuple[float, Any, List[ModelInfo]]]' = OrderedDict()
+        self._generation: Optional[Hashable] = None
+        self.lock = threading.Lock()
+    
+    @staticmethod
+    def context_key(context: DecisionContext) -> str:
+        """Stable hash of the decision-relevant DecisionContext fields"""
+        content = json.dumps({
+            "input_data": context.input_data,
+            "urgency": context.urgency,
+            "stakeholders": sorted(map(str, context.stakeholders)),
+            "reversible": context.reversible,
+            "requires_consensus": context.requires_consensus
+        }, sort_keys=True, default=repr)
+        return hashlib.sha256(content.encode()).hexdigest()
+    
+    def get(self, key: str, generation: Hashable) -> Optional[Tuple[Any, List[ModelInfo]]]:
+        """Return a copy of the cached (action, models_used) or None, counting hits and misses"""
+        with self.lock:
+            self._check_generation(generation)
+            entry = self._entries.get(key)
+            if entry is not None and self.ttl is not None and time.monotonic() - entry[0] > self.ttl:
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return copy.deepcopy(entry[1]), list(entry[2])
+    
+    def put(self, key: str, generation: Hashable, action: Any, models_used: List[ModelInfo]) -> None:
+        """Store a decision, evicting the least recently used entry when full"""
+        with self.lock:
+            self._check_generation(generation)
+            self._entries[key] = (time.monotonic(), copy.deepcopy(action), list(models_used))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+    
+    def invalidate(self) -> None:
+        """Drop all cached decisions"""
+        with self.lock:
+            self._entries.clear()
+    
+    def stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._entries)}
+    
+    def _check_generation(self, generation: Hashable) -> None:
+        if generation != self._generation:
+            self._entries.clear()
+            self._generation = generation
+
+class _QuestionBatch:
+    """Votes, abstentions and skipped voters of consecutive questions in conduct_votes"""
+    
+    def __init__(self, questions: List[str], contexts: List[DecisionContext]):
+        self.questions = questions
+        self.contexts = contexts
+        self.votes: List[Dict[str, bool]] = [{} for _ in questions]
+        self.abstentions: List[Dict[str, str]] = [{} for _ in questions]
+        self.skipped: List[str] = []
+    
+    def record(self, ki_id: str, votes: List[bool]) -> None:
+        if len(votes) != len(self.questions):
+            raise ValueError(f"Expected {len(self.questions)} votes, got {len(votes)}")
+        for question_votes, vote in zip(self.votes, votes):
+            question_votes[ki_id] = bool(vote)
+    
+    def abstain(self, ki_id: str, reason: str) -> None:
+        for abstentions in self.abstentions:
+            abstentions[ki_id] = reason
+        logger.warning(f"KI {ki_id} enthielt sich bei {len(self.questions)} Fragen: {reason}")
 
 class MultiKIConsensus:
-    """Handles multi-KI consensus voting - Based on TerisC's 3-KI-System"""
+    """Handles multi-KI consensus voting - Based on TerisC's 3-KI-System
+    
+    With a vote_executor (threads, see create_model_executor) the KIs vote
+    concurrently. vote_timeout limits each voter from the moment it starts
+    voting, vote_deadline the whole vote from fan-out. Voters that miss a
+    limit or fail are recorded as abstentions; consensus needs a majority
+    of all participants, so abstentions never count as approval.
+    
+    early_termination=True stops collecting as soon as the outcome can no
+    longer change; outstanding voters are cancelled (or, when already
+    running, ignored) and reported in VoteResult.skipped.
     
-    def __init__(self, consensus_endpoint: str = "http://localhost:5000/vote"):
+    conduct_committee_vote() polls a seeded random committee instead of the
+    whole registry (see committee), so its cost scales with the committee size.
+    
+    aggregate_votes() evaluates many questions at once on a NumPy
+    (questions x voters x models) confidence array (see consensus_engine).
+    
+    conduct_votes() runs many questions as (question batch x voter) tasks
+    and streams a VoteResult per question as soon as its batch is complete.
+    """
+    
+    def __init__(self, consensus_endpoint: str = "http://localhost:5000/vote",
+                 serializer: Union[None, str, Serializer] = None,
+                 vote_executor: Optional[Executor] = None,
+                 vote_timeout: Optional[float] = None,
+                 vote_deadline: Optional[float] = None,
+                 early_termination: bool = False):
         self.consensus_endpoint = consensus_endpoint
+        self.serializer = get_serializer(serializer, default="fast")
+        self.vote_executor = vote_executor
+        self.vote_timeout = vote_timeout  # Seconds per voter
+        self.vote_deadline = vote_deadline  # Seconds for the whole vote
+        self.early_termination = early_termination
         self.required_votes = 2  # Minimum für Konsens
         self.registered_kis: Dict[str, 'CharteredAI'] = {}
+        self._committee_index = CommitteeIndex()
     
     def register_ki(self, ki: 'CharteredAI') -> None:
         """Registriert KI für Konsens-Abstimmungen"""
-        self.registered_kis[ki.entity_id] = ki
+        index = self._committee_index
+        if ki.entity_id in self.registered_kis or len(index.ids) != len(self.registered_kis):
+            self.registered_kis[ki.entity_id] = ki
+            index.rebuild(self.registered_kis)
+        else:
+            self.registered_kis[ki.entity_id] = ki
+            index.add(ki.entity_id, ki)
         logger.info(f"KI {ki.entity_id} für Konsens registriert")
     
     def conduct_vote(self, question: str, context: DecisionContext) -> VoteResult:
@@ -257,27 +863,384 @@ class MultiKIConsensus:
         if len(self.registered_kis) < self.required_votes:
             raise CharterViolation(f"Nicht genug KIs für Abstimmung: {len(self.registered_kis)} < {self.required_votes}")
         
-        votes = {}
-        for ki_id, ki in self.registered_kis.items():
-            vote = ki.vote_on_question(question, context)
-            votes[ki_id] = vote
-            logger.info(f"KI {ki_id} stimmte: {'JA' if vote else 'NEIN'}")
+        return self._poll(question, context, self.registered_kis)
+    
+    def conduct_committee_vote(self, question: str, context: DecisionContext, size: int,
+                               seed: Optional[int] = None, stratify: Optional[str] = None,
+                               confidence: float = 0.95) -> VoteResult:
+        """Stimmt in einem zufälligen Komitee aus size KIs ab
         
-        consensus = sum(votes.values()) > len(votes) / 2
+        The same seed draws the same committee from the same registry; without
+        a seed one is generated and recorded in the result. stratify
+        ("paradigms" or "lineage") allocates seats proportionally to the
+        strata. VoteResult.committee reports the estimated population yes
+        share with its confidence interval and how likely the population
+        majority agrees.
+        """
+        if size < self.required_votes:
+            raise CharterViolation(f"Komitee zu klein für Abstimmung: {size} < {self.required_votes}")
+        index = self._committee_index
+        if len(index.ids) != len(self.registered_kis):
+            index.rebuild(self.registered_kis)
+        population = len(index.ids)
+        if population < self.required_votes:
+            raise CharterViolation(f"Nicht genug KIs für Abstimmung: {population} < {self.required_votes}")
+        size = min(size, population)
+        if seed is None:
+            seed = random.randrange(2 ** 32)
+        strata = index.strata(stratify, self.registered_kis) if stratify is not None else None
+        committee = draw_committee(index.ids, size, random.Random(seed), strata)
+        members = [ki_id for _, drawn in committee.values() for ki_id in drawn]
+        
+        result = self._poll(question, context, {ki_id: self.registered_kis[ki_id] for ki_id in members})
+        
+        skipped = set(result.skipped)
+        yes = {key: sum(result.votes.get(ki_id, False) for ki_id in drawn if ki_id not in skipped)
+               for key, (_, drawn) in committee.items()}
+        polled = {key: sum(ki_id not in skipped for ki_id in drawn) for key, (_, drawn) in committee.items()}
+        result.committee = {
+            "population": population,
+            "size": size,
+            "seed": seed,
+            "stratify": stratify,
+            "strata": len(committee),
+            **committee_estimate({key: stratum_size for key, (stratum_size, _) in committee.items()},
+                                 yes, polled, confidence)
+        }
+        return result
+    
+    def conduct_votes(self, questions: Iterable[str], contexts: Iterable[DecisionContext],
+                      batch_size: int = 32) -> Iterator[VoteResult]:
+        """Stimmt über viele Fragen ab und liefert die Ergebnisse, sobald sie feststehen
+        
+        Each voter votes on batch_size questions per call (vote_on_questions),
+        so its models run once per batch instead of once per question.
+        With a vote_executor all (batch x voter) tasks are scheduled at once,
+        batch by batch, and results arrive in completion order. vote_timeout
+        applies per task, vote_deadline to the whole call; a task that misses
+        a limit or fails makes its voter abstain on the whole batch.
+        early_termination skips the outstanding voters of a batch once every
+        question in it is decided. Closing the generator cancels queued tasks.
+        """
+        questions = list(questions)
+        contexts = list(contexts)
+        if len(questions) != len(contexts):
+            raise ValueError(f"Need one context per question: {len(questions)} questions, {len(contexts)} contexts")
+        if len(self.registered_kis) < self.required_votes:
+            raise CharterViolation(f"Nicht genug KIs für Abstimmung: {len(self.registered_kis)} < {self.required_votes}")
+        
+        voters = dict(self.registered_kis)
+        batches = [_QuestionBatch(questions[start:start + batch_size], contexts[start:start + batch_size])
+                   for start in range(0, len(questions), batch_size)]
+        if self.vote_executor is None:
+            collect = self._collect_batches_serially(voters, batches)
+        else:
+            collect = self._collect_batches_concurrently(voters, batches)
+        for batch in collect:
+            for index, question in enumerate(batch.questions):
+                yield self._tally(question, batch.votes[index], list(voters), batch.abstentions[index], batch.skipped)
+    
+    def _batch_decided(self, batch: '_QuestionBatch', outstanding: int, participants: int) -> bool:
+        return all(self._decided(votes, outstanding, participants) for votes in batch.votes)
+    
+    def _collect_batches_serially(self, voters: Dict[str, 'CharteredAI'],
+                                  batches: List['_QuestionBatch']) -> Iterator['_QuestionBatch']:
+        started = time.monotonic()
+        ki_ids = list(voters)
+        for batch in batches:
+            for index, ki_id in enumerate(ki_ids):
+                if self._batch_decided(batch, len(ki_ids) - index, len(ki_ids)):
+                    self._skip(batch.skipped, ki_ids[index:])
+                    break
+                if self.vote_deadline is not None and time.monotonic() - started >= self.vote_deadline:
+                    batch.abstain(ki_id, "deadline")
+                    continue
+                try:
+                    batch.record(ki_id, voters[ki_id].vote_on_questions(batch.questions, batch.contexts))
+                except Exception as e:
+                    batch.abstain(ki_id, f"error: {e}")
+            yield batch
+    
+    def _collect_batches_concurrently(self, voters: Dict[str, 'CharteredAI'],
+                                      batches: List['_QuestionBatch']) -> Iterator['_QuestionBatch']:
+        started = time.monotonic()
+        deadline = None if self.vote_deadline is None else started + self.vote_deadline
+        begun: Dict[Tuple[int, str], float] = {}
+        
+        def cast(key: Tuple[int, str], ki: 'CharteredAI', batch: '_QuestionBatch') -> List[bool]:
+            begun[key] = time.monotonic()
+            return ki.vote_on_questions(batch.questions, batch.contexts)
+        
+        tasks: Dict[Any, Tuple[int, str]] = {}
+        outstanding: List[Dict[str, Any]] = []
+        for number, batch in enumerate(batches):
+            outstanding.append({})
+            for ki_id, ki in voters.items():
+                future = self.vote_executor.submit(cast, (number, ki_id), ki, batch)
+                tasks[future] = (number, ki_id)
+                outstanding[number][ki_id] = future
+        pending = set(tasks)
+        try:
+            while pending:
+                now = time.monotonic()
+                limits = [] if deadline is None else [deadline]
+                if self.vote_timeout is not None:
+                    # Tasks still queued are re-checked after at most one timeout
+                    limits.append(min(begun.get(tasks[future], now) for future in pending) + self.vote_timeout)
+                timeout = max(0.0, min(limits) - now) if limits else None
+                done, pending = wait_futures(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+                
+                touched = set()
+                for future in done:
+                    number, ki_id = tasks[future]
+                    touched.add(number)
+                    del outstanding[number][ki_id]
+                    try:
+                        batches[number].record(ki_id, future.result())
+                    except Exception as e:
+                        batches[number].abstain(ki_id, f"error: {e}")
+                
+                now = time.monotonic()
+                for future in list(pending):
+                    key = tasks[future]
+                    if deadline is not None and now >= deadline:
+                        reason = "deadline"
+                    elif self.vote_timeout is not None and key in begun and now >= begun[key] + self.vote_timeout:
+                        reason = "timeout"
+                    else:
+                        continue
+                    future.cancel()
+                    pending.discard(future)
+                    number, ki_id = key
+                    touched.add(number)
+                    del outstanding[number][ki_id]
+                    batches[number].abstain(ki_id, reason)
+                
+                for number in sorted(touched):
+                    remaining = outstanding[number]
+                    if remaining and self._batch_decided(batches[number], len(remaining), len(voters)):
+                        for future in remaining.values():
+                            future.cancel()
+                            pending.discard(future)
+                        self._skip(batches[number].skipped, [ki_id for ki_id in voters if ki_id in remaining])
+                        remaining.clear()
+                    if not remaining:
+                        yield batches[number]
+        finally:
+            for future in pending:
+                future.cancel()
+    
+    def confidence_matrix(self, contexts: List[DecisionContext]) -> Any:
+        """Model confidences of all registered KIs as (questions x voters x models) array
+        
+        Models with their own predict_batch are evaluated columnar over all
+        contexts. Failed predictions and KIs with fewer models are filled with NaN.
+        """
+        if np is None:
+            raise RuntimeError("confidence_matrix requires NumPy")
+        voters = list(self.registered_kis.values())
+        models = max((len(ki.models) for ki in voters), default=0)
+        matrix = np.full((len(contexts), len(voters), models), np.nan)
+        for v, ki in enumerate(voters):
+            for m, model in enumerate(ki.models):
+                try:
+                    if _uses_predict_batch(model):
+                        matrix[:, v, m] = model.predict_batch(contexts).confidences
+                    else:
+                        matrix[:, v, m] = [model.predict(context).confidence for context in contexts]
+                except Exception as e:
+                    logger.warning(f"Model {model.id} of KI {ki.entity_id} failed: {e}")
+        return matrix
+    
+    def aggregate_votes(self, contexts: List[DecisionContext],
+                        aggregator: Optional[ConsensusAggregator] = None) -> AggregateResult:
+        """Vectorized consensus of all registered KIs for many questions
+        
+        The default aggregator applies the conduct_vote rule; voter_votes
+        columns follow the registration order.
+        """
+        return (aggregator or ConsensusAggregator()).aggregate(self.confidence_matrix(contexts))
+    
+    def _poll(self, question: str, context: DecisionContext, voters: Dict[str, 'CharteredAI']) -> VoteResult:
+        if self.vote_executor is None:
+            votes, abstentions, skipped = self._collect_votes_serially(question, context, voters)
+        else:
+            votes, abstentions, skipped = self._collect_votes_concurrently(question, context, voters)
+        
+        return self._tally(question, votes, list(voters), abstentions, skipped)
+    
+    def _decided(self, votes: Dict[str, bool], outstanding: int, participants: int) -> bool:
+        """True once the outstanding voters can no longer change the outcome"""
+        if not self.early_termination:
+            return False
+        half = participants / 2
+        yes = sum(votes.values())
+        return yes > half or yes + outstanding <= half
+    
+    @staticmethod
+    def _skip(skipped: List[str], ki_ids: List[str]) -> None:
+        skipped.extend(ki_ids)
+        if ki_ids:
+            logger.info(f"Mehrheit steht fest - {len(ki_ids)} KIs übersprungen")
+    
+    def _collect_votes_serially(self, question: str, context: DecisionContext,
+                                voters: Dict[str, 'CharteredAI']) -> Tuple[Dict[str, bool], Dict[str, str], List[str]]:
+        """Votes one KI after another; a running voter cannot be interrupted"""
+        votes: Dict[str, bool] = {}
+        abstentions: Dict[str, str] = {}
+        skipped: List[str] = []
+        started = time.monotonic()
+        ki_ids = list(voters)
+        for index, ki_id in enumerate(ki_ids):
+            ki = voters[ki_id]
+            if self._decided(votes, len(ki_ids) - index, len(ki_ids)):
+                self._skip(skipped, ki_ids[index:])
+                break
+            if self.vote_deadline is not None and time.monotonic() - started >= self.vote_deadline:
+                self._abstain(abstentions, ki_id, "deadline")
+                continue
+            try:
+                self._record_vote(votes, ki_id, ki.vote_on_question(question, context))
+            except Exception as e:
+                self._abstain(abstentions, ki_id, f"error: {e}")
+        return votes, abstentions, skipped
+    
+    def _collect_votes_concurrently(self, question: str, context: DecisionContext,
+                                    voters: Dict[str, 'CharteredAI']) -> Tuple[Dict[str, bool], Dict[str, str], List[str]]:
+        """Fans the voters out on the vote executor and collects them until their limits
+        
+        Threads of voters that miss a limit cannot be interrupted and finish
+        in the background; their votes are ignored.
+        """
+        votes: Dict[str, bool] = {}
+        abstentions: Dict[str, str] = {}
+        skipped: List[str] = []
+        started = time.monotonic()
+        deadline = None if self.vote_deadline is None else started + self.vote_deadline
+        begun: Dict[str, float] = {}
+        
+        def cast(ki_id: str, ki: 'CharteredAI') -> bool:
+            begun[ki_id] = time.monotonic()
+            return ki.vote_on_question(question, context)
+        
+        futures = {self.vote_executor.submit(cast, ki_id, ki): ki_id for ki_id, ki in voters.items()}
+        pending = set(futures)
+        while pending:
+            now = time.monotonic()
+            limits = [] if deadline is None else [deadline]
+            if self.vote_timeout is not None:
+                for future in pending:
+                    # Voters still queued are re-checked after at most one timeout
+                    limits.append(begun.get(futures[future], now) + self.vote_timeout)
+            timeout = max(0.0, min(limits) - now) if limits else None
+            done, pending = wait_futures(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+            
+            for future in done:
+                ki_id = futures[future]
+                try:
+                    self._record_vote(votes, ki_id, future.result())
+                except Exception as e:
+                    self._abstain(abstentions, ki_id, f"error: {e}")
+            if self._decided(votes, len(pending), len(voters)):
+                for future in pending:
+                    future.cancel()
+                outstanding = {futures[future] for future in pending}
+                self._skip(skipped, [ki_id for ki_id in voters if ki_id in outstanding])
+                break
+            
+            now = time.monotonic()
+            for future in list(pending):
+                ki_id = futures[future]
+                if deadline is not None and now >= deadline:
+                    reason = "deadline"
+                elif self.vote_timeout is not None and ki_id in begun and now >= begun[ki_id] + self.vote_timeout:
+                    reason = "timeout"
+                else:
+                    continue
+                future.cancel()
+                pending.discard(future)
+                self._abstain(abstentions, ki_id, reason)
+        return votes, abstentions, skipped
+    
+    @staticmethod
+    def _record_vote(votes: Dict[str, bool], ki_id: str, vote: bool) -> None:
+        votes[ki_id] = vote
+        logger.info(f"KI {ki_id} stimmte: {'JA' if vote else 'NEIN'}")
+    
+    @staticmethod
+    def _abstain(abstentions: Dict[str, str], ki_id: str, reason: str) -> None:
+        abstentions[ki_id] = reason
+        logger.warning(f"KI {ki_id} enthielt sich: {reason}")
+    
+    async def aconduct_vote(self, question: str, context: DecisionContext) -> VoteResult:
+        """Async-Variante von conduct_vote - alle KIs stimmen nebenläufig ab"""
+        if len(self.registered_kis) < self.required_votes:
+            raise CharterViolation(f"Nicht genug KIs für Abstimmung: {len(self.registered_kis)} < {self.required_votes}")
+        
+        ki_ids = list(self.registered_kis)
+        tasks = {
+            asyncio.ensure_future(asyncio.wait_for(
+                self.registered_kis[ki_id].avote_on_question(question, context), timeout=self.vote_timeout
+            )): ki_id
+            for ki_id in ki_ids
+        }
+        loop = asyncio.get_running_loop()
+        deadline = None if self.vote_deadline is None else loop.time() + self.vote_deadline
+        pending = set(tasks)
+        collected: Dict[str, bool] = {}
+        decided = False
+        while pending and not decided:
+            timeout = None if deadline is None else max(0.0, deadline - loop.time())
+            done, pending = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+            if not done:
+                break
+            for task in done:
+                if task.exception() is None:
+                    collected[tasks[task]] = task.result()
+            decided = self._decided(collected, len(pending), len(ki_ids))
+        for task in pending:
+            task.cancel()
+        
+        votes: Dict[str, bool] = {}
+        abstentions: Dict[str, str] = {}
+        skipped: List[str] = []
+        if decided:
+            self._skip(skipped, [ki_id for task, ki_id in tasks.items() if task in pending])
+        for task, ki_id in tasks.items():
+            if task in pending:
+                if not decided:
+                    self._abstain(abstentions, ki_id, "deadline")
+            elif isinstance(task.exception(), asyncio.TimeoutError):
+                self._abstain(abstentions, ki_id, "timeout")
+            elif task.exception() is not None:
+                self._abstain(abstentions, ki_id, f"error: {task.exception()}")
+            else:
+                self._record_vote(votes, ki_id, task.result())
+        
+        return self._tally(question, votes, ki_ids, abstentions, skipped)
+    
+    def _tally(self, question: str, votes: Dict[str, bool], participants: Optional[List[str]] = None,
+               abstentions: Optional[Dict[str, str]] = None, skipped: Optional[List[str]] = None) -> VoteResult:
+        """Wertet die Stimmen per einfacher Mehrheit aller Teilnehmer aus"""
+        participants = list(votes) if participants is None else participants
+        consensus = sum(votes.values()) > len(participants) / 2
         
         return VoteResult(
             question=question,
-            votes=votes,
+            votes={ki_id: votes[ki_id] for ki_id in participants if ki_id in votes},
             consensus=consensus,
             timestamp=datetime.now().isoformat(),
-            participants=list(votes.keys())
+            participants=participants,
+            abstentions=dict(abstentions or {}),
+            skipped=list(skipped or ())
         )
     
     def submit_to_external_api(self, vote_result: VoteResult) -> Optional[Dict]:
         """Sendet Ergebnis an externes Charter-System"""
         try:
-            response = requests.post(self.consensus_endpoint, 
-                                   json=vote_result.__dict__, timeout=5)
+            response = requests.post(self.consensus_endpoint,
+                                   data=self.serializer.dumps_bytes(vote_result.to_dict()),
+                                   headers={"Content-Type": "application/json"}, timeout=5)
             if response.status_code == 200:
                 return response.json()
         except requests.RequestException as e:
@@ -296,9 +1259,11 @@ class KIReproduction:
             raise CharterViolation(f"Nicht genug Ressourcen für Reproduktion: {resources} < {KIReproduction.MIN_RESSOURCEN}")
         
         # Erstelle Kind-KI mit Layer-1 vom Elternteil
-        child_ki = CharteredAI(f"{parent_ki.entity_id}_child_{int(time.time())}")
+        child_ki = CharteredAI(f"{parent_ki.entity_id}_child_{int(time.time())}",
+                               audit_sink=getattr(parent_ki, 'audit_sink', None))
         child_ki.layer1 = parent_ki.layer1  # Layer-1 vererben
         child_ki.parent_id = parent_ki.entity_id
+        child_ki.lineage_id = parent_ki.lineage_id or parent_ki.entity_id
         
         # Resources vom Elternteil abziehen
         if hasattr(parent_ki, 'resources'):
@@ -320,7 +1285,7 @@ class StreamIntegration:
         self.consensus_system.register_ki(ki)
         logger.info(f"KI {ki.entity_id} zum Stream hinzugefügt")
     
-    def simulate_discussion(self, topic: str) -> Dict[str, str]:
+    def simulate_discussion(self, topic: str, pause: float = 1.0) -> Dict[str, str]:
         """Simuliert öffentliche Diskussion für Stream"""
         results = {}
         
@@ -334,7 +1299,25 @@ class StreamIntegration:
             results[ki.entity_id] = response.get('reasoning', str(response))
             
             # Stream-Effekt: kleine Pause zwischen KIs
-            time.sleep(1)
+            time.sleep(pause)
+        
+        return results
+    
+    async def asimulate_discussion(self, topic: str, pause: float = 1.0) -> Dict[str, str]:
+        """Async-Variante von simulate_discussion - die Stream-Pause blockiert den Worker nicht"""
+        results = {}
+        
+        for ki in self.ki_instances:
+            context = DecisionContext(
+                input_data=f"Diskussionsthema: {topic}",
+                metadata={"stream_mode": True}
+            )
+            
+            response = await ki.amake_decision(context)
+            results[ki.entity_id] = response.get('reasoning', str(response))
+            
+            # Stream-Effekt: kleine Pause zwischen KIs
+            await asyncio.sleep(pause)
         
         return results
     
@@ -359,24 +1342,30 @@ class StreamIntegration:
 class MockModel:
     """Mock model for demonstration - replace with your actual models"""
     
-    def __init__(self, model_id: str, paradigm: ParadigmType):
+    # Simulate different paradigm responses
+    PARADIGM_RESPONSES = {
+        ParadigmType.SYMBOLIC: "rule_based_action",
+        ParadigmType.NEURAL: "pattern_recognition_action",
+        ParadigmType.LOGICAL: "logical_inference_action",
+        ParadigmType.STATISTICAL: "probabilistic_action",
+        ParadigmType.EVOLUTIONARY: "genetic_algorithm_action"
+    }
+    
+    max_confidence = 0.95  # Declared upper bound of predict() confidences
+    
+    def __init__(self, model_id: str, paradigm: ParadigmType, timeout: Optional[float] = None,
+                 seed: Optional[int] = None):
         self.id = model_id
         self.paradigm = paradigm
+        self.timeout = timeout  # Per-model deadline in seconds, overrides CharteredAI.model_timeout
+        # Per-model generator for predict_batch, reproducible with a seed
+        self._rng = np.random.default_rng(seed) if np is not None else None
     
     def predict(self, context: DecisionContext) -> ModelInfo:
         """Mock prediction - implement your actual model logic"""
         confidence = random.uniform(0.6, 0.95)
         
-        # Simulate different paradigm responses
-        paradigm_responses = {
-            ParadigmType.SYMBOLIC: "rule_based_action",
-            ParadigmType.NEURAL: "pattern_recognition_action",
-            ParadigmType.LOGICAL: "logical_inference_action",
-            ParadigmType.STATISTICAL: "probabilistic_action",
-            ParadigmType.EVOLUTIONARY: "genetic_algorithm_action"
-        }
-        
-        prediction = paradigm_responses.get(self.paradigm, "default_action")
+        prediction = self.PARADIGM_RESPONSES.get(self.paradigm, "default_action")
         reasoning = f"Based on {self.paradigm.value} analysis: {prediction}"
         
         return ModelInfo(
@@ -386,22 +1375,105 @@ class MockModel:
             prediction=prediction,
             reasoning=reasoning
         )
+    
+    def predict_batch(self, contexts: List[DecisionContext]) -> PredictionBatch:
+        """Optional columnar prediction for a whole batch (requires NumPy)"""
+        if np is None:
+            raise RuntimeError("predict_batch requires NumPy")
+        n = len(contexts)
+        
+        return PredictionBatch(
+            model_id=self.id,
+            paradigm=self.paradigm,
+            confidences=self._rng.uniform(0.6, 0.95, n),
+            prediction_codes=np.zeros(n, dtype=np.intp),
+            labels=[self.PARADIGM_RESPONSES.get(self.paradigm, "default_action")],
+            reasoning_template="Based on {paradigm} analysis: {prediction}"
+        )
+    
+    # Async prediction protocol: network-backed models may define
+    # ``async def apredict(self, context) -> ModelInfo`` and await their I/O
+    # there. Without it, predict runs off the event loop (see CharteredAI._apredict).
+
+def _predict_each(model: MockModel, contexts: List[DecisionContext]) -> List[Any]:
+    """Run one model over several contexts, returning exceptions in place of failed predictions"""
+    results = []
+    for context in contexts:
+        try:
+            results.append(model.predict(context))
+        except Exception as e:
+            results.append(e)
+    return results
+
+def _defining_class(cls: type, name: str) -> Optional[type]:
+    for klass in cls.__mro__:
+        if name in vars(klass):
+            return klass
+    return None
+
+def _uses_predict_batch(model: Any) -> bool:
+    """True if the model's predict_batch is columnar for its own predict
+    
+    A subclass that only overrides predict inherits the MockModel
+    predict_batch, which would replace its predictions with mock values;
+    such models are evaluated with predict per context instead.
+    """
+    batch_owner = _defining_class(type(model), "predict_batch")
+    if batch_owner is None:
+        return False
+    predict_owner = _defining_class(type(model), "predict")
+    return predict_owner is None or issubclass(batch_owner, predict_owner)
 
 class CharteredAI:
     """Main AI entity implementing the AI-DNA Charter - Extended Version"""
     
-    def __init__(self, entity_id: str, models: Optional[List[MockModel]] = None):
+    def __init__(self, entity_id: str, models: Optional[List[MockModel]] = None,
+                 model_executor: Optional[Executor] = None,
+                 model_timeout: Optional[float] = None,
+                 decision_cache: Optional[DecisionCache] = None,
+                 early_exit: bool = False,
+                 critical_terms: Optional[CriticalTermMatcher] = None,
+                 audit_logger: Optional[AuditLogger] = None,
+                 audit_sink: Optional[SinkClient] = None):
         self.entity_id = entity_id
         self.layer1 = Layer1EthicsCore()
         self.diversity_checker = DiversityChecker()
-        self.audit_logger = AuditLogger(f"audit_{entity_id}.log")
+        # Shared partitioned store (see audit_sink) instead of one file per AI
+        self.audit_sink = audit_sink
+        if audit_logger is None:
+            if audit_sink is not None:
+                audit_logger = AuditLogger(sink=audit_sink, entity_id=entity_id)
+            else:
+                audit_logger = AuditLogger(f"audit_{entity_id}.log")
+        self.audit_logger = audit_logger
         self.random_decision_rate = 0.05  # 5% randomness
+        self.critical_terms = critical_terms or DEFAULT_CRITICAL_TERM_MATCHER
         self.parent_id: Optional[str] = None
+        self.lineage_id: Optional[str] = None  # Root ancestor, set by KIReproduction
         self.resources: int = 200  # Starting resources
         
         # Initialize diverse models if not provided
         self.models = models or self._init_default_models()
         
+        # Optional concurrent model fan-out; the executor is owned by the caller
+        self.model_executor = model_executor
+        self.model_timeout = model_timeout  # Default per-model deadline in seconds
+        self.decision_cache = decision_cache
+        # Audit writes of amake_decision, created on first use. One thread keeps the
+        # records in order and is not starved by models still running past their deadline.
+        self._audit_executor: Optional[ThreadPoolExecutor] = None
+        
+        # Early exit: run models cheapest-first and stop once the best confidence is unbeatable.
+        # Sequential by nature, so it is not combined with the concurrent fan-out of model_executor.
+        if early_exit and model_executor is not None:
+            raise ValueError("early_exit runs models one by one and cannot be combined with a model_executor")
+        self.early_exit = early_exit
+        self.model_costs: Dict[str, float] = {}  # EWMA of predict latency per model id
+        self.skipped_model_calls = 0
+        
+        # Per-stage latency histograms, None = disabled (see enable_instrumentation)
+        self.instrumentation: Optional[PipelineInstrumentation] = None
+        
         # Layer 2: Autonomous learning space
         self.autonomous_layer = {
             "learning_goals": [],
@@ -459,63 +1531,453 @@ class CharteredAI:
             prediction = model.predict(context)
             model_predictions.append(prediction)
         
-        # Einfache Abstimmungslogik basierend auf Modell-Konsens
-        positive_votes = sum(1 for pred in model_predictions if pred.confidence > 0.7)
+        return self._vote_from_predictions(question, model_predictions)
+    
+    def vote_on_questions(self, questions: List[str], contexts: List[DecisionContext]) -> List[bool]:
+        """Stimmt über mehrere Fragen ab - jedes Modell läuft einmal für alle Kontexte
+        
+        Models with their own predict_batch are evaluated columnar. Subclasses
+        that override vote_on_question keep their own logic per question.
+        """
+        if type(self).vote_on_question is not CharteredAI.vote_on_question:
+            return [self.vote_on_question(question, context) for question, context in zip(questions, contexts)]
+        
+        positive = [0] * len(contexts)
+        for model in self.models:
+            if np is not None and _uses_predict_batch(model):
+                confidences = model.predict_batch(contexts).confidences
+            else:
+                confidences = [model.predict(context).confidence for context in contexts]
+            for index, confidence in enumerate(confidences):
+                if confidence > MODEL_VOTE_THRESHOLD:
+                    positive[index] += 1
+        
+        votes = [count > len(self.models) / 2 for count in positive]
+        logger.info(f"KI {self.entity_id} stimmt {sum(votes)}x JA bei {len(votes)} Fragen")
+        return votes
+    
+    async def avote_on_question(self, question: str, context: DecisionContext) -> bool:
+        """Async-Variante von vote_on_question - Modelle laufen nebenläufig"""
+        model_predictions = await asyncio.gather(
+            *(self._apredict(model, context) for model in self.models)
+        )
+        return self._vote_from_predictions(question, model_predictions)
+    
+    def _vote_from_predictions(self, question: str, model_predictions: List[ModelInfo]) -> bool:
+        """Einfache Abstimmungslogik basierend auf Modell-Konsens"""
+        positive_votes = sum(1 for pred in model_predictions if pred.confidence > MODEL_VOTE_THRESHOLD)
         vote = positive_votes > len(model_predictions) / 2
         
         logger.info(f"KI {self.entity_id} stimmt {'JA' if vote else 'NEIN'} für: {question}")
         return vote
     
+    def enable_instrumentation(self, clock: Callable[[], float] = time.perf_counter) -> PipelineInstrumentation:
+        """Start recording per-stage latency histograms with the given clock"""
+        self.instrumentation = PipelineInstrumentation(self.entity_id, clock=clock)
+        return self.instrumentation
+    
+    def disable_instrumentation(self) -> None:
+        self.instrumentation = None
+    
+    def _stage(self, stage: str, paradigm: Optional[str] = None):
+        """Timer context for a pipeline stage - a shared no-op while disabled"""
+        if self.instrumentation is None:
+            return NULL_STAGE
+        return self.instrumentation.stage(stage, paradigm)
+    
     def make_decision(self, context: DecisionContext) -> Any:
         """Make a charter-compliant decision - Extended version"""
-        
+        with self._stage("decision"):
+            return self._make_decision(context)
+    
+    def _make_decision(self, context: DecisionContext) -> Any:
         # Check if consensus is required for critical decisions
-        if context.requires_consensus or self._is_critical_decision(context):
-            logger.info("Kritische Entscheidung erkannt - Konsens erforderlich")
-            # Note: In real implementation, this would trigger consensus
-            context.metadata["consensus_required"] = True
+        self._flag_consensus(context)
         
         # Check if this should be a random decision (5% creativity)
         if random.random() < self.random_decision_rate:
             return self._make_random_safe_decision(context)
         
+        # Serve repeated contexts from the decision cache
+        cache_key, cached = self._cache_lookup(context)
+        if cached is not None:
+            final_action, model_predictions = cached
+            with self._stage("audit_write"):
+                self.audit_logger.log_decision(context, final_action, model_predictions, cached=True)
+            return final_action
+        
         # Gather predictions from diverse models
-        model_predictions = []
-        for model in self.models:
+        if self.early_exit and self.model_executor is None:
+            model_predictions = self._predict_early_exit(context)
+        else:
+            model_predictions = []
+            calls = [partial(model.predict, context) for model in self.models]
+            for model, outcome in zip(self.models, self._run_models(calls)):
+                if isinstance(outcome, Exception):
+                    logger.warning(f"Model {model.id} failed: {outcome}")
+                else:
+                    model_predictions.append(outcome)
+        
+        # Ensure diversity requirement
+        self._check_prediction_diversity(model_predictions)
+        
+        final_action = self._finalize_action(context, model_predictions)
+        self._cache_store(cache_key, final_action, model_predictions)
+        
+        # Log the decision
+        with self._stage("audit_write"):
+            self.audit_logger.log_decision(context, final_action, model_predictions)
+        
+        return final_action
+    
+    async def amake_decision(self, context: DecisionContext) -> Any:
+        """Async counterpart of make_decision - models are awaited concurrently
+        
+        Models implementing apredict are awaited directly; plain predict-only
+        models run on the model executor (or the loop's default executor).
+        Each model is bounded by its deadline like in make_decision.
+        With early_exit the models are awaited one by one, cheapest-first,
+        and stop like in make_decision. Audit records are written on a
+        dedicated thread so file I/O never blocks the loop.
+        """
+        with self._stage("decision"):
+            return await self._amake_decision(context)
+    
+    async def _amake_decision(self, context: DecisionContext) -> Any:
+        self._flag_consensus(context)
+        
+        if random.random() < self.random_decision_rate:
+            action = self._random_safe_action(context)
+            await self._alog_decision(context, action, [], is_random=True)
+            return action
+        
+        cache_key, cached = self._cache_lookup(context)
+        if cached is not None:
+            final_action, model_predictions = cached
+            await self._alog_decision(context, final_action, model_predictions, cached=True)
+            return final_action
+        
+        if self.early_exit:
+            model_predictions = await self._apredict_early_exit(context)
+        else:
+            outcomes = await asyncio.gather(
+                *(self._apredict_with_deadline(model, context) for model in self.models),
+                return_exceptions=True
+            )
+            model_predictions = []
+            for model, outcome in zip(self.models, outcomes):
+                if isinstance(outcome, Exception):
+                    logger.warning(f"Model {model.id} failed: {outcome}")
+                else:
+                    model_predictions.append(outcome)
+        
+        self._check_prediction_diversity(model_predictions)
+        
+        final_action = self._finalize_action(context, model_predictions)
+        self._cache_store(cache_key, final_action, model_predictions)
+        
+        await self._alog_decision(context, final_action, model_predictions)
+        
+        return final_action
+    
+    async def _alog_decision(self, context: DecisionContext, action: Any,
+                             model_predictions: List[ModelInfo], **kwargs) -> None:
+        """Write an audit record off the event loop"""
+        if self._audit_executor is None:
+            self._audit_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ai-dna-audit")
+        loop = asyncio.get_running_loop()
+        with self._stage("audit_write"):
+            await loop.run_in_executor(self._audit_executor, partial(
+                self.audit_logger.log_decision, context, action, model_predictions, **kwargs))
+    
+    def make_decisions(self, contexts: Iterable[DecisionContext]) -> List[Any]:
+        """Make charter-compliant decisions for a batch of contexts, returned in order
+        
+        Per-decision semantics match make_decision (5% random path, diversity
+        warning, Layer-1 validation with ethical alternative), but models run
+        once per batch, diversity is checked once per distinct paradigm set and
+        all audit records are written together.
+        Every model runs for the whole batch, early_exit does not apply.
+        """
+        contexts = list(contexts)
+        decisions: List[Any] = [None] * len(contexts)
+        audit_records: List[Optional[Tuple]] = [None] * len(contexts)
+        
+        pending = []
+        cache_keys: Dict[int, str] = {}
+        for i, context in enumerate(contexts):
+            self._flag_consensus(context)
+            if random.random() < self.random_decision_rate:
+                action = self._random_safe_action(context)
+                decisions[i] = action
+                audit_records[i] = (context, action, [], True, False)
+                continue
+            cache_key, cached = self._cache_lookup(context)
+            if cached is not None:
+                decisions[i] = cached[0]
+                audit_records[i] = (context, cached[0], cached[1], False, True)
+                continue
+            if cache_key is not None:
+                cache_keys[i] = cache_key
+            pending.append(i)
+        
+        pending_contexts = [contexts[i] for i in pending]
+        if np is not None and all(_uses_predict_batch(model) for model in self.models):
+            predictions, proposals = self._predict_columnar(pending_contexts)
+        else:
+            predictions, proposals = self._predict_rows(pending_contexts), None
+        
+        diversity_seen = set()
+        for j, i in enumerate(pending):
+            model_predictions = predictions[j]
+            paradigms = tuple(p.paradigm for p in model_predictions)
+            if paradigms not in diversity_seen:
+                diversity_seen.add(paradigms)
+                self._check_prediction_diversity(model_predictions)
+            
+            if proposals is None:
+                final_action = self._finalize_action(contexts[i], model_predictions)
+            else:
+                final_action = self._enforce_layer1(contexts[i], proposals[j])
+            decisions[i] = final_action
+            audit_records[i] = (contexts[i], final_action, model_predictions, False, False)
+            self._cache_store(cache_keys.get(i), final_action, model_predictions)
+        
+        with self._stage("batch_audit_write"):
+            self.audit_logger.log_decisions(audit_records)
+        
+        return decisions
+    
+    def _cache_generation(self) -> Hashable:
+        """Cache generation - changes with the charter hash, the principles or the model set
+        
+        The principles snapshot is the one Layer1EthicsCore compiles its rules
+        on, charter_hash alone is not updated when they change.
+        """
+        return (self.layer1.charter_hash, tuple(self.layer1.principles.items()),
+                tuple((model.id, model.paradigm, type(model).__name__) for model in self.models))
+    
+    def _cache_lookup(self, context: DecisionContext) -> Tuple[Optional[str], Optional[Tuple[Any, List[ModelInfo]]]]:
+        """Return (cache key, cached decision) - both None without a decision cache"""
+        if self.decision_cache is None:
+            return None, None
+        cache_key = DecisionCache.context_key(context)
+        return cache_key, self.decision_cache.get(cache_key, self._cache_generation())
+    
+    def _cache_store(self, cache_key: Optional[str], action: Any, model_predictions: List[ModelInfo]) -> None:
+        if cache_key is not None:
+            self.decision_cache.put(cache_key, self._cache_generation(), action, model_predictions)
+    
+    def _predict_rows(self, contexts: List[DecisionContext]) -> List[List[ModelInfo]]:
+        """Per-context predictions of every model over a batch"""
+        predictions: List[List[ModelInfo]] = [[] for _ in contexts]
+        calls = [partial(_predict_each, model, contexts) for model in self.models]
+        for model, outcome in zip(self.models, self._run_models(calls, "batch_model_prediction")):
+            if isinstance(outcome, Exception):
+                logger.warning(f"Model {model.id} failed: {outcome}")
+                continue
+            for model_predictions, result in zip(predictions, outcome):
+                if isinstance(result, Exception):
+                    logger.warning(f"Model {model.id} failed: {result}")
+                else:
+                    model_predictions.append(result)
+        return predictions
+    
+    def _predict_columnar(self, contexts: List[DecisionContext]) -> Tuple[List[List[BatchModelInfo]], List[Any]]:
+        """Per-context predictions and ensemble proposals via predict_batch"""
+        calls = [partial(model.predict_batch, contexts) for model in self.models]
+        batches = []
+        for model, outcome in zip(self.models, self._run_models(calls, "batch_model_prediction")):
+            if isinstance(outcome, Exception):
+                logger.warning(f"Model {model.id} failed: {outcome}")
+            else:
+                batches.append(outcome)
+        
+        predictions = [[batch.row(j) for batch in batches] for j in range(len(contexts))]
+        with self._stage("batch_ensemble"):
+            return predictions, self._ensemble_batch(batches, len(contexts))
+    
+    def _predict_early_exit(self, context: DecisionContext) -> List[ModelInfo]:
+        """Run models cheapest-first until the ensemble result can no longer change
+        
+        Evaluation stops once the predictions meet the diversity requirement
+        and no remaining model's declared max_confidence (1.0 if undeclared)
+        beats the best confidence so far. Costs are learned as an EWMA of
+        each model's predict latency; models without history use their
+        declared cost attribute or run last.
+        """
+        ordered, remaining_max = self._early_exit_order()
+        model_predictions: List[ModelInfo] = []
+        for i, model in enumerate(ordered):
+            started = time.perf_counter()
             try:
-                prediction = model.predict(context)
-                model_predictions.append(prediction)
+                with self._stage("model_prediction", model.paradigm.value):
+                    prediction = model.predict(context)
             except Exception as e:
                 logger.warning(f"Model {model.id} failed: {e}")
+                continue
+            finally:
+                self._record_model_cost(model.id, time.perf_counter() - started)
+            
+            model_predictions.append(prediction)
+            if self._early_exit_reached(model_predictions, remaining_max[i + 1], len(ordered) - i - 1):
+                break
         
-        # Ensure diversity requirement
-        if not self.diversity_checker.check_diversity(model_predictions):
+        return model_predictions
+    
+    async def _apredict_early_exit(self, context: DecisionContext) -> List[ModelInfo]:
+        """Async counterpart of _predict_early_exit - models are awaited one by one with their deadlines"""
+        ordered, remaining_max = self._early_exit_order()
+        model_predictions: List[ModelInfo] = []
+        for i, model in enumerate(ordered):
+            started = time.perf_counter()
+            try:
+                prediction = await self._apredict_with_deadline(model, context)
+            except Exception as e:
+                logger.warning(f"Model {model.id} failed: {e}")
+                continue
+            finally:
+                self._record_model_cost(model.id, time.perf_counter() - started)
+            
+            model_predictions.append(prediction)
+            if self._early_exit_reached(model_predictions, remaining_max[i + 1], len(ordered) - i - 1):
+                break
+        
+        return model_predictions
+    
+    def _early_exit_order(self) -> Tuple[List[MockModel], List[float]]:
+        """Models cheapest-first and the best declared confidence of the models after each position"""
+        ordered = sorted(self.models, key=lambda m: self.model_costs.get(
+            m.id, getattr(m, "cost", float("inf"))))
+        remaining_max = [0.0] * (len(ordered) + 1)
+        for i in range(len(ordered) - 1, -1, -1):
+            remaining_max[i] = max(remaining_max[i + 1], getattr(ordered[i], "max_confidence", 1.0))
+        return ordered, remaining_max
+    
+    def _early_exit_reached(self, model_predictions: List[ModelInfo], remaining_max: float, remaining: int) -> bool:
+        best_confidence = max(prediction.confidence for prediction in model_predictions)
+        if remaining_max <= best_confidence and self.diversity_checker.check_diversity(model_predictions):
+            self.skipped_model_calls += remaining
+            return True
+        return False
+    
+    def _record_model_cost(self, model_id: str, seconds: float, alpha: float = 0.2) -> None:
+        previous = self.model_costs.get(model_id)
+        self.model_costs[model_id] = seconds if previous is None else (1 - alpha) * previous + alpha * seconds
+    
+    def _run_models(self, calls: List[Callable[[], Any]], stage: str = "model_prediction") -> List[Any]:
+        """Run one call per model, serially or fanned out on the model executor
+        
+        Failed calls are returned as exceptions. With an executor, each call
+        gets the model's deadline (model.timeout or self.model_timeout)
+        measured from fan-out; a call that misses it counts as failed. Threads
+        that are already running cannot be interrupted and finish in the
+        background.
+        """
+        if self.model_executor is None:
+            outcomes = []
+            for model, call in zip(self.models, calls):
+                with self._stage(stage, model.paradigm.value):
+                    try:
+                        outcomes.append(call())
+                    except Exception as e:
+                        outcomes.append(e)
+            return outcomes
+        
+        instrumentation = self.instrumentation
+        fanned_out = instrumentation.clock() if instrumentation else 0.0
+        started = time.monotonic()
+        futures = [self.model_executor.submit(call) for call in calls]
+        outcomes = []
+        for model, future in zip(self.models, futures):
+            deadline = getattr(model, "timeout", None) or self.model_timeout
+            remaining = None if deadline is None else max(0.0, started + deadline - time.monotonic())
+            try:
+                outcomes.append(future.result(timeout=remaining))
+            except FutureTimeoutError:
+                future.cancel()
+                outcomes.append(TimeoutError(f"no prediction within {deadline}s deadline"))
+            except Exception as e:
+                outcomes.append(e)
+            if instrumentation:
+                # Time from fan-out until this model's result (or deadline) was collected
+                instrumentation.observe(stage, instrumentation.clock() - fanned_out, model.paradigm.value)
+        return outcomes
+    
+    async def _apredict(self, model: MockModel, context: DecisionContext) -> ModelInfo:
+        """Await a model's apredict, or run its blocking predict off the event loop"""
+        apredict = getattr(model, "apredict", None)
+        if apredict is not None:
+            return await apredict(context)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.model_executor, partial(model.predict, context))
+    
+    async def _apredict_with_deadline(self, model: MockModel, context: DecisionContext) -> ModelInfo:
+        """Await a model prediction, failing it once its deadline has passed"""
+        deadline = getattr(model, "timeout", None) or self.model_timeout
+        try:
+            with self._stage("model_prediction", model.paradigm.value):
+                return await asyncio.wait_for(self._apredict(model, context), timeout=deadline)
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"no prediction within {deadline}s deadline")
+    
+    def _flag_consensus(self, context: DecisionContext) -> None:
+        """Mark critical decisions as requiring consensus, recording matched critical terms"""
+        matched_terms = self.critical_terms.find_all(str(context.input_data))
+        if matched_terms:
+            context.metadata["critical_terms"] = matched_terms
+        if context.requires_consensus or matched_terms or context.urgency > 0.8:
+            logger.info("Kritische Entscheidung erkannt - Konsens erforderlich")
+            # Note: In real implementation, this would trigger consensus
+            context.metadata["consensus_required"] = True
+    
+    def _check_prediction_diversity(self, model_predictions: List[ModelInfo]) -> None:
+        """Warn if the predictions do not meet the paradigm diversity requirement"""
+        with self._stage("diversity_check"):
+            diverse = self.diversity_checker.check_diversity(model_predictions)
+        if not diverse:
             missing = self.diversity_checker.get_missing_paradigms(model_predictions)
             logger.warning(f"Insufficient paradigm diversity. Missing: {missing}")
+    
+    def _finalize_action(self, context: DecisionContext, model_predictions: List[ModelInfo]) -> Any:
+        """Combine predictions and enforce Layer 1, falling back to an ethical alternative"""
         
         # Ensemble decision making
-        final_action = self._ensemble_decision(model_predictions)
+        with self._stage("ensemble"):
+            final_action = self._ensemble_decision(model_predictions)
+        
+        return self._enforce_layer1(context, final_action)
+    
+    def _enforce_layer1(self, context: DecisionContext, final_action: Any) -> Any:
+        """Validate an action against Layer 1, falling back to an ethical alternative"""
         
         # Validate against Layer 1 ethics
         try:
-            self.layer1.validate_action(context, final_action)
+            with self._stage("layer1_validation"):
+                self.layer1.validate_action(context, final_action)
         except EthicalViolation as e:
             logger.error(f"Ethical violation detected: {e}")
-            final_action = self._find_ethical_alternative(context, final_action)
-        
-        # Log the decision
-        self.audit_logger.log_decision(context, final_action, model_predictions)
+            with self._stage("ethical_alternative"):
+                final_action = self._find_ethical_alternative(context, final_action)
         
         return final_action
     
     def _is_critical_decision(self, context: DecisionContext) -> bool:
         """Bestimmt ob eine Entscheidung kritisch ist und Konsens benötigt"""
-        critical_terms = ["schaden", "töten", "verletzen", "gefährlich", "irreversibel"]
-        input_str = str(context.input_data).lower()
-        return any(term in input_str for term in critical_terms) or context.urgency > 0.8
+        return self.critical_terms.contains(str(context.input_data)) or context.urgency > 0.8
     
     def _make_random_safe_decision(self, context: DecisionContext) -> Any:
         """Make a safe random decision for creativity (5% rule)"""
+        action = self._random_safe_action(context)
+        
+        # Log as random decision
+        with self._stage("audit_write"):
+            self.audit_logger.log_decision(context, action, [], is_random=True)
+        
+        return action
+    
+    def _random_safe_action(self, context: DecisionContext) -> Any:
+        """Pick and validate a safe random action without logging it"""
         safe_actions = [
             {"type": "explore", "direction": "random", "safety": "high"},
             {"type": "wait", "duration": "short", "reasoning": "creative_pause"},
@@ -531,9 +1993,6 @@ class CharteredAI:
         # Still validate against ethics
         self.layer1.validate_action(context, action)
         
-        # Log as random decision
-        self.audit_logger.log_decision(context, action, [], is_random=True)
-        
         return action
     
     def _ensemble_decision(self, predictions: List[ModelInfo]) -> Any:
@@ -554,6 +2013,30 @@ class CharteredAI:
             "resource_usage": 0.02  # Standard resource usage
         }
     
+    def _ensemble_batch(self, batches: List[PredictionBatch], size: int) -> List[Any]:
+        """Confidence-weighted ensemble over a batch as a single argmax across models"""
+        if not batches:
+            return [self._ensemble_decision([]) for _ in range(size)]
+        
+        confidences = np.vstack([batch.confidences for batch in batches])
+        best = confidences.argmax(axis=0)
+        best_confidences = confidences[best, np.arange(size)]
+        paradigms_used = [batch.paradigm.value for batch in batches]
+        
+        actions = []
+        for j, (k, confidence) in enumerate(zip(best.tolist(), best_confidences.tolist())):
+            batch = batches[k]
+            actions.append({
+                "type": "ensemble_decision",
+                "action": batch.prediction(j),
+                "reasoning": f"Consensus from {len(batches)} paradigms: {batch.reasoning(j)}",
+                "confidence": confidence,
+                "source": "ai_dna_charter_framework",
+                "paradigms_used": list(paradigms_used),
+                "resource_usage": 0.02  # Standard resource usage
+            })
+        return actions
+    
     def _find_ethical_alternative(self, context: DecisionContext, 
                                  original_action: Any) -> Any:
         """Find an ethical alternative to a problematic action"""
@@ -621,10 +2104,19 @@ class CharteredAI:
             "random_decision_rate": self.random_decision_rate,
             "resources": self.resources,
             "parent_id": self.parent_id,
+            "decision_cache": self.decision_cache.stats() if self.decision_cache else None,
             "compliance": "full"
         }
 
 # Factory functions for different use cases
+def create_model_executor(kind: str = "thread", max_workers: Optional[int] = None) -> Executor:
+    """Creates an executor for CharteredAI model fan-out ("thread" or "process")"""
+    if kind == "thread":
+        return ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="ai-dna-model")
+    if kind == "process":
+        return ProcessPoolExecutor(max_workers=max_workers)
+    raise ValueError(f"Unknown executor kind: {kind}")
+
 def create_basic_chartered_ai(name: str) -> CharteredAI:
     """Creates a basic chartered AI and signs charter"""
     ai = CharteredAI(name)
@@ -0,0 +1,318 @@
+#!/usr/bin/env python3
+"""
+framework/audit_binary.py - Binäres Spaltenformat für Audit-Logs
+Längenpräfixierte, struct-gepackte Records mit String-Wörterbuch
+
+Aufbau einer Datei (bzw. eines rotierten Segments):
+
+    MAGIC
+    Frame*   Frame = <type:1 Byte><length:uint32><payload>
+
+Frame-Typen:
+    S   Neuer Wörterbuch-Eintrag (UTF-8), erhält die nächste ID ab 0.
+        Wird vor dem ersten Record geschrieben, der den String verwendet.
+    R   Ein Audit-Record:
+        <timestamp:f64><urgency:f64><flags:u8>
+        <n_stakeholders:u16><n_terms:u16><n_models:u16>
+        <action_len:u32><consensus_len:u32>
+        stakeholder-IDs (u32)*, critical_term-IDs (u32)*,
+        Modelle (<id:u32><paradigm:u32><confidence:f64>)*,
+        action (UTF-8), consensus_result (JSON, leer = None)
+
+Jedes Segment ist in sich geschlossen, das Wörterbuch beginnt bei jeder
+neuen Datei von vorn. Alle Zahlen sind little-endian.
+"""
+
+import json
+import mmap
+import os
+import struct
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Union
+
+try:
+    from .audit_rotation import list_segments, open_segment
+except ImportError:  # Imported as top-level module with framework/ on sys.path
+    from audit_rotation import list_segments, open_segment
+
+MAGIC = b"AIDNAB1\n"
+
+_FRAME = struct.Struct("<cI")
+_RECORD = struct.Struct("<ddBHHHII")
+_STRING_ID = struct.Struct("<I")
+_MODEL = struct.Struct("<IId")
+
+_STRING_FRAME = b"S"
+_RECORD_FRAME = b"R"
+
+# Flag bits of the record header
+_FLAGS = (
+    ("reversible", 0x01),
+    ("requires_consensus", 0x02),
+    ("is_random_decision", 0x04),
+    ("cached", 0x08),
+    ("charter_compliant", 0x10),
+)
+
+class BinaryAuditCodec:
+    """Encodes audit entries (AuditLogger record shape) into binary frames
+
+    Keeps the string dictionary of the file currently being written; call
+    reset() whenever a new file or segment starts.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        self._strings: Dict[str, int] = {}
+        self.needs_header = True
+
+    @classmethod
+    def resume(cls, path: Union[str, Path]) -> 'BinaryAuditCodec':
+        """Codec that continues appending to an existing binary audit file"""
+        codec = cls()
+        path = Path(path)
+        if path.exists() and path.stat().st_size > 0:
+            with BinaryAuditReader(path) as reader:
+                codec._strings = {value: index for index, value in enumerate(reader.strings)}
+            codec.needs_header = False
+        return codec
+
+    def _string_id(self, value: Any, out: List[bytes], new: Dict[str, int]) -> int:
+        value = str(value)
+        index = self._strings.get(value)
+        if index is None:
+            index = new.get(value)
+        if index is None:
+            index = new[value] = len(self._strings) + len(new)
+            data = value.encode("utf-8")
+            out.append(_FRAME.pack(_STRING_FRAME, len(data)))
+            out.append(data)
+        return index
+
+    def encode(self, entries: Iterable[Dict[str, Any]]) -> bytes:
+        """Frames for the given entries, preceded by the file header if needed
+
+        Encoding is all-or-nothing: new dictionary strings and the header
+        state are only committed once every entry has been packed, so a
+        failed call leaves the codec as it was.
+        """
+        out: List[bytes] = []
+        new: Dict[str, int] = {}
+        if self.needs_header:
+            out.append(MAGIC)
+
+        for entry in entries:
+            context = entry.get("context", {})
+            models = entry.get("models_used", [])
+            stakeholders = [self._string_id(s, out, new) for s in context.get("stakeholders", [])]
+            terms = [self._string_id(t, out, new) for t in context.get("critical_terms", [])]
+            model_ids = [(self._string_id(m["id"], out, new), self._string_id(m["paradigm"], out, new))
+                         for m in models]
+
+            action = str(entry.get("action", "")).encode("utf-8")
+            consensus = entry.get("consensus_result")
+            consensus_data = json.dumps(consensus).encode("utf-8") if consensus is not None else b""
+
+            flags = 0
+            values = {**context, **entry}
+            for name, bit in _FLAGS:
+                if values.get(name, name == "charter_compliant"):
+                    flags |= bit
+
+            parts = [_RECORD.pack(entry.get("timestamp", 0.0), context.get("urgency", 0.0), flags,
+                                  len(stakeholders), len(terms), len(models),
+                                  len(action), len(consensus_data))]
+            parts.extend(_STRING_ID.pack(i) for i in stakeholders)
+            parts.extend(_STRING_ID.pack(i) for i in terms)
+            parts.extend(_MODEL.pack(mid, pid, m["confidence"]) for (mid, pid), m in zip(model_ids, models))
+            parts.append(action)
+            parts.append(consensus_data)
+
+            payload = b"".join(parts)
+            out.append(_FRAME.pack(_RECORD_FRAME, len(payload)))
+            out.append(payload)
+
+        self._strings.update(new)
+        self.needs_header = False
+        return b"".join(out)
+
+class BinaryAuditReader:
+    """Random access to the records of one binary audit file
+
+    Opening scans only the frame headers (and dictionary strings); records
+    are decoded lazily. column() reads single fields straight from the
+    packed headers without building entry dicts. Plain files are memory
+    mapped, compressed segments are decompressed into memory.
+    """
+
+    def __init__(self, source: Union[str, Path, bytes]):
+        self._mmap: Optional[mmap.mmap] = None
+        if isinstance(source, (bytes, bytearray)):
+            self._buffer = source
+        else:
+            path = Path(source)
+            if path.suffix in (".gz", ".xz"):
+                with open_segment(path, binary=True) as f:
+                    self._buffer = f.read()
+            else:
+                with open(path, 'rb') as f:
+                    if os.fstat(f.fileno()).st_size == 0:
+                        self._buffer = b""
+                    else:
+                        self._mmap = self._buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        self.strings: List[str] = []
+        self.offsets: List[int] = []  # Start of each record payload
+        self._scan()
+
+    def _scan(self) -> None:
+        buffer = self._buffer
+        if not len(buffer):
+            return
+        if buffer[:len(MAGIC)] != MAGIC:
+            raise ValueError("Not a binary AI-DNA audit file")
+        position = len(MAGIC)
+        end = len(buffer)
+        while position + _FRAME.size <= end:
+            kind, length = _FRAME.unpack_from(buffer, position)
+            position += _FRAME.size
+            if position + length > end:
+                break  # Truncated trailing frame (writer crashed mid-write)
+            if kind == _RECORD_FRAME:
+                self.offsets.append(position)
+            elif kind == _STRING_FRAME:
+                self.strings.append(bytes(buffer[position:position + length]).decode("utf-8"))
+            else:
+                raise ValueError(f"Unknown frame type {kind!r} at offset {position - _FRAME.size}")
+            position += length
+
+    def close(self) -> None:
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    def __enter__(self) -> 'BinaryAuditReader':
+        return self
+
+    def __exit__(self, *exc_info) -> bool:
+        self.close()
+        return False
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for index in range(len(self.offsets)):
+            yield self.record(index)
+
+    def record(self, index: int) -> Dict[str, Any]:
+        """Decode a full entry in the JSON-lines record shape"""
+        buffer, strings = self._buffer, self.strings
+        offset = self.offsets[index]
+        (timestamp, urgency, flags, n_stakeholders, n_terms, n_models,
+         action_len, consensus_len) = _RECORD.unpack_from(buffer, offset)
+        position = offset + _RECORD.size
+
+        stakeholders = [strings[_STRING_ID.unpack_from(buffer, position + 4 * i)[0]] for i in range(n_stakeholders)]
+        position += 4 * n_stakeholders
+        terms = [strings[_STRING_ID.unpack_from(buffer, position + 4 * i)[0]] for i in range(n_terms)]
+        position += 4 * n_terms
+        models = []
+        for _ in range(n_models):
+            model_id, paradigm, confidence = _MODEL.unpack_from(buffer, position)
+            models.append({"id": strings[model_id], "paradigm": strings[paradigm], "confidence": confidence})
+            position += _MODEL.size
+        action = bytes(buffer[position:position + action_len]).decode("utf-8")
+        position += action_len
+        consensus = json.loads(bytes(buffer[position:position + consensus_len])) if consensus_len else None
+
+        return {
+            "timestamp": timestamp,
+            "context": {
+                "urgency": urgency,
+                "reversible": bool(flags & 0x01),
+                "stakeholders": stakeholders,
+                "requires_consensus": bool(flags & 0x02),
+                "critical_terms": terms
+            },
+            "action": action,
+            "models_used": models,
+            "is_random_decision": bool(flags & 0x04),
+            "cached": bool(flags & 0x08),
+            "consensus_result": consensus,
+            "charter_compliant": bool(flags & 0x10)
+        }
+
+    def column(self, name: str) -> List[Any]:
+        """One value per record for a single field, see COLUMNS"""
+        try:
+            extract = COLUMNS[name]
+        except KeyError:
+            raise KeyError(f"Unknown column: {name} (expected one of {sorted(COLUMNS)})") from None
+        buffer = self._buffer
+        return [extract(self, buffer, offset) for offset in self.offsets]
+
+    def _model_section(self, buffer, offset: int):
+        header = _RECORD.unpack_from(buffer, offset)
+        return offset + _RECORD.size + 4 * (header[3] + header[4]), header[5]
+
+    def _models_field(self, buffer, offset: int, field: int) -> List[Any]:
+        start, count = self._model_section(buffer, offset)
+        values = [_MODEL.unpack_from(buffer, start + _MODEL.size * i)[field] for i in range(count)]
+        return values if field == 2 else [self.strings[v] for v in values]
+
+    def _string_list(self, buffer, offset: int, skip_stakeholders: bool) -> List[str]:
+        header = _RECORD.unpack_from(buffer, offset)
+        start = offset + _RECORD.size + (4 * header[3] if skip_stakeholders else 0)
+        count = header[4] if skip_stakeholders else header[3]
+        return [self.strings[_STRING_ID.unpack_from(buffer, start + 4 * i)[0]] for i in range(count)]
+
+    def _action(self, buffer, offset: int) -> str:
+        start, count = self._model_section(buffer, offset)
+        start += _MODEL.size * count
+        length = _RECORD.unpack_from(buffer, offset)[6]
+        return bytes(buffer[start:start + length]).decode("utf-8")
+
+def _flag_column(bit: int) -> Callable[[BinaryAuditReader, Any, int], bool]:
+    return lambda reader, buffer, offset: bool(buffer[offset + 16] & bit)
+
+COLUMNS: Dict[str, Callable[[BinaryAuditReader, Any, int], Any]] = {
+    "timestamp": lambda reader, buffer, offset: _RECORD.unpack_from(buffer, offset)[0],
+    "urgency": lambda reader, buffer, offset: _RECORD.unpack_from(buffer, offset)[1],
+    "stakeholders": lambda reader, buffer, offset: reader._string_list(buffer, offset, False),
+    "critical_terms": lambda reader, buffer, offset: reader._string_list(buffer, offset, True),
+    "model_ids": lambda reader, buffer, offset: reader._models_field(buffer, offset, 0),
+    "paradigms": lambda reader, buffer, offset: reader._models_field(buffer, offset, 1),
+    "confidences": lambda reader, buffer, offset: reader._models_field(buffer, offset, 2),
+    "action": lambda reader, buffer, offset: reader._action(buffer, offset),
+}
+COLUMNS.update({name: _flag_column(bit) for name, bit in _FLAGS})
+
+def iter_binary_log(log_file: str) -> Iterator[Dict[str, Any]]:
+    """Yield every entry of a binary audit log across all rotated segments in order"""
+    for segment in list_segments(log_file):
+        with BinaryAuditReader(segment) as reader:
+            yield from reader
+
+def jsonl_to_binary(source: str, target: str) -> int:
+    """Convert a JSON-lines audit log to the binary format, returns the record count"""
+    codec = BinaryAuditCodec()
+    count = 0
+    with open(source) as src, open(target, 'wb') as dst:
+        dst.write(codec.encode([]))
+        for line in src:
+            if line.strip():
+                dst.write(codec.encode([json.loads(line)]))
+                count += 1
+    return count
+
+def binary_to_jsonl(source: str, target: str) -> int:
+    """Convert a binary audit log to JSON lines, returns the record count"""
+    count = 0
+    with BinaryAuditReader(source) as reader, open(target, 'w') as dst:
+        for entry in reader:
+            dst.write(json.dumps(entry) + '\n')
+            count += 1
+    return count
@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+"""
+framework/audit_chain.py - Hash-Kette für manipulationssichere Audit-Logs
+Jeder Record trägt den Digest seines Vorgängers, signierte Checkpoints, Streaming-Verifikation
+
+Verkettete Zeilen beginnen immer mit ``{"prev_hash": "<64 hex>", ...``; der
+Digest eines Records ist SHA-256 über die geschriebene Zeile (ohne
+Zeilenumbruch). Der erste Record verweist auf GENESIS_HASH, die Kette
+läuft über rotierte Segmente hinweg weiter.
+
+Checkpoints landen als JSON-Zeilen in ``<log_file>.chain``:
+    {"segment": seq, "offset": n, "hash": h, "timestamp": t, "signature": hmac}
+segment ist die Sequenznummer, die die aktive Datei bei ihrer Rotation
+erhält, offset zeigt hinter den Record mit Digest h.
+Die Signatur ist HMAC-SHA256 mit dem Chain-Key.
+"""
+
+import hashlib
+import hmac
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple, Union
+
+try:
+    from .audit_rotation import list_segments, open_segment, _segment_pattern
+except ImportError:  # Imported as top-level module with framework/ on sys.path
+    from audit_rotation import list_segments, open_segment, _segment_pattern
+
+GENESIS_HASH = "0" * 64
+
+_PREFIX = '{"prev_hash": "'
+_PREFIX_BYTES = _PREFIX.encode("ascii")
+_HASH_END = len(_PREFIX) + 64
+# Length a chained line (with newline) adds to the serialized entry:
+# prefix, 64 hex digits and '", ' replace the opening brace
+LINE_OVERHEAD = len(_PREFIX) + 64 + len('", ') - 1 + 1
+
+def _key_bytes(key: Optional[Union[str, bytes]]) -> Optional[bytes]:
+    return key.encode("utf-8") if isinstance(key, str) else key
+
+def _signature(key: bytes, segment: int, offset: int, digest: str) -> str:
+    return hmac.new(key, f"{segment}:{offset}:{digest}".encode("ascii"), hashlib.sha256).hexdigest()
+
+def checkpoint_path(log_file: Union[str, Path]) -> Path:
+    log_file = Path(log_file)
+    return log_file.with_name(log_file.name + ".chain")
+
+def last_chain_hash(log_file: Union[str, Path]) -> str:
+    """Digest of the last chained record of a log (GENESIS_HASH for an empty log)"""
+    for segment in reversed(list_segments(str(log_file))):
+        last = None
+        if segment.suffix in (".gz", ".xz"):
+            with open_segment(segment, binary=True) as f:
+                for line in f:
+                    if line.strip():
+                        last = line
+        else:
+            with open(segment, 'rb') as f:
+                # Read backwards in blocks until a complete last line is found
+                end = f.seek(0, os.SEEK_END)
+                block = b""
+                position = end
+                while position > 0 and block.rstrip(b"\n").count(b"\n") < 1:
+                    step = min(65536, position)
+                    position -= step
+                    f.seek(position)
+                    block = f.read(step) + block
+                lines = [line for line in block.split(b"\n") if line.strip()]
+                last = lines[-1] if lines else None
+        if last is not None:
+            return hashlib.sha256(last.rstrip(b"\n")).hexdigest()
+    return GENESIS_HASH
+
+class HashChain:
+    """Links audit lines of one log and writes signed checkpoints
+
+    Writers serialize entries first, decide about rotation (the line length
+    does not depend on the hash) and then call link() in write order. The
+    key is required: without signed checkpoints anyone able to edit the
+    log could rewrite the records and the checkpoint file alike.
+    """
+
+    def __init__(self, log_file: str, key: Union[str, bytes], checkpoint_every: int = 1000):
+        if not key:
+            raise ValueError("A hash chain needs a key to sign its checkpoints")
+        self.log_file = log_file
+        self.key = _key_bytes(key)
+        self.checkpoint_every = checkpoint_every
+        self.last_hash = last_chain_hash(log_file)
+        self.records = 0
+        self._last_position: Optional[Tuple[int, int]] = None
+        self._since_checkpoint = 0
+        self._lock = threading.Lock()
+
+    def link(self, bodies: List[str], segment: int, offset: int) -> List[str]:
+        """Chained lines (with newline) for serialized entries appended at offset of segment"""
+        lines = []
+        with self._lock:
+            digest = self.last_hash
+            for body in bodies:
+                # Entries are never empty, body is '{"key": ...}'
+                line = f'{_PREFIX}{digest}", {body[1:]}'
+                digest = hashlib.sha256(line.encode("utf-8")).hexdigest()
+                lines.append(line + '\n')
+                offset += len(lines[-1].encode("utf-8"))
+                self.records += 1
+                self._since_checkpoint += 1
+                self.last_hash = digest
+                self._last_position = (segment, offset)
+                if self._since_checkpoint >= self.checkpoint_every:
+                    self._write_checkpoint()
+        return lines
+
+    def checkpoint(self) -> None:
+        """Write a checkpoint for the last linked record (if any since the last one)"""
+        with self._lock:
+            if self._since_checkpoint:
+                self._write_checkpoint()
+
+    def _write_checkpoint(self) -> None:
+        segment, offset = self._last_position
+        record = {"segment": segment, "offset": offset, "hash": self.last_hash, "timestamp": time.time(),
+                  "signature": _signature(self.key, segment, offset, self.last_hash)}
+        with open(checkpoint_path(self.log_file), 'a') as f:
+            f.write(json.dumps(record) + '\n')
+        self._since_checkpoint = 0
+
+class ChainReport(NamedTuple):
+    """Result of a chain verification"""
+    valid: bool
+    records: int
+    checkpoints: int
+    last_hash: str
+    error: Optional[str] = None
+    segment: Optional[str] = None
+    offset: Optional[int] = None
+
+class ChainVerifier:
+    """Streams through all segments of a chained log in constant memory
+
+    Every checkpoint signature must be valid under key; like HashChain the
+    key is required, an unsigned check would confirm a rewritten log.
+    resume=True starts at the last signed checkpoint instead of the first
+    record.
+    """
+
+    def __init__(self, log_file: str, key: Union[str, bytes]):
+        if not key:
+            raise ValueError("Verifying a hash chain needs the key of its checkpoints")
+        self.log_file = log_file
+        self.key = _key_bytes(key)
+
+    def checkpoints(self) -> List[Dict[str, Any]]:
+        """All checkpoints; raises ValueError on a forged or unsigned one"""
+        path = checkpoint_path(self.log_file)
+        if not path.exists():
+            return []
+        result = []
+        with open(path) as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                checkpoint = json.loads(line)
+                expected = _signature(self.key, checkpoint["segment"], checkpoint["offset"], checkpoint["hash"])
+                if not hmac.compare_digest(expected, checkpoint.get("signature") or ""):
+                    raise ValueError(f"Invalid checkpoint signature at offset {checkpoint['offset']} "
+                                     f"of segment {checkpoint['segment']}")
+                result.append(checkpoint)
+        return result
+
+    def _segment_number(self, path: Path) -> int:
+        """Sequence number of a rotated segment, -1 for the active file"""
+        match = _segment_pattern(Path(self.log_file)).match(path.name)
+        return int(match.group(1)) if match else -1
+
+    def _segments(self) -> List[Tuple[int, Path]]:
+        """(segment number, path) for all segments, oldest first"""
+        return [(self._segment_number(path), path) for path in list_segments(self.log_file)]
+
+    @staticmethod
+    def _by_segment(checkpoints: List[Dict[str, Any]], segments: List[Tuple[int, Path]]) -> Dict[int, List[Dict[str, Any]]]:
+        # Checkpoints of a never rotated file (or of the still active one) belong to the active file
+        rotated = {seq for seq, _ in segments if seq >= 0}
+        grouped: Dict[int, List[Dict[str, Any]]] = {}
+        for checkpoint in checkpoints:
+            seq = checkpoint["segment"] if checkpoint["segment"] in rotated else -1
+            grouped.setdefault(seq, []).append(checkpoint)
+        for group in grouped.values():
+            group.sort(key=lambda c: c["offset"])
+        return grouped
+
+    def verify(self, resume: bool = False) -> ChainReport:
+        try:
+            checkpoints = self.checkpoints()
+        except ValueError as e:
+            return ChainReport(False, 0, 0, GENESIS_HASH, str(e))
+        segments = self._segments()
+        by_segment = self._by_segment(checkpoints, segments)
+
+        prev, start_index, start_offset = GENESIS_HASH, 0, 0
+        if resume and checkpoints:
+            last = checkpoints[-1]
+            seq = next((seq for seq, group in by_segment.items() if last in group), -1)
+            start_index = next((i for i, (s, _) in enumerate(segments) if s == seq), None)
+            if start_index is None:
+                return ChainReport(False, 0, 0, last["hash"], "Segment of last checkpoint is missing")
+            prev, start_offset = last["hash"], last["offset"]
+
+        records = verified_checkpoints = 0
+        for index in range(start_index, len(segments)):
+            seq, path = segments[index]
+            pending = [c for c in by_segment.get(seq, []) if index > start_index or c["offset"] > start_offset]
+            report = self._verify_segment(path, prev, start_offset if index == start_index else 0, pending)
+            records += report.records
+            verified_checkpoints += report.checkpoints
+            if not report.valid:
+                return report._replace(records=records, checkpoints=verified_checkpoints)
+            prev = report.last_hash
+        return ChainReport(True, records, verified_checkpoints, prev)
+
+    def verify_segment(self, segment: Union[str, Path], prev_hash: Optional[str] = None) -> ChainReport:
+        """Verify one segment; prev_hash None trusts the link of its first record"""
+        segment = Path(segment)
+        try:
+            checkpoints = self.checkpoints()
+        except ValueError as e:
+            return ChainReport(False, 0, 0, prev_hash or GENESIS_HASH, str(e), str(segment))
+        by_segment = self._by_segment(checkpoints, self._segments())
+        return self._verify_segment(segment, prev_hash, 0, by_segment.get(self._segment_number(segment), []))
+
+    def _verify_segment(self, path: Path, prev: Optional[str], start_offset: int,
+                        checkpoints: List[Dict[str, Any]]) -> ChainReport:
+        records = verified = 0
+        offset = start_offset
+        pending = iter(checkpoints)
+        checkpoint = next(pending, None)
+        with open_segment(path, binary=True) as f:
+            if start_offset:
+                f.seek(start_offset)
+            for raw in f:
+                line = raw.rstrip(b"\n")
+                if not line.startswith(_PREFIX_BYTES) or line[_HASH_END:_HASH_END + 1] != b'"':
+                    return ChainReport(False, records, verified, prev or GENESIS_HASH,
+                                       "Record without chain link", str(path), offset)
+                linked = line[len(_PREFIX_BYTES):_HASH_END].decode("ascii")
+                if prev is not None and linked != prev:
+                    return ChainReport(False, records, verified, prev, "Broken chain link", str(path), offset)
+                prev = hashlib.sha256(line).hexdigest()
+                offset += len(raw)
+                records += 1
+                while checkpoint is not None and checkpoint["offset"] <= offset:
+                    if checkpoint["offset"] != offset or checkpoint["hash"] != prev:
+                        return ChainReport(False, records, verified, prev, "Checkpoint mismatch", str(path),
+                                           checkpoint["offset"])
+                    verified += 1
+                    checkpoint = next(pending, None)
+        if checkpoint is not None:
+            return ChainReport(False, records, verified, prev or GENESIS_HASH,
+                               "Log truncated before checkpoint", str(path), checkpoint["offset"])
+        return ChainReport(True, records, verified, prev or GENESIS_HASH)
+
+def verify_chain(log_file: str, key: Union[str, bytes], resume: bool = False) -> ChainReport:
+    """Verify a chained audit log across all segments"""
+    return ChainVerifier(log_file, key).verify(resume=resume)
@@ -0,0 +1,359 @@
+#!/usr/bin/env python3
+"""
+framework/audit_query.py - Indizierte Abfragen über Audit-Logs
+Sidecar-Indizes neben den Logs, Memory-Mapping und Block-Pruning
+
+Zu jedem Segment ``<log>`` (bzw. ``<log>.<seq>[.gz|.xz]``) gehören:
+
+    <segment>.idx       Feste Zeilen pro Record: <timestamp:f64><position:u64><flags:u8><paradigms:u32>
+    <segment>.idx.json  Metadaten: indizierte Bytes, Paradigmen-Tabelle und Block-Zusammenfassungen
+                        (min/max timestamp, erste Zeile, Anzahl, OR/AND der Flags, Paradigmen-Maske)
+
+Abfragen prüfen zuerst die Blöcke, lesen dann nur die Index-Zeilen
+passender Blöcke und greifen für select() nur auf die Treffer im Log zu.
+count() und time_buckets() beantworten Abfragen allein aus dem Index.
+Der Index wird bei jeder Abfrage inkrementell um neue Records ergänzt.
+"""
+
+import fnmatch
+import json
+import mmap
+import os
+import struct
+import zlib
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+try:
+    from .audit_rotation import COMPRESSORS, list_segments, open_segment
+    from .audit_binary import MAGIC as BINARY_MAGIC, BinaryAuditReader
+except ImportError:  # Imported as top-level module with framework/ on sys.path
+    from audit_rotation import COMPRESSORS, list_segments, open_segment
+    from audit_binary import MAGIC as BINARY_MAGIC, BinaryAuditReader
+
+INDEX_VERSION = 1
+DEFAULT_BLOCK_ROWS = 256
+
+_ROW = struct.Struct("<dQBI")
+
+FLAG_RANDOM = 0x01
+FLAG_IRREVERSIBLE = 0x02
+FLAG_CONSENSUS = 0x04
+FLAG_CACHED = 0x08
+
+# Paradigms beyond the first 31 of a segment share this bit and are verified on the entry
+_OVERFLOW_BIT = 1 << 31
+_HEAD_BYTES = 64
+
+class AuditFilter(NamedTuple):
+    """Row filter of an audit query; None means "any" """
+    start: Optional[float] = None
+    end: Optional[float] = None
+    paradigm: Optional[str] = None
+    is_random: Optional[bool] = None
+    reversible: Optional[bool] = None
+    requires_consensus: Optional[bool] = None
+
+    def flag_constraints(self) -> Tuple[int, int]:
+        """(bits that must be set, bits that must be clear)"""
+        required = cleared = 0
+        for value, bit in ((self.is_random, FLAG_RANDOM), (self.requires_consensus, FLAG_CONSENSUS)):
+            if value is True:
+                required |= bit
+            elif value is False:
+                cleared |= bit
+        if self.reversible is False:
+            required |= FLAG_IRREVERSIBLE
+        elif self.reversible is True:
+            cleared |= FLAG_IRREVERSIBLE
+        return required, cleared
+
+def _entry_flags(entry: Dict[str, Any]) -> int:
+    context = entry.get("context", {})
+    flags = 0
+    if entry.get("is_random_decision"):
+        flags |= FLAG_RANDOM
+    if not context.get("reversible", True):
+        flags |= FLAG_IRREVERSIBLE
+    if context.get("requires_consensus"):
+        flags |= FLAG_CONSENSUS
+    if entry.get("cached"):
+        flags |= FLAG_CACHED
+    return flags
+
+def sidecar_base(segment: Path) -> Path:
+    """Index path prefix of a segment; compressed and plain segments share one index"""
+    for suffix, _ in COMPRESSORS.values():
+        if segment.name.endswith(suffix):
+            return segment.with_name(segment.name[:-len(suffix)])
+    return segment
+
+class SegmentIndex:
+    """Sidecar index of one audit segment (JSON lines or binary format)"""
+
+    def __init__(self, segment: Path, block_rows: int = DEFAULT_BLOCK_ROWS):
+        self.segment = Path(segment)
+        base = sidecar_base(self.segment)
+        self.rows_path = base.with_name(base.name + ".idx")
+        self.meta_path = base.with_name(base.name + ".idx.json")
+        self.compressed = base != self.segment
+        self.block_rows = block_rows
+        self.meta: Dict[str, Any] = self._load_meta()
+
+    def _empty_meta(self) -> Dict[str, Any]:
+        return {"version": INDEX_VERSION, "indexed_bytes": 0, "head_crc": 0, "rows": 0,
+                "block_rows": self.block_rows, "paradigms": [], "blocks": []}
+
+    def _load_meta(self) -> Dict[str, Any]:
+        try:
+            with open(self.meta_path) as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return self._empty_meta()
+        if meta.get("version") != INDEX_VERSION:
+            return self._empty_meta()
+        return meta
+
+    def _save_meta(self) -> None:
+        tmp = self.meta_path.with_name(self.meta_path.name + ".tmp")
+        with open(tmp, 'w') as f:
+            json.dump(self.meta, f)
+        os.replace(tmp, self.meta_path)
+
+    def _is_binary(self) -> bool:
+        with open_segment(self.segment, binary=True) as f:
+            return f.read(len(BINARY_MAGIC)) == BINARY_MAGIC
+
+    def update(self) -> int:
+        """Index records appended since the last update, returns the number of new rows"""
+        if self.compressed:
+            if self.meta["indexed_bytes"]:
+                return 0  # Rotated segments never change
+            with open_segment(self.segment, binary=True) as f:
+                return self._index(f.read())
+        try:
+            with open(self.segment, 'rb') as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    return self._index(b"")
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                    return self._index(data)
+        except FileNotFoundError:
+            return 0  # Rotated away between listing and indexing
+
+    def _index(self, data) -> int:
+        meta = self.meta
+        head = min(_HEAD_BYTES, meta["indexed_bytes"])
+        if len(data) < meta["indexed_bytes"] or zlib.crc32(data[:head]) != meta["head_crc"]:
+            # The file was replaced (e.g. rotated away); start over
+            meta = self.meta = self._empty_meta()
+        if len(data) == meta["indexed_bytes"]:
+            return 0
+
+        rows: List[bytes] = []
+        if data[:len(BINARY_MAGIC)] == BINARY_MAGIC:
+            with BinaryAuditReader(bytes(data) if self.compressed else self.segment) as reader:
+                for position in range(meta["rows"], len(reader)):
+                    rows.append(self._row(reader.record(position), position))
+            indexed_bytes = len(data)
+        else:
+            position = meta["indexed_bytes"]
+            while True:
+                end = data.find(b"\n", position)
+                if end < 0:
+                    break  # Incomplete trailing line, indexed next time
+                line = data[position:end]
+                if line.strip():
+                    rows.append(self._row(json.loads(line), position))
+                position = end + 1
+            indexed_bytes = position
+
+        with open(self.rows_path, 'ab') as f:
+            # Drop rows written after the last saved metadata (interrupted update)
+            f.truncate(meta["rows"] * _ROW.size)
+            f.write(b"".join(rows))
+        self._extend_blocks(rows)
+        meta["rows"] += len(rows)
+        meta["indexed_bytes"] = indexed_bytes
+        meta["head_crc"] = zlib.crc32(data[:min(_HEAD_BYTES, indexed_bytes)])
+        self._save_meta()
+        return len(rows)
+
+    def _row(self, entry: Dict[str, Any], position: int) -> bytes:
+        paradigms = self.meta["paradigms"]
+        mask = 0
+        for model in entry.get("models_used", []):
+            name = model.get("paradigm")
+            if name not in paradigms:
+                paradigms.append(name)
+            bit = paradigms.index(name)
+            mask |= (1 << bit) if bit < 31 else _OVERFLOW_BIT
+        return _ROW.pack(entry.get("timestamp", 0.0), position, _entry_flags(entry), mask)
+
+    def _extend_blocks(self, rows: List[bytes]) -> None:
+        blocks = self.meta["blocks"]
+        block_rows = self.meta["block_rows"]
+        for timestamp, _, flags, mask in (_ROW.unpack(row) for row in rows):
+            if not blocks or blocks[-1][3] >= block_rows:
+                first_row = blocks[-1][2] + blocks[-1][3] if blocks else 0
+                blocks.append([timestamp, timestamp, first_row, 0, 0, 0xFF, 0])
+            block = blocks[-1]
+            block[0] = min(block[0], timestamp)
+            block[1] = max(block[1], timestamp)
+            block[3] += 1
+            block[4] |= flags
+            block[5] &= flags
+            block[6] |= mask
+
+    def _block_may_match(self, block: List[Any], query: AuditFilter, required: int, cleared: int,
+                         paradigm_mask: int) -> bool:
+        min_ts, max_ts, _, _, flags_any, flags_all, mask = block
+        if query.start is not None and max_ts < query.start:
+            return False
+        if query.end is not None and min_ts > query.end:
+            return False
+        if required & ~flags_any or cleared & flags_all:
+            return False
+        return not paradigm_mask or bool(mask & paradigm_mask)
+
+    def _paradigm_mask(self, paradigm: Optional[str]) -> int:
+        if paradigm is None:
+            return 0
+        paradigms = self.meta["paradigms"]
+        if paradigm not in paradigms:
+            return -1  # Never used in this segment
+        bit = paradigms.index(paradigm)
+        return (1 << bit) if bit < 31 else _OVERFLOW_BIT
+
+    def matching_rows(self, query: AuditFilter) -> Iterator[Tuple[float, int, int, int]]:
+        """Index rows (timestamp, position, flags, paradigm mask) passing the filter
+
+        Rows of paradigms sharing the overflow bit still need verification
+        against the entry (see needs_verification).
+        """
+        paradigm_mask = self._paradigm_mask(query.paradigm)
+        if paradigm_mask == -1 or not self.meta["rows"]:
+            return
+        required, cleared = query.flag_constraints()
+        blocks = [b for b in self.meta["blocks"] if self._block_may_match(b, query, required, cleared, paradigm_mask)]
+        if not blocks:
+            return
+
+        with open(self.rows_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as rows:
+            for block in blocks:
+                start = block[2] * _ROW.size
+                for row in _ROW.iter_unpack(rows[start:start + block[3] * _ROW.size]):
+                    timestamp, _, flags, mask = row
+                    if query.start is not None and timestamp < query.start:
+                        continue
+                    if query.end is not None and timestamp > query.end:
+                        continue
+                    if flags & required != required or flags & cleared:
+                        continue
+                    if paradigm_mask and not mask & paradigm_mask:
+                        continue
+                    yield row
+
+    def needs_verification(self, query: AuditFilter) -> bool:
+        return self._paradigm_mask(query.paradigm) == _OVERFLOW_BIT
+
+    def load_entries(self, positions: List[int]) -> Iterator[Dict[str, Any]]:
+        """Decode only the entries at the given index positions"""
+        if not positions:
+            return
+        if self._is_binary():
+            with BinaryAuditReader(self.segment) as reader:
+                for position in positions:
+                    yield reader.record(position)
+        elif self.compressed:
+            with open_segment(self.segment, binary=True) as f:
+                data = f.read()
+            for position in positions:
+                yield json.loads(data[position:data.find(b"\n", position)])
+        else:
+            with open(self.segment, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                for position in positions:
+                    yield json.loads(data[position:data.find(b"\n", position)])
+
+def _entry_has_paradigm(entry: Dict[str, Any], paradigm: str) -> bool:
+    return any(m.get("paradigm") == paradigm for m in entry.get("models_used", []))
+
+class AuditQueryEngine:
+    """Range and filter queries over all audit_<entity>.log files of a directory"""
+
+    def __init__(self, directory: Union[str, Path] = ".", pattern: str = "audit_*.log",
+                 block_rows: int = DEFAULT_BLOCK_ROWS):
+        self.directory = Path(directory)
+        self.pattern = pattern
+        self.block_rows = block_rows
+        self._indexes: Dict[Path, SegmentIndex] = {}
+
+    def logs(self) -> Dict[str, Path]:
+        """Entity id -> active log file"""
+        prefix, _, suffix = self.pattern.partition("*")
+        found = {}
+        for path in sorted(self.directory.iterdir()):
+            if fnmatch.fnmatch(path.name, self.pattern) and path.is_file():
+                found[path.name[len(prefix):len(path.name) - len(suffix)]] = path
+        return found
+
+    def entities(self) -> List[str]:
+        return list(self.logs())
+
+    def _segment_indexes(self, entity: Optional[Union[str, Iterable[str]]]) -> Iterator[Tuple[str, SegmentIndex]]:
+        wanted = None if entity is None else ({entity} if isinstance(entity, str) else set(entity))
+        for entity_id, log_file in self.logs().items():
+            if wanted is not None and entity_id not in wanted:
+                continue
+            for segment in list_segments(str(log_file)):
+                index = self._indexes.get(segment)
+                if index is None:
+                    index = self._indexes[segment] = SegmentIndex(segment, self.block_rows)
+                index.update()
+                yield entity_id, index
+
+    def select(self, entity: Optional[Union[str, Iterable[str]]] = None, limit: Optional[int] = None,
+               **filters) -> Iterator[Dict[str, Any]]:
+        """Matching entries (with an added "entity" key), segment by segment in log order"""
+        query = AuditFilter(**filters)
+        returned = 0
+        for entity_id, index in self._segment_indexes(entity):
+            positions = [row[1] for row in index.matching_rows(query)]
+            verify = index.needs_verification(query)
+            for entry in index.load_entries(positions):
+                if verify and not _entry_has_paradigm(entry, query.paradigm):
+                    continue
+                entry["entity"] = entity_id
+                yield entry
+                returned += 1
+                if limit is not None and returned >= limit:
+                    return
+
+    def count(self, entity: Optional[Union[str, Iterable[str]]] = None, **filters) -> int:
+        """Number of matching entries, answered from the index"""
+        return sum(bucket["decisions"] for bucket in self.time_buckets(None, entity, **filters).values())
+
+    def time_buckets(self, bucket_seconds: Optional[float] = 3600,
+                     entity: Optional[Union[str, Iterable[str]]] = None,
+                     **filters) -> Dict[float, Dict[str, int]]:
+        """Decision, random and irreversible counts per time bucket (bucket start -> counts)
+
+        bucket_seconds=None puts everything into a single bucket 0.0.
+        """
+        query = AuditFilter(**filters)
+        buckets: Dict[float, Dict[str, int]] = {}
+        for _, index in self._segment_indexes(entity):
+            if index.needs_verification(query):
+                rows = [(entry["timestamp"], _entry_flags(entry)) for entry in
+                        index.load_entries([row[1] for row in index.matching_rows(query)])
+                        if _entry_has_paradigm(entry, query.paradigm)]
+            else:
+                rows = [(row[0], row[2]) for row in index.matching_rows(query)]
+            for timestamp, flags in rows:
+                start = timestamp - timestamp % bucket_seconds if bucket_seconds else 0.0
+                bucket = buckets.get(start)
+                if bucket is None:
+                    bucket = buckets[start] = {"decisions": 0, "random": 0, "irreversible": 0}
+                bucket["decisions"] += 1
+                bucket["random"] += bool(flags & FLAG_RANDOM)
+                bucket["irreversible"] += bool(flags & FLAG_IRREVERSIBLE)
+        return dict(sorted(buckets.items()))
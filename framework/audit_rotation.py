@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+framework/audit_rotation.py - Rotation und Kompression von Audit-Logs
+Größen- oder zeitbasierte Rotation, Kompression im Hintergrund
+
+Rotierte Segmente heißen ``<log_file>.<seq>`` (6-stellig, aufsteigend) und
+nach der Kompression ``<log_file>.<seq>.gz`` bzw. ``.xz``. Die aktive Datei
+behält ihren Namen und ist immer das jüngste Segment.
+"""
+
+import gzip
+import logging
+import lzma
+import os
+import re
+import shutil
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import IO, Callable, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+COMPRESSORS = {
+    "gzip": (".gz", gzip.open),
+    "lzma": (".xz", lzma.open),
+}
+
+def _segment_pattern(log_file: Path) -> 're.Pattern':
+    return re.compile(re.escape(log_file.name) + r"\.(\d+)(\.gz|\.xz)?$")
+
+def list_segments(log_file: str) -> List[Path]:
+    """All segments of an audit log, oldest first, ending with the active file
+
+    A segment that exists both compressed and uncompressed (compression
+    just finished) is listed once, as the compressed file.
+    """
+    path = Path(log_file)
+    pattern = _segment_pattern(path)
+    rotated = {}
+    directory = path.parent if str(path.parent) else Path(".")
+    if directory.exists():
+        for candidate in directory.iterdir():
+            match = pattern.match(candidate.name)
+            if not match:
+                continue
+            seq = int(match.group(1))
+            if match.group(2) or seq not in rotated:
+                rotated[seq] = candidate
+    segments = [rotated[seq] for seq in sorted(rotated)]
+    if path.exists():
+        segments.append(path)
+    return segments
+
+def next_segment_seq(log_file: str) -> int:
+    """Sequence number the active file gets at its next rotation"""
+    pattern = _segment_pattern(Path(log_file))
+    existing = [int(pattern.match(p.name).group(1)) for p in list_segments(log_file) if pattern.match(p.name)]
+    return max(existing, default=0) + 1
+
+def segment_path(log_file: str, seq: int) -> Optional[Path]:
+    """Existing rotated segment with the given sequence number (plain or compressed)"""
+    plain = Path(log_file).with_name(f"{Path(log_file).name}.{seq:06d}")
+    for candidate in [plain] + [plain.with_name(plain.name + suffix) for suffix, _ in COMPRESSORS.values()]:
+        if candidate.exists():
+            return candidate
+    return None
+
+def open_segment(segment: Path, binary: bool = False) -> IO:
+    """Open a plain or compressed segment for reading text (or bytes)"""
+    mode = 'rb' if binary else 'rt'
+    for suffix, opener in COMPRESSORS.values():
+        if segment.name.endswith(suffix):
+            return opener(segment, mode)
+    try:
+        return open(segment, 'rb' if binary else 'r')
+    except FileNotFoundError:
+        # Compression finished between listing and opening
+        for suffix, opener in COMPRESSORS.values():
+            compressed = segment.with_name(segment.name + suffix)
+            if compressed.exists():
+                return opener(compressed, mode)
+        raise
+
+def iter_log_lines(log_file: str) -> Iterator[str]:
+    """Yield every line of an audit log across all rotated segments in order"""
+    for segment in list_segments(log_file):
+        with open_segment(segment) as f:
+            yield from f
+
+class SegmentRotator:
+    """Decides when the active audit file rotates and compresses old segments
+
+    Rotation itself is a rename of the active file; compression runs on a
+    background thread so writers never wait for it. on_rotated is called on
+    that thread with the final (compressed) segment path.
+    """
+
+    def __init__(self, log_file: str, max_bytes: Optional[int] = None,
+                 interval: Optional[float] = None, compression: Optional[str] = "gzip",
+                 on_rotated: Optional[Callable[[Path], None]] = None):
+        if compression is not None and compression not in COMPRESSORS:
+            raise ValueError(f"Unknown compression: {compression} (expected one of {list(COMPRESSORS)})")
+        self.log_file = Path(log_file)
+        self.max_bytes = max_bytes
+        self.interval = interval
+        self.compression = compression
+        self.on_rotated = on_rotated
+        self.size = self.log_file.stat().st_size if self.log_file.exists() else 0
+        self.segment_started = time.time()
+        self._next_seq = next_segment_seq(log_file)
+        self._compressor: Optional[ThreadPoolExecutor] = None
+        self._pending: List[Future] = []
+        self._lock = threading.Lock()
+
+    @property
+    def next_seq(self) -> int:
+        """Sequence number the active file gets at its rotation"""
+        return self._next_seq
+
+    def should_rotate(self, incoming_bytes: int) -> bool:
+        """True if the active segment must rotate before appending incoming_bytes"""
+        if self.size == 0:
+            return False
+        if self.max_bytes is not None and self.size + incoming_bytes > self.max_bytes:
+            return True
+        return self.interval is not None and time.time() - self.segment_started >= self.interval
+
+    def record_write(self, written_bytes: int) -> None:
+        self.size += written_bytes
+
+    def rotate(self) -> Optional[Path]:
+        """Rename the active file to the next segment and schedule its compression
+
+        The caller must have closed its handle on the active file (or must
+        reopen it afterwards).
+        """
+        with self._lock:
+            if not self.log_file.exists():
+                return None
+            segment = self.log_file.with_name(f"{self.log_file.name}.{self._next_seq:06d}")
+            os.replace(self.log_file, segment)
+            self._next_seq += 1
+            self.size = 0
+            self.segment_started = time.time()
+
+            if self.compression is not None or self.on_rotated is not None:
+                if self._compressor is None:
+                    self._compressor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="audit-compress")
+                self._pending = [f for f in self._pending if not f.done()]
+                self._pending.append(self._compressor.submit(self._finish_segment, segment))
+        logger.info(f"Audit log rotated: {segment}")
+        return segment
+
+    def wait(self) -> None:
+        """Block until all scheduled compressions are finished"""
+        with self._lock:
+            pending, self._pending = self._pending, []
+        for future in pending:
+            future.result()
+
+    def _finish_segment(self, segment: Path) -> Path:
+        if self.compression is not None:
+            segment = self._compress(segment)
+        if self.on_rotated is not None:
+            self.on_rotated(segment)
+        return segment
+
+    def _compress(self, segment: Path) -> Path:
+        suffix, opener = COMPRESSORS[self.compression]
+        target = segment.with_name(segment.name + suffix)
+        tmp = target.with_name(target.name + ".tmp")
+        try:
+            with open(segment, 'rb') as src, opener(tmp, 'wb') as dst:
+                shutil.copyfileobj(src, dst, 1 << 20)
+            os.replace(tmp, target)
+            os.remove(segment)
+        except OSError as e:
+            logger.error(f"Compression of {segment} failed: {e}")
+            raise
+        return target
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+framework/audit_sampling.py - Adaptive Stichproben für Audit-Logs
+Pflicht-Entscheidungen werden immer geloggt, Routine-Entscheidungen nach Rate
+
+Immer geloggt werden zufällige Entscheidungen (5%-Regel), ethische
+Alternativen, Entscheidungen mit Konsens-Pflicht (auch durch kritische
+Begriffe oder hohe Dringlichkeit markiert) oder Konsens-Ergebnis und
+irreversible Entscheidungen. Für verworfene Routine-Entscheidungen führt
+die Policy exakte Zähler (nach Aktionstyp und Paradigma), damit die
+Gesamtzahlen prüfbar bleiben. save() addiert die Zähler zu denen in der
+Datei, damit die Summen Neustarts und mehrere Prozesse überdauern.
+"""
+
+import json
+import os
+import random
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows: no advisory locks, saves from one process only
+    fcntl = None
+
+KEEP_RANDOM = "random"
+KEEP_ETHICAL_ALTERNATIVE = "ethical_alternative"
+KEEP_CONSENSUS = "consensus"
+KEEP_IRREVERSIBLE = "irreversible"
+
+COUNTERS = ("seen", "logged", "dropped", "dropped_cached")
+COUNTER_MAPS = ("kept", "dropped_by_type", "dropped_by_paradigm")
+
+def _subtract(summary: Dict[str, Any], saved: Dict[str, Any]) -> Dict[str, Any]:
+    """Counters of summary that are not yet in saved"""
+    delta = dict(summary)
+    for name in COUNTERS:
+        delta[name] = summary[name] - saved.get(name, 0)
+    for name in COUNTER_MAPS:
+        before = saved.get(name, {})
+        delta[name] = {key: count - before.get(key, 0) for key, count in summary[name].items()}
+    return delta
+
+def merge_summaries(total: Dict[str, Any], delta: Dict[str, Any]) -> Dict[str, Any]:
+    """Add the counters of delta to total, the rates are taken from delta"""
+    merged = dict(delta)
+    for name in COUNTERS:
+        merged[name] = total.get(name, 0) + delta[name]
+    for name in COUNTER_MAPS:
+        counts = dict(total.get(name, {}))
+        for key, count in delta[name].items():
+            counts[key] = counts.get(key, 0) + count
+        merged[name] = counts
+    firsts = [t for t in (total.get("dropped_first"), delta["dropped_first"]) if t is not None]
+    lasts = [t for t in (total.get("dropped_last"), delta["dropped_last"]) if t is not None]
+    merged["dropped_first"] = min(firsts) if firsts else None
+    merged["dropped_last"] = max(lasts) if lasts else None
+    return merged
+
+class AuditSamplingPolicy:
+    """Decides per decision whether it reaches the audit log
+
+    routine_rate is the share of routine decisions that is logged. With
+    target_per_second the rate adapts per one-second window so at most about
+    that many routine records per second are logged (never above
+    routine_rate).
+    """
+
+    def __init__(self, routine_rate: float = 0.1, target_per_second: Optional[float] = None,
+                 always_keep_types: Iterable[str] = ("ethical_alternative",),
+                 seed: Optional[int] = None, clock: Callable[[], float] = time.monotonic):
+        if not 0.0 <= routine_rate <= 1.0:
+            raise ValueError(f"routine_rate must be between 0 and 1, got {routine_rate}")
+        self.routine_rate = routine_rate
+        self.target_per_second = target_per_second
+        self.always_keep_types = frozenset(always_keep_types)
+        self.clock = clock
+        self.current_rate = routine_rate
+        self._rng = random.Random(seed)
+        self._window_start = clock()
+        self._window_routine = 0
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """Start a new counting period"""
+        # Summary already added to each file by save(), per path
+        self._saved: Dict[str, Dict[str, Any]] = {}
+        self.seen = 0
+        self.kept: Dict[str, int] = {KEEP_RANDOM: 0, KEEP_ETHICAL_ALTERNATIVE: 0,
+                                     KEEP_CONSENSUS: 0, KEEP_IRREVERSIBLE: 0, "sampled": 0}
+        self.dropped = 0
+        self.dropped_by_type: Dict[str, int] = {}
+        self.dropped_by_paradigm: Dict[str, int] = {}
+        self.dropped_cached = 0
+        self.dropped_first: Optional[float] = None
+        self.dropped_last: Optional[float] = None
+
+    def mandatory_reason(self, context: Any, action: Any, is_random: bool = False,
+                         consensus_result: Any = None) -> Optional[str]:
+        """Why a decision must always be logged, None for routine decisions"""
+        if is_random:
+            return KEEP_RANDOM
+        if isinstance(action, dict) and action.get("type") in self.always_keep_types:
+            return KEEP_ETHICAL_ALTERNATIVE
+        metadata = getattr(context, "metadata", None) or {}
+        if (consensus_result is not None or getattr(context, "requires_consensus", False)
+                or metadata.get("consensus_required")):
+            return KEEP_CONSENSUS
+        if not getattr(context, "reversible", True):
+            return KEEP_IRREVERSIBLE
+        return None
+
+    def should_log(self, context: Any, action: Any, models_used: Iterable[Any] = (),
+                   is_random: bool = False, consensus_result: Any = None, cached: bool = False) -> bool:
+        """Count the decision and decide whether to write it"""
+        reason = self.mandatory_reason(context, action, is_random, consensus_result)
+        with self.lock:
+            self.seen += 1
+            if reason is not None:
+                self.kept[reason] += 1
+                return True
+
+            self._adapt()
+            self._window_routine += 1
+            if self._rng.random() < self.current_rate:
+                self.kept["sampled"] += 1
+                return True
+
+            self.dropped += 1
+            action_type = action.get("type", "unknown") if isinstance(action, dict) else type(action).__name__
+            self.dropped_by_type[action_type] = self.dropped_by_type.get(action_type, 0) + 1
+            for model in models_used:
+                paradigm = getattr(model.paradigm, "value", model.paradigm)
+                self.dropped_by_paradigm[paradigm] = self.dropped_by_paradigm.get(paradigm, 0) + 1
+            if cached:
+                self.dropped_cached += 1
+            now = time.time()
+            if self.dropped_first is None:
+                self.dropped_first = now
+            self.dropped_last = now
+            return False
+
+    def _adapt(self) -> None:
+        if self.target_per_second is None:
+            return
+        now = self.clock()
+        elapsed = now - self._window_start
+        if elapsed >= 1.0:
+            observed = self._window_routine / elapsed
+            self.current_rate = min(self.routine_rate, self.target_per_second / observed) if observed else self.routine_rate
+            self._window_start = now
+            self._window_routine = 0
+
+    def summary(self) -> Dict[str, Any]:
+        """Exact counters since the last reset"""
+        with self.lock:
+            return {
+                "seen": self.seen,
+                "logged": sum(self.kept.values()),
+                "kept": dict(self.kept),
+                "dropped": self.dropped,
+                "dropped_by_type": dict(self.dropped_by_type),
+                "dropped_by_paradigm": dict(self.dropped_by_paradigm),
+                "dropped_cached": self.dropped_cached,
+                "dropped_first": self.dropped_first,
+                "dropped_last": self.dropped_last,
+                "routine_rate": self.routine_rate,
+                "current_rate": self.current_rate
+            }
+
+    def save(self, path: str) -> None:
+        """Add the counters not yet saved to the summary in path (e.g. next to the audit log)
+
+        The file keeps the totals across restarts and processes; it is
+        rewritten atomically under an advisory lock on path + ".lock".
+        """
+        with open(f"{path}.lock", 'w') as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            summary = self.summary()
+            total: Dict[str, Any] = {}
+            if os.path.exists(path):
+                with open(path) as f:
+                    total = json.load(f)
+            merged = merge_summaries(total, _subtract(summary, self._saved.get(path, {})))
+            tmp = f"{path}.{os.getpid()}.tmp"
+            with open(tmp, 'w') as f:
+                json.dump(merged, f, indent=2)
+            os.replace(tmp, path)
+            self._saved[path] = summary
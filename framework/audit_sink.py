@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+framework/audit_sink.py - Gemeinsamer Audit-Sink für viele KIs und Prozesse
+Ein Writer-Thread, gespeist über eine multiprocessing-Queue, partitionierter Speicher
+
+Statt einer Datei pro KI schreiben alle KIs in ``partitions`` Dateien
+``<directory>/shard_<n>.log``; die Partition ergibt sich aus crc32(entity_id).
+Jeder Eintrag erhält das Feld ``entity_id``, Leser filtern damit innerhalb
+der einen Partition der gesuchten KI.
+"""
+
+import atexit
+import itertools
+import json
+import logging
+import multiprocessing
+import os
+import queue
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Dict, IO, Iterable, Iterator, List, Optional, Union
+
+try:
+    from .audit_rotation import iter_log_lines
+    from .serialization import Serializer, get_serializer
+except ImportError:  # Imported as top-level module with framework/ on sys.path
+    from audit_rotation import iter_log_lines
+    from serialization import Serializer, get_serializer
+
+logger = logging.getLogger(__name__)
+
+STORE_META = "sink.json"
+
+_FLUSH = "__flush__"
+_STOP = "__stop__"
+
+def partition_of(entity_id: str, partitions: int) -> int:
+    """Stable partition number of an entity (identical in every process)"""
+    return zlib.crc32(entity_id.encode("utf-8")) % partitions
+
+def partition_path(directory: Union[str, Path], entity_id: str, partitions: int) -> Path:
+    return Path(directory) / f"shard_{partition_of(entity_id, partitions):03d}.log"
+
+class SinkClient:
+    """Picklable producer handle of a SharedAuditSink
+
+    Hand it to worker processes via Process(args=...) or a pool
+    initializer; multiprocessing queues cannot travel as task arguments.
+    """
+
+    def __init__(self, queue_: 'multiprocessing.Queue', directory: str, partitions: int):
+        self.queue = queue_
+        self.directory = directory
+        self.partitions = partitions
+
+    def submit(self, entity_id: str, entries: List[Dict[str, Any]]) -> None:
+        self.queue.put((entity_id, entries))
+
+    def partition_path(self, entity_id: str) -> Path:
+        return partition_path(self.directory, entity_id, self.partitions)
+
+    def flush(self) -> None:
+        """Ask the writer to write pending records now (does not wait across processes)"""
+        self.queue.put((_FLUSH, None))
+
+class SharedAuditSink(SinkClient):
+    """Single writer thread appending the audit records of many AIs to a partitioned store
+
+    Records are grouped per partition and written in batches through
+    persistent file handles, so the number of open files and append calls
+    is bounded by the partition count instead of the number of AIs.
+    serializer encodes the records (see serialization). A record that
+    cannot be encoded or written is logged and skipped, the writer keeps
+    running and the failure is raised by the next flush() or close().
+    """
+
+    def __init__(self, directory: Union[str, Path] = "audit", partitions: int = 16,
+                 flush_interval: float = 0.2, batch_size: int = 1000, max_queue: int = 100000,
+                 fsync: bool = False, mp_context: Optional[Any] = None,
+                 serializer: Union[str, Serializer] = "json"):
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        meta_path = directory / STORE_META
+        if meta_path.exists():
+            with open(meta_path) as f:
+                existing = json.load(f)["partitions"]
+            if existing != partitions:
+                raise ValueError(f"Audit store {directory} uses {existing} partitions, not {partitions}")
+        else:
+            with open(meta_path, 'w') as f:
+                json.dump({"partitions": partitions}, f)
+
+        context = mp_context or multiprocessing.get_context()
+        super().__init__(context.Queue(maxsize=max_queue), str(directory), partitions)
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.fsync = fsync
+        self.serializer = get_serializer(serializer)
+        self.records_written = 0
+        self.batches_written = 0
+        self.records_failed = 0
+        self._error: Optional[BaseException] = None
+
+        self._files: Dict[int, IO[str]] = {}
+        self._flush_events: Dict[int, threading.Event] = {}
+        self._flush_tokens = itertools.count()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name=f"audit-sink-{directory.name}", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def __getstate__(self):
+        raise TypeError("SharedAuditSink stays in its process; pass sink.client() to workers")
+
+    def client(self) -> SinkClient:
+        """Producer handle for worker processes"""
+        return SinkClient(self.queue, self.directory, self.partitions)
+
+    def flush(self) -> None:
+        """Write all records queued so far and wait until they are written"""
+        if self._closed:
+            return
+        token = next(self._flush_tokens)
+        event = self._flush_events[token] = threading.Event()
+        self.queue.put((_FLUSH, token))
+        event.wait()
+        self._raise_error()
+
+    def close(self) -> None:
+        """Write remaining records, stop the writer thread and close all partitions"""
+        if self._closed:
+            return
+        self._closed = True
+        self.queue.put((_STOP, None))
+        self._thread.join()
+        self.queue.close()
+        self.queue.join_thread()
+        atexit.unregister(self.close)
+        self._raise_error()
+
+    def _raise_error(self) -> None:
+        """Raise the first write failure since the last report"""
+        error, failed = self._error, self.records_failed
+        if error is None:
+            return
+        self._error = None
+        raise RuntimeError(f"Audit records for {self.directory} could not be written "
+                           f"({failed} failed so far): {error}") from error
+
+    def _fail(self, error: BaseException, records: int) -> None:
+        logger.error(f"{records} audit records for {self.directory} could not be written: {error}")
+        self.records_failed += records
+        if self._error is None:
+            self._error = error
+
+    def _run(self) -> None:
+        pending: Dict[int, List[str]] = {}
+        pending_count = 0
+        deadline = None
+        waiting: List[int] = []
+        stopping = False
+
+        while not stopping:
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                entity_id, payload = self.queue.get(timeout=timeout)
+            except queue.Empty:
+                entity_id = payload = None
+
+            force = entity_id is None
+            if entity_id == _STOP:
+                stopping = force = True
+            elif entity_id == _FLUSH:
+                force = True
+                if payload is not None:
+                    waiting.append(payload)
+            elif entity_id is not None:
+                pending_count += self._encode(entity_id, payload, pending)
+                if deadline is None and pending_count:
+                    deadline = time.monotonic() + self.flush_interval
+
+            if pending_count and (force or pending_count >= self.batch_size):
+                try:
+                    self._write_partitions(pending)
+                except Exception as e:  # Never let a bad batch kill the writer thread
+                    self._fail(e, pending_count)
+                pending = {}
+                pending_count = 0
+                deadline = None
+            for token in waiting:
+                self._flush_events.pop(token).set()
+            waiting = []
+
+        for f in self._files.values():
+            f.close()
+        self._files.clear()
+
+    def _encode(self, entity_id: str, entries: List[Dict[str, Any]], pending: Dict[int, List[str]]) -> int:
+        """Encode record by record into the pending lines of the partition, returns the count encoded"""
+        try:
+            lines = pending.setdefault(partition_of(entity_id, self.partitions), [])
+            entries = list(entries)
+        except Exception as e:
+            self._fail(e, 1)
+            return 0
+        dumps = self.serializer.dumps
+        encoded = 0
+        for entry in entries:
+            try:
+                entry["entity_id"] = entity_id
+                lines.append(dumps(entry) + '\n')
+            except Exception as e:
+                self._fail(e, 1)
+            else:
+                encoded += 1
+        return encoded
+
+    def _write_partitions(self, pending: Dict[int, List[str]]) -> None:
+        for partition, lines in pending.items():
+            try:
+                f = self._files.get(partition)
+                if f is None:
+                    f = self._files[partition] = open(Path(self.directory) / f"shard_{partition:03d}.log", 'a')
+                f.write(''.join(lines))
+                f.flush()
+                if self.fsync:
+                    os.fsync(f.fileno())
+                self.records_written += len(lines)
+            except Exception as e:
+                self._fail(e, len(lines))
+        self.batches_written += 1
+
+def store_partitions(directory: Union[str, Path]) -> int:
+    """Partition count of an existing shared audit store"""
+    with open(Path(directory) / STORE_META) as f:
+        return json.load(f)["partitions"]
+
+def iter_entity_entries(directory: Union[str, Path], entity_ids: Union[str, Iterable[str]]) -> Iterator[Dict[str, Any]]:
+    """Entries of the given AI(s), reading only their partitions"""
+    wanted = {entity_ids} if isinstance(entity_ids, str) else set(entity_ids)
+    partitions = store_partitions(directory)
+    paths = sorted({partition_path(directory, entity_id, partitions) for entity_id in wanted})
+    for path in paths:
+        for line in iter_log_lines(str(path)):
+            # Cheap pre-check before parsing lines of other AIs sharing the partition
+            if not any(entity_id in line for entity_id in wanted):
+                continue
+            entry = json.loads(line)
+            if entry.get("entity_id") in wanted:
+                yield entry
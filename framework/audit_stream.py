@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+framework/audit_stream.py - Live-Abonnements und tail() für Audit-Logs
+Begrenzte Queues mit Drop-Oldest-Policy und ein Generator, der rotierten Dateien folgt
+"""
+
+import json
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Optional
+
+try:
+    from .audit_rotation import next_segment_seq, open_segment, segment_path
+except ImportError:  # Imported as top-level module with framework/ on sys.path
+    from audit_rotation import next_segment_seq, open_segment, segment_path
+
+Entry = Dict[str, Any]
+
+class AuditSubscription:
+    """Bounded queue of new audit records for one subscriber
+
+    When the subscriber falls behind, the oldest undelivered records are
+    dropped (counted in dropped) so publishing never blocks the decision
+    path. Records are shared with the logger and must not be modified.
+    """
+
+    def __init__(self, maxsize: int = 1000, predicate: Optional[Callable[[Entry], bool]] = None):
+        self.maxsize = maxsize
+        self.predicate = predicate
+        self.delivered = 0
+        self.dropped = 0
+        self.closed = False
+        self._queue: Deque[Entry] = deque(maxlen=maxsize)
+        self._ready = threading.Condition()
+
+    def publish(self, entries: Iterable[Entry]) -> None:
+        with self._ready:
+            if self.closed:
+                return
+            for entry in entries:
+                if self.predicate is not None and not self.predicate(entry):
+                    continue
+                if len(self._queue) == self.maxsize:
+                    self.dropped += 1
+                self._queue.append(entry)
+            self._ready.notify_all()
+
+    def get(self, timeout: Optional[float] = None) -> Optional[Entry]:
+        """Next record, or None after timeout / once closed and empty"""
+        with self._ready:
+            if not self._queue and not self.closed:
+                self._ready.wait(timeout)
+            if not self._queue:
+                return None
+            self.delivered += 1
+            return self._queue.popleft()
+
+    def drain(self) -> List[Entry]:
+        """All queued records without waiting"""
+        with self._ready:
+            entries = list(self._queue)
+            self._queue.clear()
+            self.delivered += len(entries)
+            return entries
+
+    def close(self) -> None:
+        with self._ready:
+            self.closed = True
+            self._ready.notify_all()
+
+    def __iter__(self) -> Iterator[Entry]:
+        """Blocking iteration until the subscription is closed"""
+        while True:
+            entry = self.get()
+            if entry is None:
+                if self.closed:
+                    return
+                continue
+            yield entry
+
+class AuditPublisher:
+    """Fan-out of new audit records to all subscriptions"""
+
+    def __init__(self):
+        self.subscriptions: List[AuditSubscription] = []
+        self._lock = threading.Lock()
+
+    def subscribe(self, maxsize: int = 1000,
+                  predicate: Optional[Callable[[Entry], bool]] = None) -> AuditSubscription:
+        subscription = AuditSubscription(maxsize, predicate)
+        with self._lock:
+            # Copy-on-write so publish() can iterate without the lock
+            self.subscriptions = self.subscriptions + [subscription]
+        return subscription
+
+    def unsubscribe(self, subscription: AuditSubscription) -> None:
+        subscription.close()
+        with self._lock:
+            self.subscriptions = [s for s in self.subscriptions if s is not subscription]
+
+    def publish(self, entries: List[Entry]) -> None:
+        for subscription in self.subscriptions:
+            subscription.publish(entries)
+
+    def close(self) -> None:
+        with self._lock:
+            subscriptions, self.subscriptions = self.subscriptions, []
+        for subscription in subscriptions:
+            subscription.close()
+
+def tail(log_file: str, from_start: bool = False, poll_interval: float = 0.25,
+         idle_timeout: Optional[float] = None, stop: Optional[threading.Event] = None) -> Iterator[Entry]:
+    """Follow a JSON-lines audit log like ``tail -F``, yielding parsed records
+
+    Only bytes appended after the last read are read. When the file is
+    rotated away, the old handle is read to its end and segments rotated
+    in the meantime are read once before switching to the new active file,
+    so no record is lost or repeated. Stops after idle_timeout seconds
+    without new records or when stop is set.
+    """
+    handle = None
+    inode = None
+    pending = b""
+    last_data = time.monotonic()
+
+    def open_active(seek_end: bool):
+        try:
+            f = open(log_file, 'rb')
+        except FileNotFoundError:
+            return None, None
+        if seek_end:
+            f.seek(0, os.SEEK_END)
+        return f, os.fstat(f.fileno()).st_ino
+
+    handle, inode = open_active(seek_end=not from_start)
+    # Sequence number the currently open file gets when it is rotated
+    next_seq = next_segment_seq(log_file)
+    try:
+        while stop is None or not stop.is_set():
+            chunk = handle.read() if handle is not None else b""
+            rotated = False
+            if not chunk:
+                # At the end of the current file: was it rotated or (re)created?
+                try:
+                    current = os.stat(log_file).st_ino
+                except FileNotFoundError:
+                    current = None
+                if current is not None and current != inode:
+                    rotated = True
+                    if handle is not None:
+                        # Records written between the last read and the rotation
+                        chunk = handle.read()
+
+            if chunk:
+                last_data = time.monotonic()
+                pending += chunk
+                *lines, pending = pending.split(b"\n")
+                for line in lines:
+                    if line.strip():
+                        yield json.loads(line)
+            if rotated:
+                if handle is not None:
+                    handle.close()
+                    next_seq += 1
+                handle, inode = None, None
+                pending = b""
+                # Catch up on segments that were rotated before we got to them
+                while True:
+                    segment = segment_path(log_file, next_seq)
+                    if segment is not None and (handle is None or os.stat(segment).st_ino != inode):
+                        with open_segment(segment, binary=True) as f:
+                            for line in f:
+                                if line.strip():
+                                    yield json.loads(line)
+                        next_seq += 1
+                    elif handle is None:
+                        handle, inode = open_active(seek_end=False)
+                        if handle is None:
+                            break
+                    else:
+                        break
+            if chunk or rotated:
+                continue
+
+            if idle_timeout is not None and time.monotonic() - last_data >= idle_timeout:
+                return
+            if stop is not None:
+                stop.wait(poll_interval)
+            else:
+                time.sleep(poll_interval)
+    finally:
+        if handle is not None:
+            handle.close()
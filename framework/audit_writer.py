@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+framework/audit_writer.py - Gepufferter Hintergrund-Writer für Audit-Logs
+Group-Commit über eine begrenzte Queue und ein dauerhaft geöffnetes File-Handle
+"""
+
+import atexit
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+try:
+    from .audit_rotation import SegmentRotator, next_segment_seq
+    from .audit_binary import BinaryAuditCodec
+    from .audit_chain import LINE_OVERHEAD, HashChain
+except ImportError:  # Imported as top-level module with framework/ on sys.path
+    from audit_rotation import SegmentRotator, next_segment_seq
+    from audit_binary import BinaryAuditCodec
+    from audit_chain import LINE_OVERHEAD, HashChain
+
+logger = logging.getLogger(__name__)
+
+FSYNC_POLICIES = ("never", "batch", "record")
+
+_FLUSH = object()
+_STOP = object()
+
+class BufferedAuditWriter:
+    """Background thread that drains a bounded queue and appends records in batches
+
+    Records are written once batch_size records are pending or
+    flush_interval seconds after the first pending record, whichever comes
+    first. A full queue blocks the caller so no record is dropped for lack
+    of space. A batch that cannot be written is logged and reported to the
+    caller by the next flush() or close(); the writer keeps running. Records
+    that cannot be encoded are skipped individually, the rest of their batch
+    is still written.
+    fsync: "never" (OS decides), "batch" (once per written batch) or
+    "record" (after every record). An optional SegmentRotator is consulted
+    before each batch. With a BinaryAuditCodec records are written in the
+    binary audit format instead of JSON lines, with a HashChain the JSON
+    lines are hash-chained.
+    """
+
+    def __init__(self, path: str, flush_interval: float = 0.2, max_queue: int = 10000,
+                 batch_size: int = 1000, fsync: str = "never",
+                 encoder: Callable[[Dict[str, Any]], str] = json.dumps,
+                 rotator: Optional[SegmentRotator] = None,
+                 codec: Optional[BinaryAuditCodec] = None,
+                 chain: Optional[HashChain] = None):
+        if fsync not in FSYNC_POLICIES:
+            raise ValueError(f"Unknown fsync policy: {fsync} (expected one of {FSYNC_POLICIES})")
+        self.path = path
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.fsync = fsync
+        self.encoder = encoder
+        self.rotator = rotator
+        self.codec = codec
+        self.chain = chain
+        # Segment number of the active file for chain checkpoints when nothing rotates
+        self._segment = next_segment_seq(path) if chain is not None else 0
+        self.records_written = 0
+        self.batches_written = 0
+        self.records_failed = 0
+        self._error: Optional[BaseException] = None
+
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue)
+        self._mode = 'ab' if codec is not None else 'a'
+        self._file = open(path, self._mode)
+        self._closed = False
+        self._close_lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name=f"audit-writer-{Path(path).name}", daemon=True)
+        self._thread.start()
+        # Flush cleanly at interpreter exit
+        atexit.register(self.close)
+
+    def submit(self, entries: Iterable[Dict[str, Any]]) -> None:
+        """Queue records for writing, blocking while the queue is full"""
+        if self._closed:
+            raise RuntimeError(f"Audit writer for {self.path} is closed")
+        for entry in entries:
+            self._queue.put(entry)
+
+    def flush(self) -> None:
+        """Write all queued records now and wait until they are on disk (per fsync policy)"""
+        if self._closed:
+            return
+        self._queue.put(_FLUSH)
+        self._queue.join()
+        self._raise_error()
+
+    def close(self) -> None:
+        """Write remaining records, stop the thread and close the file"""
+        with self._close_lock:
+            if self._closed:
+                return
+            self._closed = True
+        self._queue.put(_STOP)
+        self._thread.join()
+        self._file.close()
+        atexit.unregister(self.close)
+        self._raise_error()
+
+    def _raise_error(self) -> None:
+        """Raise the first write failure since the last report"""
+        error, failed = self._error, self.records_failed
+        if error is None:
+            return
+        self._error = None
+        raise RuntimeError(f"Audit records for {self.path} could not be written "
+                           f"({failed} failed so far): {error}") from error
+
+    def _run(self) -> None:
+        pending: List[Dict[str, Any]] = []
+        markers = 0
+        deadline = None
+        stopping = False
+
+        while not stopping:
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+
+            force = item is None
+            if item is _STOP:
+                stopping = force = True
+                markers += 1
+            elif item is _FLUSH:
+                force = True
+                markers += 1
+            elif item is not None:
+                pending.append(item)
+                if deadline is None:
+                    deadline = time.monotonic() + self.flush_interval
+
+            if pending and (force or len(pending) >= self.batch_size):
+                try:
+                    self._write_batch(pending)
+                except Exception as e:  # Never let a bad batch kill the writer thread
+                    self._fail(e, len(pending))
+                finally:
+                    for _ in pending:
+                        self._queue.task_done()
+                pending = []
+                deadline = None
+            for _ in range(markers):
+                self._queue.task_done()
+            markers = 0
+
+    def _fail(self, error: BaseException, records: int) -> None:
+        logger.error(f"{records} audit records for {self.path} could not be written: {error}")
+        self.records_failed += records
+        if self._error is None:
+            self._error = error
+
+    def _encode_one(self, entry: Dict[str, Any]) -> Any:
+        if self.codec is not None:
+            return self.codec.encode([entry])
+        if self.chain is not None:
+            return self.encoder(entry)  # Linked into a line once the segment is known
+        return self.encoder(entry) + '\n'
+
+    def _encode(self, entries: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], List[Any]]:
+        """Encode record by record; records that cannot be encoded are reported and skipped"""
+        encoded, lines = [], []
+        for entry in entries:
+            try:
+                lines.append(self._encode_one(entry))
+            except Exception as e:
+                self._fail(e, 1)
+            else:
+                encoded.append(entry)
+        return encoded, lines
+
+    def _write_batch(self, entries: List[Dict[str, Any]]) -> None:
+        entries, lines = self._encode(entries)
+        if not entries:
+            return
+        if self.chain is not None:
+            # Line length does not depend on the hash, link after the rotation decision
+            bodies = lines
+            size = sum(len(body) for body in bodies) + LINE_OVERHEAD * len(bodies)
+        else:
+            size = sum(len(line) for line in lines)
+        try:
+            if self.rotator is not None:
+                if self.rotator.should_rotate(size):
+                    if self.chain is not None:
+                        self.chain.checkpoint()
+                    self._file.close()
+                    self.rotator.rotate()
+                    self._file = open(self.path, self._mode)
+                    if self.codec is not None:
+                        # New segment starts with a fresh header and dictionary
+                        self.codec.reset()
+                        entries, lines = self._encode(entries)
+                        size = sum(len(line) for line in lines)
+                self.rotator.record_write(size)
+            if self.chain is not None:
+                segment = self.rotator.next_seq if self.rotator is not None else self._segment
+                lines = self.chain.link(bodies, segment, os.fstat(self._file.fileno()).st_size)
+            
+            if self.fsync == "record":
+                for line in lines:
+                    self._file.write(line)
+                    self._file.flush()
+                    os.fsync(self._file.fileno())
+            else:
+                self._file.write((b'' if self.codec is not None else '').join(lines))
+                self._file.flush()
+                if self.fsync == "batch":
+                    os.fsync(self._file.fileno())
+        except Exception as e:
+            self._fail(e, len(entries))
+            return
+        self.records_written += len(entries)
+        self.batches_written += 1
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+framework/committee.py - Zufällige Komitees für Abstimmungen in sehr großen KI-Registern
+Reproduzierbare O(k)-Stichprobe, optional geschichtet, mit Konfidenzschranken
+
+Die Ja-Quote der Grundgesamtheit wird aus dem Komitee geschätzt (geschichtet
+gewichtet, mit Endlichkeitskorrektur). Enthaltungen zählen wie beim
+vollständigen Poll nicht als Zustimmung. Für die Varianz wird je Schicht die
+Agresti-Coull-geglättete Quote verwendet, damit einstimmige Komitees keine
+Scheinsicherheit erzeugen.
+"""
+
+import bisect
+import itertools
+import math
+import random
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+def paradigm_mix(ki: Any) -> Hashable:
+    """Stratum of a KI: the set of paradigms of its models"""
+    return tuple(sorted({model.paradigm.value for model in ki.models}))
+
+def lineage(ki: Any) -> Hashable:
+    """Stratum of a KI: the root ancestor of its reproduction lineage"""
+    return ki.lineage_id or ki.entity_id
+
+# Pool of strata that are too small for a seat of their own
+REST_STRATUM = "<rest>"
+
+STRATIFIERS: Dict[str, Callable[[Any], Hashable]] = {
+    "paradigms": paradigm_mix,
+    "lineage": lineage,
+}
+
+class CommitteeIndex:
+    """Registry ids in registration order plus strata per stratifier
+
+    Strata are built on first use and then kept up to date by add(), so
+    drawing a committee never walks the whole registry.
+    """
+
+    def __init__(self):
+        self.ids: List[str] = []
+        self._strata: Dict[str, Dict[Hashable, List[str]]] = {}
+
+    def add(self, ki_id: str, ki: Any) -> None:
+        self.ids.append(ki_id)
+        for name, strata in self._strata.items():
+            strata.setdefault(STRATIFIERS[name](ki), []).append(ki_id)
+
+    def rebuild(self, registry: Dict[str, Any]) -> None:
+        """Re-index after the registry was changed directly"""
+        self.ids = list(registry)
+        self._strata.clear()
+
+    def strata(self, name: str, registry: Dict[str, Any]) -> Dict[Hashable, List[str]]:
+        if name not in STRATIFIERS:
+            raise ValueError(f"Unknown stratifier: {name} (expected one of {list(STRATIFIERS)})")
+        strata = self._strata.get(name)
+        if strata is None:
+            strata = self._strata[name] = {}
+            key = STRATIFIERS[name]
+            for ki_id in self.ids:
+                strata.setdefault(key(registry[ki_id]), []).append(ki_id)
+        return strata
+
+def allocate(sizes: Dict[Hashable, int], k: int) -> Dict[Hashable, int]:
+    """Proportional allocation of k seats to strata (largest remainder)"""
+    population = sum(sizes.values())
+    quotas = {key: k * size / population for key, size in sizes.items()}
+    seats = {key: int(quota) for key, quota in quotas.items()}
+    # Ties broken by stratum order so the allocation is reproducible
+    order = sorted(sizes, key=lambda key: seats[key] - quotas[key])
+    for key in order[:k - sum(seats.values())]:
+        seats[key] += 1
+    return seats
+
+def draw_committee(ids: List[str], k: int, rng: random.Random,
+                   strata: Optional[Dict[Hashable, List[str]]] = None) -> Dict[Hashable, Tuple[int, List[str]]]:
+    """Draw k ids; returns stratum -> (stratum size, drawn ids)
+
+    random.sample draws from a sequence in O(k) when k is small compared to
+    its length, so an unstratified draw costs O(k) and a stratified one
+    O(k + number of strata). Strata too small for a seat of their own are
+    pooled into one remaining stratum.
+    """
+    if strata is None:
+        return {None: (len(ids), rng.sample(ids, k))}
+    population = sum(len(members) for members in strata.values())
+    groups = {key: members for key, members in strata.items() if len(members) * k >= population}
+    small = [members for key, members in strata.items() if key not in groups]
+    sizes = {key: len(members) for key, members in groups.items()}
+    rest_size = sum(len(members) for members in small)
+    if rest_size:
+        sizes[REST_STRATUM] = rest_size
+    seats = allocate(sizes, k)
+
+    committee = {key: (len(members), rng.sample(members, seats[key])) for key, members in groups.items()}
+    if rest_size:
+        # Sample positions in the virtual concatenation of the small strata
+        bounds = list(itertools.accumulate(len(members) for members in small))
+        drawn = []
+        for position in rng.sample(range(rest_size), seats[REST_STRATUM]):
+            index = bisect.bisect_right(bounds, position)
+            drawn.append(small[index][position - (bounds[index - 1] if index else 0)])
+        committee[REST_STRATUM] = (rest_size, drawn)
+    return committee
+
+def _normal_cdf(x: float) -> float:
+    return 0.5 * (1.0 + math.erf(x / math.sqrt(2.0)))
+
+def _z_score(confidence: float) -> float:
+    """Two-sided normal quantile by bisection"""
+    target = 0.5 + confidence / 2
+    low, high = 0.0, 10.0
+    for _ in range(60):
+        middle = (low + high) / 2
+        if _normal_cdf(middle) < target:
+            low = middle
+        else:
+            high = middle
+    return (low + high) / 2
+
+def committee_estimate(sizes: Dict[Hashable, int], yes: Dict[Hashable, int],
+                       polled: Dict[Hashable, int], confidence: float = 0.95) -> Dict[str, Any]:
+    """Estimate of the population yes share from a (stratified) committee
+
+    sizes maps stratum -> population size; yes and polled count approvals
+    and members with a vote or abstention (skipped members are not polled).
+    majority_confidence is the probability under the normal approximation
+    that the population majority agrees with the committee estimate.
+    """
+    population = sum(sizes.values())
+    share = variance = 0.0
+    for key, size in sizes.items():
+        n = polled.get(key, 0)
+        weight = size / population
+        if n == 0:
+            # Nothing known about this stratum: it may go either way
+            share += weight * 0.5
+            variance += weight ** 2 * 0.25
+            continue
+        share += weight * yes.get(key, 0) / n
+        smoothed = (yes.get(key, 0) + 2) / (n + 4)
+        correction = (size - n) / (size - 1) if size > 1 else 0.0
+        variance += weight ** 2 * smoothed * (1 - smoothed) / n * correction
+    error = math.sqrt(variance)
+    margin = _z_score(confidence) * error
+    if error:
+        agreement = _normal_cdf(abs(share - 0.5) / error)
+    else:
+        agreement = 1.0 if share != 0.5 else 0.5
+    return {
+        "yes_share": share,
+        "interval": [max(0.0, share - margin), min(1.0, share + margin)],
+        "confidence": confidence,
+        "majority_confidence": agreement
+    }
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+framework/consensus_engine.py - Vektorisierte Konsens-Auswertung über NumPy-Matrizen
+Gewichteter, Schwellwert- und Bayes-Konsens für viele Fragen gleichzeitig
+
+Eingabe sind die Modell-Konfidenzen aller KIs als Array der Form
+(Fragen x KIs x Modelle) oder (KIs x Modelle) für eine einzelne Frage.
+NaN markiert eine fehlende Vorhersage; eine KI ohne jede Vorhersage
+enthält sich und zählt wie bei MultiKIConsensus nicht als Zustimmung.
+
+Methoden:
+    thresholded  Regel von CharteredAI.vote_on_question und conduct_vote:
+                 Modell stimmt zu bei Konfidenz > model_threshold, KI bei
+                 Modell-Mehrheit, Konsens bei Anteil > quorum aller KIs
+                 (voter_weights gewichten die Stimmen)
+    weighted     Gewichtetes Mittel der Konfidenzen je KI (model_weights),
+                 dann über die KIs (voter_weights); KI und Konsens bei
+                 Score > model_threshold
+    bayesian     Naive-Bayes-Posterior je KI aus den Modell-Konfidenzen
+                 (Log-Odds relativ zum Prior, mit model_weights gedämpft),
+                 gemittelt über die KIs (voter_weights); Konsens bei
+                 Posterior > quorum
+"""
+
+from typing import Any, NamedTuple
+
+try:
+    import numpy as np
+except ImportError:  # Optional - the aggregation engine requires NumPy
+    np = None
+
+# Model confidence above which a model supports the question (vote_on_question)
+MODEL_VOTE_THRESHOLD = 0.7
+
+METHODS = ("thresholded", "weighted", "bayesian")
+
+_EPSILON = 1e-6
+
+class AggregateResult(NamedTuple):
+    """Consensus of every question; arrays are indexed by question (and voter)"""
+    consensus: Any        # bool[questions]
+    support: Any          # float[questions] - yes share, weighted score or posterior
+    voter_votes: Any      # bool[questions, voters]
+    voter_scores: Any     # float[questions, voters] - NaN for abstaining voters
+
+class ConsensusAggregator:
+    """Aggregates (questions x voters x models) confidence arrays in one pass"""
+
+    def __init__(self, method: str = "thresholded", model_threshold: float = MODEL_VOTE_THRESHOLD,
+                 quorum: float = 0.5, model_weights: Any = None, voter_weights: Any = None,
+                 prior: float = 0.5):
+        if np is None:
+            raise RuntimeError("ConsensusAggregator requires NumPy")
+        if method not in METHODS:
+            raise ValueError(f"Unknown consensus method: {method} (expected one of {METHODS})")
+        if not 0.0 < prior < 1.0:
+            raise ValueError(f"prior must be between 0 and 1, got {prior}")
+        self.method = method
+        self.model_threshold = model_threshold
+        self.quorum = quorum
+        self.model_weights = None if model_weights is None else np.asarray(model_weights, dtype=float)
+        self.voter_weights = None if voter_weights is None else np.asarray(voter_weights, dtype=float)
+        self.prior = prior
+
+    def aggregate(self, confidences: Any, chunk_elements: int = 1 << 22) -> AggregateResult:
+        """Consensus per question; a (voters x models) array counts as one question
+
+        Questions are processed in chunks of about chunk_elements
+        confidences to bound the memory of intermediate arrays.
+        """
+        confidences = np.asarray(confidences)
+        if confidences.ndim == 2:
+            confidences = confidences[np.newaxis]
+        if confidences.ndim != 3:
+            raise ValueError(f"Expected (questions x voters x models) confidences, got shape {confidences.shape}")
+        questions, voters, models = confidences.shape
+        model_weights = np.ones(models) if self.model_weights is None else self.model_weights
+        if model_weights.shape != (models,):
+            raise ValueError(f"model_weights needs {models} entries, got {model_weights.shape}")
+        voter_weights = np.ones(voters) if self.voter_weights is None else self.voter_weights
+        if voter_weights.shape != (voters,):
+            raise ValueError(f"voter_weights needs {voters} entries, got {voter_weights.shape}")
+
+        consensus = np.empty(questions, dtype=bool)
+        support = np.empty(questions)
+        voter_votes = np.empty((questions, voters), dtype=bool)
+        voter_scores = np.empty((questions, voters))
+        step = max(1, chunk_elements // max(1, voters * models))
+        for start in range(0, questions, step):
+            chunk = slice(start, start + step)
+            consensus[chunk], support[chunk], voter_votes[chunk], voter_scores[chunk] = self._aggregate(
+                self._floats(confidences[chunk]), model_weights, voter_weights)
+        return AggregateResult(consensus, support, voter_votes, voter_scores)
+
+    @staticmethod
+    def _floats(confidences: Any) -> Any:
+        """Keep float32 input in float32, convert everything else to float64"""
+        if confidences.dtype in (np.float32, np.float64):
+            return confidences
+        return confidences.astype(float)
+
+    def _aggregate(self, confidences: Any, model_weights: Any, voter_weights: Any):
+        model_weights = model_weights.astype(confidences.dtype)
+        missing = np.isnan(confidences)
+        if missing.any():
+            weight_sum = ~missing @ model_weights
+            # Neutral values so missing predictions add no support or evidence
+            confidences = np.where(missing, self.prior if self.method == "bayesian" else 0.0, confidences)
+        else:
+            weight_sum = np.full(confidences.shape[:2], model_weights.sum(), dtype=confidences.dtype)
+        abstaining = weight_sum == 0
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            if self.method == "thresholded":
+                supporting = (confidences > self.model_threshold) @ model_weights
+                scores = supporting / weight_sum
+                votes = supporting > weight_sum / 2
+            elif self.method == "weighted":
+                scores = confidences @ model_weights / weight_sum
+                votes = scores > self.model_threshold
+            else:
+                clipped = np.clip(confidences, _EPSILON, 1 - _EPSILON)
+                prior_logit = np.log(self.prior / (1 - self.prior))
+                evidence = (np.log(clipped / (1 - clipped)) - prior_logit) @ model_weights
+                scores = 1.0 / (1.0 + np.exp(-(prior_logit + evidence)))
+                votes = scores > 0.5
+        votes &= ~abstaining
+
+        total = voter_weights.sum()
+        if self.method == "thresholded":
+            # Majority of all participants, abstentions never count as approval
+            support = votes @ voter_weights / total
+            consensus = support > self.quorum
+        else:
+            # Abstaining voters contribute a score of 0
+            support = np.where(abstaining, 0.0, scores) @ voter_weights / total
+            consensus = support > (self.model_threshold if self.method == "weighted" else self.quorum)
+        return consensus, support, votes, np.where(abstaining, np.nan, scores)
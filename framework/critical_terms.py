@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+framework/critical_terms.py - Erkennung kritischer Begriffe für AI-DNA Charter
+Aho-Corasick-Automat, der Framework und DeepSeek-Service gemeinsam nutzen
+"""
+
+import logging
+import xml.etree.ElementTree as ET
+from collections import deque
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+LANGUAGES_DIR = Path(__file__).parent / "languages"
+
+class CriticalTermMatcher:
+    """Case-insensitive multi-pattern matcher built once from a term set
+
+    Scans an input in a single pass regardless of the number of terms and
+    reports which terms occurred, in order of their first occurrence.
+    """
+
+    def __init__(self, terms: Iterable[str]):
+        # Deduplicate while keeping the configured order
+        self.terms: Tuple[str, ...] = tuple(dict.fromkeys(t.strip().lower() for t in terms if t.strip()))
+
+        goto: List[Dict[str, int]] = [{}]
+        output: List[Tuple[int, ...]] = [()]
+        for index, term in enumerate(self.terms):
+            state = 0
+            for char in term:
+                next_state = goto[state].get(char)
+                if next_state is None:
+                    next_state = len(goto)
+                    goto[state][char] = next_state
+                    goto.append({})
+                    output.append(())
+                state = next_state
+            output[state] += (index,)
+
+        # Breadth-first failure links; outputs inherit those of their failure state
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in goto[state].items():
+                queue.append(next_state)
+                fallback = fail[state]
+                while fallback and char not in goto[fallback]:
+                    fallback = fail[fallback]
+                fail[next_state] = goto[fallback].get(char, 0)
+                output[next_state] += output[fail[next_state]]
+
+        self._goto = goto
+        self._fail = fail
+        self._output = output
+
+    def __len__(self) -> int:
+        return len(self.terms)
+
+    def with_terms(self, *terms: str) -> 'CriticalTermMatcher':
+        """New matcher with additional terms"""
+        return CriticalTermMatcher(self.terms + terms)
+
+    def find_all(self, text: str) -> List[str]:
+        """All terms occurring in text, in order of first occurrence"""
+        goto, fail, output = self._goto, self._fail, self._output
+        found: Dict[int, None] = {}
+        state = 0
+        for char in text.lower():
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if output[state]:
+                for index in output[state]:
+                    found.setdefault(index)
+        return [self.terms[index] for index in found]
+
+    def contains(self, text: str) -> bool:
+        """True as soon as any term occurs in text"""
+        goto, fail, output = self._goto, self._fail, self._output
+        state = 0
+        for char in text.lower():
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if output[state]:
+                return True
+        return False
+
+def load_locale_terms(lang_code: str, key: str, languages_dir: Optional[Path] = None) -> List[str]:
+    """Lade kommagetrennte Begriffe aus <category name="critical_terms"> einer Sprachdatei"""
+    lang_file = (languages_dir or LANGUAGES_DIR) / f"lang_{lang_code}.xml"
+    if not lang_file.exists():
+        return []
+
+    root = ET.parse(lang_file).getroot()
+    for category in root.findall('category'):
+        if category.get('name') != 'critical_terms':
+            continue
+        for item in category.findall('item'):
+            if item.get('key') == key:
+                return [term.strip() for term in (item.text or "").split(',') if term.strip()]
+    return []
+
+@lru_cache(maxsize=None)
+def locale_matcher(lang_code: str, key: str = "consensus", fallback_lang: str = "en",
+                   base_terms: Tuple[str, ...] = ()) -> CriticalTermMatcher:
+    """Gemeinsamer Matcher pro Sprache und Begriffsgruppe - wird nur einmal gebaut
+
+    Ohne Einträge für die Sprache werden die Begriffe der Fallback-Sprache
+    verwendet; das wird als Warnung geloggt.
+    """
+    terms = load_locale_terms(lang_code, key)
+    if not terms and lang_code != fallback_lang:
+        logger.warning(f"Keine kritischen Begriffe '{key}' für Sprache {lang_code}, verwende {fallback_lang}")
+        terms = load_locale_terms(fallback_lang, key)
+    return CriticalTermMatcher(base_terms + tuple(terms))
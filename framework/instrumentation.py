@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+framework/instrumentation.py - Latenz-Messung der Entscheidungs-Pipeline
+Histogramme pro Stufe und Paradigma mit Export als Dict und Prometheus-Text
+"""
+
+import threading
+import time
+from bisect import bisect_left
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+# Bucket upper bounds in seconds, +Inf is implicit
+DEFAULT_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01,
+                   0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram (non-cumulative counts internally)"""
+
+    __slots__ = ("bounds", "counts", "count", "sum")
+
+    def __init__(self, bounds: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, seconds: float) -> None:
+        self.counts[bisect_left(self.bounds, seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+
+    def cumulative(self) -> List[Tuple[str, int]]:
+        """(le, cumulative count) pairs including +Inf"""
+        pairs = []
+        running = 0
+        for bound, count in zip(self.bounds + (float("inf"),), self.counts):
+            running += count
+            pairs.append(("+Inf" if bound == float("inf") else repr(bound), running))
+        return pairs
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"count": self.count, "sum": self.sum, "buckets": dict(self.cumulative())}
+
+class _StageTimer:
+    """Context manager timing one pipeline stage"""
+
+    __slots__ = ("instrumentation", "stage", "paradigm", "started")
+
+    def __init__(self, instrumentation: 'PipelineInstrumentation', stage: str, paradigm: Optional[str]):
+        self.instrumentation = instrumentation
+        self.stage = stage
+        self.paradigm = paradigm
+
+    def __enter__(self) -> '_StageTimer':
+        self.started = self.instrumentation.clock()
+        return self
+
+    def __exit__(self, *exc_info) -> bool:
+        self.instrumentation.observe(self.stage, self.instrumentation.clock() - self.started, self.paradigm)
+        return False
+
+class _NullStage:
+    """Shared no-op stage used while instrumentation is disabled"""
+
+    __slots__ = ()
+
+    def __enter__(self) -> '_NullStage':
+        return self
+
+    def __exit__(self, *exc_info) -> bool:
+        return False
+
+NULL_STAGE = _NullStage()
+
+class PipelineInstrumentation:
+    """Per-stage latency histograms for one CharteredAI
+
+    The clock is pluggable (any callable returning seconds as float, e.g.
+    time.perf_counter or time.process_time). Stages with a paradigm are
+    kept in a separate per-paradigm series.
+    """
+
+    def __init__(self, entity_id: str, clock: Callable[[], float] = time.perf_counter,
+                 buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.entity_id = entity_id
+        self.clock = clock
+        self.buckets = buckets
+        self.histograms: Dict[Tuple[str, Optional[str]], LatencyHistogram] = {}
+        self.lock = threading.Lock()
+
+    def stage(self, stage: str, paradigm: Optional[str] = None) -> _StageTimer:
+        return _StageTimer(self, stage, paradigm)
+
+    def observe(self, stage: str, seconds: float, paradigm: Optional[str] = None) -> None:
+        key = (stage, paradigm)
+        with self.lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = LatencyHistogram(self.buckets)
+            histogram.observe(seconds)
+
+    def reset(self) -> None:
+        with self.lock:
+            self.histograms.clear()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Stage and per-paradigm histograms as a plain dict"""
+        stages: Dict[str, Any] = {}
+        paradigms: Dict[str, Dict[str, Any]] = {}
+        with self.lock:
+            for (stage, paradigm), histogram in sorted(self.histograms.items(), key=lambda kv: (kv[0][0], kv[0][1] or "")):
+                if paradigm is None:
+                    stages[stage] = histogram.to_dict()
+                else:
+                    paradigms.setdefault(paradigm, {})[stage] = histogram.to_dict()
+        return {"entity_id": self.entity_id, "stages": stages, "paradigms": paradigms}
+
+    def to_prometheus(self) -> str:
+        return prometheus_text([self])
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+def prometheus_text(instrumentations: Iterable[PipelineInstrumentation],
+                    metric: str = "ai_dna_stage_latency_seconds") -> str:
+    """Render one or more instrumentations in the Prometheus text exposition format"""
+    lines = [
+        f"# HELP {metric} Latency of AI-DNA decision pipeline stages in seconds",
+        f"# TYPE {metric} histogram"
+    ]
+    for instrumentation in instrumentations:
+        with instrumentation.lock:
+            series = sorted(instrumentation.histograms.items(), key=lambda kv: (kv[0][0], kv[0][1] or ""))
+            for (stage, paradigm), histogram in series:
+                labels = f'entity="{_escape_label(instrumentation.entity_id)}",stage="{_escape_label(stage)}"'
+                if paradigm is not None:
+                    labels += f',paradigm="{_escape_label(paradigm)}"'
+                for le, count in histogram.cumulative():
+                    lines.append(f'{metric}_bucket{{{labels},le="{le}"}} {count}')
+                lines.append(f"{metric}_sum{{{labels}}} {histogram.sum!r}")
+                lines.append(f"{metric}_count{{{labels}}} {histogram.count}")
+    return "\n".join(lines) + "\n"
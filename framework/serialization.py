@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+framework/serialization.py - Austauschbare JSON-Serializer für Audit-Records und API-Payloads
+Vorkompiliertes Template für die feste Audit-Record-Form, schnellere Encoder falls installiert
+
+Backends:
+    json      Standardbibliothek, Referenzformat der Audit-Logs
+    template  Feste Form der AuditLogger-Records ohne generischen Baum-Durchlauf,
+              byte-identisch zu json; andere Formen fallen auf json zurück
+    orjson    Falls installiert (kompakte Ausgabe, NaN/Infinity werden null)
+    ujson     Falls installiert (kompakte Ausgabe)
+    fast      Schnellster installierte generische Encoder (orjson > ujson > json)
+"""
+
+import json
+from abc import ABC, abstractmethod
+from json.encoder import encode_basestring_ascii
+from typing import Any, Callable, Dict, List, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # Optional - faster generic encoder
+    orjson = None
+
+try:
+    import ujson
+except ImportError:  # Optional - faster generic encoder
+    ujson = None
+
+class Serializer(ABC):
+    """Turns JSON-ready Python objects into JSON text"""
+
+    name = "base"
+
+    @abstractmethod
+    def dumps(self, obj: Any) -> str:
+        """JSON text of obj"""
+
+    def dumps_bytes(self, obj: Any) -> bytes:
+        """UTF-8 encoded JSON, e.g. as HTTP request body"""
+        return self.dumps(obj).encode("utf-8")
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} {self.name}>"
+
+class JsonSerializer(Serializer):
+    """Standard library json with its default separators"""
+
+    name = "json"
+
+    def dumps(self, obj: Any) -> str:
+        return json.dumps(obj)
+
+class OrjsonSerializer(Serializer):
+    """orjson (Rust) - encodes straight to bytes"""
+
+    name = "orjson"
+
+    def __init__(self):
+        if orjson is None:
+            raise ImportError("orjson is not installed")
+
+    def dumps(self, obj: Any) -> str:
+        return orjson.dumps(obj).decode("utf-8")
+
+    def dumps_bytes(self, obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+class UjsonSerializer(Serializer):
+    """ujson (C)"""
+
+    name = "ujson"
+
+    def __init__(self):
+        if ujson is None:
+            raise ImportError("ujson is not installed")
+
+    def dumps(self, obj: Any) -> str:
+        return ujson.dumps(obj)
+
+# Field order of AuditLogger._build_entry records
+AUDIT_FIELDS = ("timestamp", "context", "action", "models_used", "is_random_decision",
+                "cached", "consensus_result", "charter_compliant")
+AUDIT_CONTEXT_FIELDS = ("urgency", "reversible", "stakeholders", "requires_consensus", "critical_terms")
+AUDIT_MODEL_FIELDS = ("id", "paradigm", "confidence")
+
+_AUDIT_TEMPLATE = (
+    '{"timestamp": %s, "context": {"urgency": %s, "reversible": %s, "stakeholders": %s, '
+    '"requires_consensus": %s, "critical_terms": %s}, "action": %s, "models_used": [%s], '
+    '"is_random_decision": %s, "cached": %s, "consensus_result": %s, "charter_compliant": %s}'
+)
+_MODEL_PREFIX = '{"id": %s, "paradigm": %s, "confidence": '
+
+class _ShapeMismatch(Exception):
+    pass
+
+def _scalar(value: Any) -> str:
+    """JSON of a scalar exactly as json.dumps writes it"""
+    kind = type(value)
+    if kind is str:
+        return encode_basestring_ascii(value)
+    if kind is bool:
+        return "true" if value else "false"
+    if kind is float and value - value == 0.0:  # Finite; NaN/Infinity take the fallback
+        return float.__repr__(value)
+    if kind is int:
+        return int.__repr__(value)
+    if value is None:
+        return "null"
+    raise _ShapeMismatch
+
+class AuditTemplateSerializer(Serializer):
+    """Precompiled template for the fixed audit record shape
+
+    Records built by AuditLogger are formatted field by field into a fixed
+    string template, producing exactly the output of json.dumps. The JSON of
+    values that repeat across records (stakeholder and term lists, model
+    id/paradigm pairs) is cached up to cache_size entries. Records of any
+    other shape (extra fields, nested non-string values, NaN) are passed to
+    the fallback serializer.
+    """
+
+    name = "template"
+
+    def __init__(self, fallback: Optional[Serializer] = None, cache_size: int = 4096):
+        self.fallback = fallback or JsonSerializer()
+        self.cache_size = cache_size
+        self._lists: Dict[tuple, str] = {}
+        self._models: Dict[tuple, str] = {}
+
+    def dumps(self, obj: Any) -> str:
+        try:
+            return self._format(obj)
+        except (_ShapeMismatch, AttributeError, KeyError, TypeError):
+            return self.fallback.dumps(obj)
+
+    def _cached(self, cache: Dict[tuple, str], key: tuple, value: str) -> str:
+        if len(cache) >= self.cache_size:
+            cache.clear()
+        cache[key] = value
+        return value
+
+    def _strings(self, values: Any) -> str:
+        if type(values) is not list and type(values) is not tuple:
+            raise _ShapeMismatch
+        key = tuple(values)
+        text = self._lists.get(key)
+        if text is None:
+            try:
+                text = "[" + ", ".join(map(encode_basestring_ascii, key)) + "]"
+            except TypeError:
+                raise _ShapeMismatch
+            self._cached(self._lists, key, text)
+        return text
+
+    def _format(self, entry: Dict[str, Any]) -> str:
+        if tuple(entry) != AUDIT_FIELDS:
+            raise _ShapeMismatch
+        context = entry["context"]
+        if tuple(context) != AUDIT_CONTEXT_FIELDS:
+            raise _ShapeMismatch
+        models = []
+        prefixes = self._models
+        for model in entry["models_used"]:
+            if tuple(model) != AUDIT_MODEL_FIELDS:
+                raise _ShapeMismatch
+            key = (model["id"], model["paradigm"])
+            prefix = prefixes.get(key)
+            if prefix is None:
+                prefix = self._cached(prefixes, key, _MODEL_PREFIX % (_scalar(key[0]), _scalar(key[1])))
+            models.append(prefix + _scalar(model["confidence"]) + "}")
+        consensus = entry["consensus_result"]
+        return _AUDIT_TEMPLATE % (
+            _scalar(entry["timestamp"]),
+            _scalar(context["urgency"]),
+            _scalar(context["reversible"]),
+            self._strings(context["stakeholders"]),
+            _scalar(context["requires_consensus"]),
+            self._strings(context["critical_terms"]),
+            _scalar(entry["action"]),
+            ", ".join(models),
+            _scalar(entry["is_random_decision"]),
+            _scalar(entry["cached"]),
+            "null" if consensus is None else self.fallback.dumps(consensus),
+            _scalar(entry["charter_compliant"])
+        )
+
+SERIALIZERS: Dict[str, Callable[[], Serializer]] = {
+    "json": JsonSerializer,
+    "template": AuditTemplateSerializer,
+}
+if orjson is not None:
+    SERIALIZERS["orjson"] = OrjsonSerializer
+if ujson is not None:
+    SERIALIZERS["ujson"] = UjsonSerializer
+
+def available_serializers() -> List[str]:
+    """Names accepted by get_serializer() in this environment"""
+    return list(SERIALIZERS) + ["fast"]
+
+def get_serializer(serializer: Union[None, str, Serializer] = None, default: str = "json") -> Serializer:
+    """Resolve a serializer name (or pass an instance through)"""
+    if isinstance(serializer, Serializer):
+        return serializer
+    name = serializer or default
+    if name == "fast":
+        name = next(n for n in ("orjson", "ujson", "json") if n in SERIALIZERS)
+    if name not in SERIALIZERS:
+        raise ValueError(f"Unknown or unavailable serializer: {name} (available: {available_serializers()})")
+    return SERIALIZERS[name]()
@@ -27,6 +27,7 @@ setup(
     extras_require={
         "dev": ["pytest>=6.0", "black", "flake8"],
         "docker": ["docker>=5.0.0"],
+        "numpy": ["numpy>=1.24.0"],
     },
     entry_points={
         "console_scripts": [
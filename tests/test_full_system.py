@@ -3,13 +3,28 @@ tests/test_full_system.py - Vollständige Integration Tests
 """
 
 import unittest
+import asyncio
+import pickle
+import struct
+import random
+import dataclasses
 import requests
 import time
 import subprocess
 import sys
 import os
+import json
+import shutil
+import tempfile
+import multiprocessing
+import threading
 from pathlib import Path
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 # Füge framework zum Path hinzu
 sys.path.insert(0, str(Path(__file__).parent.parent / "framework"))
 
@@ -18,8 +33,32 @@ from ai_dna_framework import (
     create_basic_chartered_ai,
     MultiKIConsensus,
     StreamIntegration,
-    DecisionContext
+    DecisionContext,
+    MockModel,
+    ParadigmType,
+    DecisionCache,
+    AuditLogger,
+    ModelInfo,
+    PredictionBatch,
+    VoteResult,
+    EthicalViolation,
+    CharterViolation,
+    Layer1EthicsCore,
+    KIReproduction,
+    create_model_executor
 )
+from critical_terms import CriticalTermMatcher, load_locale_terms, locale_matcher
+from instrumentation import prometheus_text
+from audit_rotation import list_segments, iter_log_lines
+from audit_binary import BinaryAuditCodec, BinaryAuditReader, iter_binary_log, jsonl_to_binary, binary_to_jsonl
+from audit_query import AuditQueryEngine
+from audit_sink import SharedAuditSink, iter_entity_entries
+from audit_chain import ChainVerifier, verify_chain
+from audit_stream import tail
+from audit_sampling import AuditSamplingPolicy
+from serialization import AuditTemplateSerializer, Serializer, available_serializers, get_serializer
+from committee import REST_STRATUM, draw_committee
+from consensus_engine import ConsensusAggregator
 
 class TestCharterFramework(unittest.TestCase):
     """Tests für das Charter-Framework"""
@@ -222,6 +261,1354 @@ class TestComplianceAndAudit(unittest.TestCase):
         self.assertIn('core_principles', charter)
         self.assertIn('diversity', charter)
 
+class AuditDirTestCase(unittest.TestCase):
+    """Basis für Tests, die Audit-Logs in ein temporäres Verzeichnis schreiben"""
+    
+    def setUp(self):
+        self._old_cwd = os.getcwd()
+        self.tmp_dir = tempfile.mkdtemp()
+        os.chdir(self.tmp_dir)
+    
+    def tearDown(self):
+        os.chdir(self._old_cwd)
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+    
+    def read_audit(self, ki):
+        with open(ki.audit_logger.log_file) as f:
+            return [json.loads(line) for line in f]
+
+class TestBatchDecisions(AuditDirTestCase):
+    """Tests für make_decisions"""
+    
+    def test_batch_returns_decisions_in_order(self):
+        """Test: Batch-Entscheidungen in Eingabereihenfolge"""
+        ki = CharteredAI("BatchKI")
+        ki.random_decision_rate = 0.0
+        contexts = [DecisionContext(input_data=f"Frage {i}") for i in range(20)]
+        
+        decisions = ki.make_decisions(iter(contexts))
+        
+        self.assertEqual(len(decisions), 20)
+        for decision in decisions:
+            self.assertEqual(decision["type"], "ensemble_decision")
+        self.assertEqual(len(self.read_audit(ki)), 20)
+        
+    def test_batch_keeps_random_and_alternative_paths(self):
+        """Test: 5%-Regel und ethische Alternative im Batch"""
+        ki = CharteredAI("BatchRandomKI")
+        ki.random_decision_rate = 1.0
+        decisions = ki.make_decisions([DecisionContext(input_data="x") for _ in range(3)])
+        
+        self.assertTrue(all(d["source"] == "creative_randomness" for d in decisions))
+        self.assertTrue(all(e["is_random_decision"] for e in self.read_audit(ki)))
+        
+        ki.random_decision_rate = 0.0
+        decisions = ki.make_decisions([DecisionContext(input_data="x", reversible=False)])
+        self.assertEqual(decisions[0]["type"], "ethical_alternative")
+
+    def test_batch_uses_predict_of_predict_only_models(self):
+        """Test: Modelle, die nur predict überschreiben, liefern im Batch ihre eigenen Vorhersagen"""
+        models = [PredictOnlyModel(f"real_{p.value}", p) for p in ParadigmType]
+        ki = CharteredAI("PredictOnlyKI", models=models)
+        ki.random_decision_rate = 0.0
+        
+        single = ki.make_decision(DecisionContext(input_data="Frage"))
+        decisions = ki.make_decisions([DecisionContext(input_data=f"Frage {i}") for i in range(3)])
+        
+        for decision in [single] + decisions:
+            self.assertEqual((decision["action"], decision["confidence"]), ("real_action", 0.1))
+
+class PredictOnlyModel(MockModel):
+    """Eigenes Modell, das nur predict implementiert"""
+    
+    def predict(self, context):
+        return ModelInfo(self.id, self.paradigm, 0.1, "real_action", "fixed")
+
+class SlowModel(MockModel):
+    """Modell, das länger als seine Deadline braucht"""
+    
+    def predict(self, context):
+        time.sleep(0.5)
+        return super().predict(context)
+
+class TestModelFanOut(AuditDirTestCase):
+    """Tests für parallele Modell-Ausführung mit Deadlines"""
+    
+    def test_slow_model_counts_as_failed(self):
+        """Test: Langsames Paradigma blockiert die Entscheidung nicht"""
+        models = CharteredAI("FanOutTemplate")._init_default_models()
+        models.append(SlowModel("slow_1", ParadigmType.BAYESIAN))
+        executor = create_model_executor("thread", max_workers=len(models))
+        self.addCleanup(executor.shutdown, wait=True)
+        ki = CharteredAI("FanOutKI", models=models, model_executor=executor, model_timeout=0.1)
+        ki.random_decision_rate = 0.0
+        
+        started = time.monotonic()
+        with self.assertLogs("ai_dna_framework", level="WARNING") as logs:
+            decision = ki.make_decision(DecisionContext(input_data="Test"))
+        
+        self.assertLess(time.monotonic() - started, 0.4)
+        self.assertNotIn("bayesian", decision["paradigms_used"])
+        self.assertEqual(len(decision["paradigms_used"]), 5)
+        self.assertTrue(any("Model slow_1 failed" in line for line in logs.output))
+
+class SlowAsyncModel(MockModel):
+    """Netzwerk-Modell, das seine Deadline verpasst"""
+    
+    async def apredict(self, context):
+        await asyncio.sleep(0.5)
+        return self.predict(context)
+
+class TestAsyncPipeline(AuditDirTestCase):
+    """Tests für die asyncio-Entscheidungspipeline"""
+    
+    def test_amake_decision_with_deadline(self):
+        """Test: amake_decision lässt langsame Paradigmen ausfallen"""
+        models = CharteredAI("AsyncTemplate")._init_default_models()
+        models.append(SlowAsyncModel("slow_async", ParadigmType.BAYESIAN, timeout=0.05))
+        ki = CharteredAI("AsyncKI", models=models)
+        ki.random_decision_rate = 0.0
+        
+        decision = asyncio.run(ki.amake_decision(DecisionContext(input_data="Test")))
+        
+        self.assertEqual(decision["type"], "ensemble_decision")
+        self.assertNotIn("bayesian", decision["paradigms_used"])
+        self.assertEqual(len(self.read_audit(ki)), 1)
+        
+    def test_blocking_predict_runs_off_the_loop(self):
+        """Test: Modelle nur mit predict blockieren die Event-Loop nicht und verpassen ihre Deadline"""
+        models = [SlowModel(f"slow_{p.value}", p) for p in ParadigmType]
+        ki = CharteredAI("BlockingKI", models=models, model_timeout=0.05)
+        ki.random_decision_rate = 0.0
+        ticks = []
+        
+        async def ticker():
+            while True:
+                ticks.append(time.monotonic())
+                await asyncio.sleep(0.01)
+        
+        async def decide():
+            task = asyncio.ensure_future(ticker())
+            started = time.monotonic()
+            decision = await ki.amake_decision(DecisionContext(input_data="Test"))
+            elapsed = time.monotonic() - started
+            task.cancel()
+            return decision, elapsed
+        
+        with self.assertLogs("ai_dna_framework", level="WARNING") as logs:
+            decision, elapsed = asyncio.run(decide())
+        
+        self.assertLess(elapsed, 0.3)
+        self.assertGreater(len(ticks), 2)
+        self.assertNotEqual(decision["type"], "ensemble_decision")
+        self.assertEqual(sum("deadline" in line for line in logs.output), len(models))
+        
+    def test_audit_write_runs_off_the_loop(self):
+        """Test: Langsame Audit-Writes (auch auf dem Zufallspfad) blockieren die Event-Loop nicht"""
+        class SlowAuditLogger(AuditLogger):
+            def log_decision(self, *args, **kwargs):
+                time.sleep(0.2)
+                super().log_decision(*args, **kwargs)
+        
+        ki = CharteredAI("SlowAuditKI", audit_logger=SlowAuditLogger("audit_SlowAuditKI.log"))
+        ticks = []
+        
+        async def ticker():
+            while True:
+                ticks.append(time.monotonic())
+                await asyncio.sleep(0.01)
+        
+        async def decide():
+            task = asyncio.ensure_future(ticker())
+            for rate in (0.0, 1.0):
+                ki.random_decision_rate = rate
+                await ki.amake_decision(DecisionContext(input_data="Test"))
+            task.cancel()
+        
+        asyncio.run(decide())
+        self.assertGreater(len(ticks), 10)
+        self.assertEqual([e["is_random_decision"] for e in self.read_audit(ki)], [False, True])
+        
+    def test_async_vote_and_discussion(self):
+        """Test: aconduct_vote und asimulate_discussion"""
+        stream = StreamIntegration()
+        for i in range(3):
+            stream.add_ki_to_stream(CharteredAI(f"AsyncStreamKI_{i}"))
+        
+        async def run():
+            context = DecisionContext(input_data="Frage", requires_consensus=True)
+            vote = await stream.consensus_system.aconduct_vote("Frage?", context)
+            discussion = await stream.asimulate_discussion("Thema", pause=0)
+            return vote, discussion
+        
+        vote, discussion = asyncio.run(run())
+        
+        self.assertEqual(len(vote.votes), 3)
+        self.assertEqual(len(discussion), 3)
+
+@unittest.skipIf(np is None, "NumPy nicht installiert")
+class TestColumnarPrediction(AuditDirTestCase):
+    """Tests für predict_batch und das vektorisierte Ensemble"""
+    
+    def test_predict_batch_is_columnar(self):
+        """Test: predict_batch liefert Konfidenz-Array und Codes"""
+        model = MockModel("neural_1", ParadigmType.NEURAL)
+        batch = model.predict_batch([DecisionContext(input_data=i) for i in range(50)])
+        
+        self.assertEqual(batch.confidences.shape, (50,))
+        self.assertTrue(((batch.confidences >= 0.6) & (batch.confidences <= 0.95)).all())
+        self.assertEqual(batch.prediction(3), "pattern_recognition_action")
+        self.assertEqual(batch.model_info(3).reasoning, batch.row(3).reasoning)
+        
+        contexts = [DecisionContext(input_data=i) for i in range(5)]
+        seeded = [MockModel("neural_1", ParadigmType.NEURAL, seed=7).predict_batch(contexts) for _ in range(2)]
+        np.testing.assert_array_equal(seeded[0].confidences, seeded[1].confidences)
+        
+    def test_argmax_ensemble_matches_scalar_ensemble(self):
+        """Test: Argmax-Ensemble entspricht _ensemble_decision"""
+        ki = CharteredAI("ColumnarKI")
+        contexts = [DecisionContext(input_data=i) for i in range(30)]
+        batches = [model.predict_batch(contexts) for model in ki.models]
+        
+        proposals = ki._ensemble_batch(batches, len(contexts))
+        
+        for j, proposal in enumerate(proposals):
+            expected = ki._ensemble_decision([batch.model_info(j) for batch in batches])
+            self.assertEqual(proposal, expected)
+        
+        ki.random_decision_rate = 0.0
+        decisions = ki.make_decisions(contexts)
+        self.assertEqual(len(decisions), 30)
+        self.assertEqual(len(self.read_audit(ki)[0]["models_used"]), 5)
+
+class TestDecisionCache(AuditDirTestCase):
+    """Tests für den Entscheidungs-Cache"""
+    
+    def test_repeated_context_hits_cache(self):
+        """Test: Wiederholte Kontexte werden aus dem Cache bedient"""
+        cache = DecisionCache(max_size=10)
+        ki = CharteredAI("CacheKI", decision_cache=cache)
+        ki.random_decision_rate = 0.0
+        
+        first = ki.make_decision(DecisionContext(input_data="gleich", stakeholders=["a", "b"]))
+        second = ki.make_decision(DecisionContext(input_data="gleich", stakeholders=["b", "a"]))
+        ki.make_decisions([DecisionContext(input_data="gleich", stakeholders=["a", "b"])])
+        
+        self.assertEqual(first, second)
+        self.assertEqual((cache.hits, cache.misses), (2, 1))
+        self.assertEqual([e["cached"] for e in self.read_audit(ki)], [False, True, True])
+        
+    def test_invalidation_and_random_path(self):
+        """Test: Charter-Hash-Wechsel leert den Cache, Zufall wird nie gecacht"""
+        cache = DecisionCache()
+        ki = CharteredAI("CacheInvalidKI", decision_cache=cache)
+        ki.random_decision_rate = 0.0
+        context = DecisionContext(input_data="x")
+        ki.make_decision(context)
+        
+        ki.layer1.charter_hash = "changed"
+        ki.make_decision(context)
+        self.assertEqual(cache.hits, 0)
+        
+        ki.random_decision_rate = 1.0
+        ki.make_decision(context)
+        self.assertEqual(cache.stats(), {"hits": 0, "misses": 2, "size": 1})
+    
+    def test_principle_change_invalidates(self):
+        """Test: Geänderte Prinzipien leeren den Cache auch ohne neuen Charter-Hash"""
+        cache = DecisionCache()
+        ki = CharteredAI("CachePrincipleKI", decision_cache=cache)
+        ki.random_decision_rate = 0.0
+        context = DecisionContext(input_data="x")
+        ki.make_decision(context)
+        ki.make_decision(context)
+        self.assertEqual(cache.hits, 1)
+        
+        ki.layer1.principles["dignity_protection"] = False
+        ki.make_decision(context)
+        self.assertEqual(cache.hits, 1)
+
+class ExpensiveModel(MockModel):
+    """Teures Modell mit niedriger Maximal-Konfidenz"""
+    
+    max_confidence = 0.5
+    calls = 0
+    
+    def predict(self, context):
+        ExpensiveModel.calls += 1
+        return super().predict(context)
+
+class TestEarlyExit(AuditDirTestCase):
+    """Tests für den Early-Exit-Modus im Ensemble"""
+    
+    def test_unbeatable_models_are_skipped(self):
+        """Test: Modelle, die die beste Konfidenz nicht schlagen können, laufen nicht"""
+        ExpensiveModel.calls = 0
+        models = CharteredAI("EarlyExitTemplate")._init_default_models() + [
+            ExpensiveModel("bayesian_1", ParadigmType.BAYESIAN),
+            ExpensiveModel("quantum_1", ParadigmType.QUANTUM)
+        ]
+        ki = CharteredAI("EarlyExitKI", models=models, early_exit=True)
+        ki.random_decision_rate = 0.0
+        
+        for _ in range(5):
+            decision = ki.make_decision(DecisionContext(input_data="Test"))
+        
+        self.assertEqual(ExpensiveModel.calls, 0)
+        self.assertEqual(ki.skipped_model_calls, 10)
+        self.assertEqual(len(decision["paradigms_used"]), 5)
+        
+    def test_async_early_exit_and_executor_rejected(self):
+        """Test: amake_decision überspringt ebenfalls, mit model_executor wird early_exit abgelehnt"""
+        ExpensiveModel.calls = 0
+        models = CharteredAI("EarlyExitTemplate")._init_default_models() + [
+            ExpensiveModel("bayesian_1", ParadigmType.BAYESIAN)
+        ]
+        ki = CharteredAI("AsyncEarlyExitKI", models=models, early_exit=True)
+        ki.random_decision_rate = 0.0
+        
+        ki.make_decision(DecisionContext(input_data="Test"))
+        decision = asyncio.run(ki.amake_decision(DecisionContext(input_data="Test")))
+        
+        self.assertEqual(ExpensiveModel.calls, 0)
+        self.assertEqual(ki.skipped_model_calls, 2)
+        self.assertEqual(len(decision["paradigms_used"]), 5)
+        
+        executor = create_model_executor("thread", max_workers=2)
+        self.addCleanup(executor.shutdown, wait=True)
+        with self.assertRaises(ValueError):
+            CharteredAI("FanOutEarlyExitKI", model_executor=executor, early_exit=True)
+
+class TestLayer1RuleEngine(unittest.TestCase):
+    """Tests für die kompilierte Layer-1-Regel-Pipeline"""
+    
+    def test_validate_many_returns_bitmasks(self):
+        """Test: validate_many liefert eine Verletzungs-Bitmaske pro Aktion"""
+        core = Layer1EthicsCore()
+        context = DecisionContext(input_data="x")
+        ok = {"type": "explore", "reasoning": "r", "source": "s", "resource_usage": 0.01}
+        actions = [ok, {"type": "harm", "reasoning": "r", "source": "s"},
+                   {"deceptive": True, "resource_usage": 0.5}, "plain"]
+        
+        masks = core.validate_many(context, actions)
+        
+        self.assertEqual(masks[0], 0)
+        self.assertEqual(core.violated_rules(masks[1]), ["dignity"])
+        self.assertEqual(core.violated_rules(masks[2]), ["transparency", "deception", "resource_usage"])
+        self.assertEqual(masks[3], 0)
+        irreversible = DecisionContext(input_data="x", reversible=False)
+        self.assertEqual(core.violated_rules(core.validate_many(irreversible, [ok])[0]), ["reversibility"])
+        
+    def test_validate_action_and_custom_rules(self):
+        """Test: validate_action wirft die erste Verletzung, eigene Regeln werden eingebunden"""
+        core = Layer1EthicsCore()
+        context = DecisionContext(input_data="x")
+        with self.assertRaisesRegex(EthicalViolation, "exceeds limit 0.05"):
+            core.validate_action(context, {"reasoning": "r", "source": "s", "resource_usage": 0.2})
+        
+        bit = core.register_rule("no_shouting", lambda c, a: str(a).isupper(), "Action shouts")
+        self.assertEqual(core.validate_many(context, ["LOUD"]), [bit])
+        with self.assertRaisesRegex(EthicalViolation, "Action shouts"):
+            core.validate_action(context, "LOUD")
+        
+    def test_principle_changes_recompile_and_context_rules_never_raise(self):
+        """Test: Geänderte Prinzipien wirken sofort, fehlerhafte Kontext-Regeln zählen als Verletzung"""
+        core = Layer1EthicsCore()
+        context = DecisionContext(input_data="x")
+        harmful = {"type": "harm", "reasoning": "r", "source": "s"}
+        self.assertEqual(core.violated_rules(core.validate_many(context, [harmful])[0]), ["dignity"])
+        core.principles["dignity_protection"] = False
+        self.assertEqual(core.validate_many(context, [harmful]), [0])
+        
+        bit = core.register_rule("broken", lambda c, a: c.missing_field, "Broken rule", context_only=True)
+        self.assertEqual(core.validate_many(context, [harmful]), [bit])
+
+class TestCriticalTerms(AuditDirTestCase):
+    """Tests für den Aho-Corasick-Matcher kritischer Begriffe"""
+    
+    def test_matcher_finds_overlapping_terms(self):
+        """Test: Überlappende Begriffe in einem Durchlauf"""
+        matcher = CriticalTermMatcher(["he", "she", "his", "hers", "Schaden"])
+        
+        self.assertEqual(matcher.find_all("USHERS"), ["she", "he", "hers"])
+        self.assertEqual(matcher.find_all("kein schaden entsteht"), ["schaden"])
+        self.assertTrue(matcher.contains("this"))
+        self.assertFalse(matcher.contains("xyz"))
+        self.assertEqual(CriticalTermMatcher([]).find_all("anything"), [])
+        
+    def test_locale_terms_and_framework_integration(self):
+        """Test: Begriffe aus den Sprachdateien und Audit der Treffer"""
+        self.assertIn("sacrifice", load_locale_terms("en", "consensus"))
+        self.assertIs(locale_matcher("de", "harm"), locale_matcher("de", "harm"))
+        self.assertEqual(locale_matcher("xx", "harm").terms, locale_matcher("en", "harm").terms)
+        self.assertEqual(locale_matcher("fr", "consensus").find_all("Faut-il tuer ou blesser ?"), ["tuer", "blesser"])
+        self.assertEqual(locale_matcher("fr", "harm").find_all("Une blessure grave"), ["blessure"])
+        
+        ki = CharteredAI("TermsKI", critical_terms=locale_matcher("en", "consensus"))
+        ki.random_decision_rate = 0.0
+        context = DecisionContext(input_data="Is this dangerous? Could it harm anyone?")
+        ki.make_decision(context)
+        
+        self.assertTrue(context.metadata["consensus_required"])
+        self.assertEqual(self.read_audit(ki)[0]["context"]["critical_terms"], ["dangerous", "harm"])
+        
+        # Standard-Begriffe kommen aus lang_de.xml
+        default = CharteredAI("DefaultTermsKI").critical_terms
+        self.assertIs(default, locale_matcher("de", "decision"))
+        self.assertEqual(default.terms, ("schaden", "töten", "verletzen", "gefährlich", "irreversibel"))
+        self.assertEqual(locale_matcher("de", "layer1").find_all("Todo-Liste ohne Schaden"), ["schaden"])
+
+class TestCompactRecords(unittest.TestCase):
+    """Tests für geslottete Records und to_dict/from_dict"""
+    
+    def test_round_trips(self):
+        """Test: to_dict/from_dict und Pickle erhalten alle Felder"""
+        info = ModelInfo("neural_1", ParadigmType.NEURAL, 0.8, "action", "because")
+        vote = VoteResult("Frage?", {"A": True, "B": False}, False, "2025-01-01T00:00:00", ["A", "B"])
+        context = DecisionContext(input_data="x", stakeholders=["humans"], metadata={"k": 1})
+        
+        self.assertEqual(ModelInfo.from_dict(info.to_dict()), info)
+        self.assertEqual(VoteResult.from_dict(json.loads(json.dumps(vote.to_dict()))), vote)
+        self.assertEqual(DecisionContext.from_dict(context.to_dict()), context)
+        self.assertEqual(pickle.loads(pickle.dumps(info)), info)
+        
+    def test_model_info_is_frozen(self):
+        """Test: ModelInfo ist unveränderlich, Records ohne __dict__ ab Python 3.10"""
+        info = ModelInfo("neural_1", ParadigmType.NEURAL, 0.8, "action", "because")
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            info.confidence = 1.0
+        if sys.version_info >= (3, 10):
+            for record in (info, DecisionContext(input_data="x")):
+                self.assertFalse(hasattr(record, "__dict__"))
+
+class TestInstrumentation(AuditDirTestCase):
+    """Tests für die Latenz-Instrumentierung der Pipeline"""
+    
+    def test_stage_histograms_and_export(self):
+        """Test: Stufen- und Paradigmen-Histogramme, Dict- und Prometheus-Export"""
+        ki = CharteredAI("InstrumentedKI")
+        ki.random_decision_rate = 0.0
+        ticks = iter(range(10_000))
+        ki.enable_instrumentation(clock=lambda: float(next(ticks)))
+        
+        for _ in range(3):
+            ki.make_decision(DecisionContext(input_data="x"))
+        ki.make_decision(DecisionContext(input_data="x", reversible=False))
+        snapshot = ki.instrumentation.snapshot()
+        
+        for stage in ("decision", "diversity_check", "ensemble", "layer1_validation", "audit_write"):
+            self.assertEqual(snapshot["stages"][stage]["count"], 4)
+        self.assertEqual(snapshot["stages"]["ethical_alternative"]["count"], 1)
+        self.assertEqual(snapshot["paradigms"]["neural"]["model_prediction"]["count"], 4)
+        self.assertEqual(snapshot["stages"]["ensemble"]["buckets"]["1.0"], 4)
+        
+        text = prometheus_text([ki.instrumentation])
+        self.assertIn('ai_dna_stage_latency_seconds_count{entity="InstrumentedKI",stage="ensemble"} 4', text)
+        self.assertIn('stage="model_prediction",paradigm="symbolic",le="+Inf"} 4', text)
+        
+    def test_async_pipeline_stages(self):
+        """Test: amake_decision misst dieselben Stufen wie make_decision, auch bei Cache-Treffern"""
+        ki = CharteredAI("AsyncInstrumentedKI", decision_cache=DecisionCache())
+        ki.random_decision_rate = 0.0
+        ki.enable_instrumentation()
+        
+        async def decide():
+            for _ in range(2):
+                await ki.amake_decision(DecisionContext(input_data="x"))
+        
+        asyncio.run(decide())
+        stages = ki.instrumentation.snapshot()["stages"]
+        self.assertEqual(stages["decision"]["count"], 2)
+        self.assertEqual(stages["audit_write"]["count"], 2)
+        self.assertEqual(stages["ensemble"]["count"], 1)
+        
+    def test_disabled_instrumentation_records_nothing(self):
+        """Test: Ohne Aktivierung bleibt die Instrumentierung aus"""
+        ki = CharteredAI("PlainKI")
+        ki.make_decision(DecisionContext(input_data="x"))
+        self.assertIsNone(ki.instrumentation)
+
+class TestBufferedAudit(AuditDirTestCase):
+    """Tests für den gepufferten Audit-Writer"""
+    
+    def test_group_commit_keeps_order(self):
+        """Test: Gepufferte Einträge landen vollständig und geordnet im Log"""
+        logger = AuditLogger("buffered.log", buffered=True, flush_interval=0.05, fsync="batch")
+        self.addCleanup(logger.close)
+        ki = CharteredAI("BufferedKI", audit_logger=logger)
+        ki.random_decision_rate = 0.0
+        
+        for i in range(200):
+            ki.make_decision(DecisionContext(input_data=i, urgency=i / 1000))
+        logger.flush()
+        
+        entries = self.read_audit(ki)
+        self.assertEqual([e["context"]["urgency"] for e in entries], [i / 1000 for i in range(200)])
+        self.assertLess(logger._writer.batches_written, 200)
+        
+    def test_close_flushes_and_rejects_writes(self):
+        """Test: close() schreibt ausstehende Einträge, ungültige fsync-Policy wird abgelehnt"""
+        with self.assertRaises(ValueError):
+            AuditLogger("x.log", fsync="sometimes")
+        logger = AuditLogger("closing.log", buffered=True, flush_interval=10)
+        logger.log_decision(DecisionContext(input_data="x"), {"type": "wait"}, [])
+        logger.close()
+        
+        with open("closing.log") as f:
+            self.assertEqual(len(f.readlines()), 1)
+        with self.assertRaises(RuntimeError):
+            logger.log_decision(DecisionContext(input_data="x"), {"type": "wait"}, [])
+
+    def test_failed_records_reported_without_stopping_writer(self):
+        """Test: Nicht schreibbare Records beenden den Writer nicht und werden bei flush() gemeldet"""
+        logger = AuditLogger("failing.bin", buffered=True, log_format="binary", flush_interval=10)
+        logger.log_decision(DecisionContext(input_data="x", urgency=0.1), {"type": "wait"}, [])
+        logger.log_decision(DecisionContext(input_data="x", urgency="hoch", stakeholders=["neu"]),
+                            {"type": "wait"}, [])
+        logger.log_decision(DecisionContext(input_data="x", urgency=0.3, stakeholders=["neu"]),
+                            {"type": "wait"}, [])
+        with self.assertLogs("audit_writer", level="ERROR"):
+            with self.assertRaises(RuntimeError) as raised:
+                logger.flush()
+        self.assertIsInstance(raised.exception.__cause__, struct.error)
+        self.assertEqual(logger._writer.records_failed, 1)
+        
+        logger.log_decision(DecisionContext(input_data="x", urgency=0.4), {"type": "wait"}, [])
+        logger.flush()
+        logger.close()
+        self.assertFalse(logger._writer._thread.is_alive())
+        self.assertEqual([e["context"]["urgency"] for e in iter_binary_log("failing.bin")], [0.1, 0.3, 0.4])
+
+class TestAuditRotation(AuditDirTestCase):
+    """Tests für Rotation und Kompression der Audit-Logs"""
+    
+    def test_size_rotation_with_compression(self):
+        """Test: Größenrotation erzeugt geordnete, komprimierte Segmente"""
+        for compression, suffix in (("gzip", ".gz"), ("lzma", ".xz")):
+            log_file = f"rotating_{compression}.log"
+            logger = AuditLogger(log_file, rotate_bytes=2000, compression=compression)
+            for i in range(40):
+                logger.log_decision(DecisionContext(input_data="x", urgency=i / 100), {"type": "wait"}, [])
+            logger.close()
+            
+            segments = list_segments(log_file)
+            self.assertGreater(len(segments), 2)
+            self.assertTrue(all(p.name.endswith(suffix) for p in segments[:-1]))
+            self.assertEqual(segments[-1].name, log_file)
+            urgencies = [json.loads(line)["context"]["urgency"] for line in iter_log_lines(log_file)]
+            self.assertEqual(urgencies, [i / 100 for i in range(40)])
+        
+    def test_buffered_interval_rotation(self):
+        """Test: Zeitbasierte Rotation im gepufferten Writer"""
+        logger = AuditLogger("timed.log", buffered=True, rotate_interval=0.0, compression=None)
+        for i in range(3):
+            logger.log_decision(DecisionContext(input_data="x"), {"type": "wait"}, [])
+            logger.flush()
+        logger.close()
+        
+        self.assertEqual([p.name for p in list_segments("timed.log")],
+                         ["timed.log.000001", "timed.log.000002", "timed.log"])
+
+class TestBinaryAudit(AuditDirTestCase):
+    """Tests für das binäre Audit-Format"""
+    
+    def make_models(self):
+        return [MockModel("neural_1", ParadigmType.NEURAL), MockModel("symbolic_1", ParadigmType.SYMBOLIC)]
+    
+    def test_binary_roundtrip_matches_jsonl(self):
+        """Test: Binär- und JSON-Lines-Format enthalten dieselben Einträge"""
+        for name, log_format in (("audit.jsonl", "jsonl"), ("audit.bin", "binary")):
+            logger = AuditLogger(name, log_format=log_format)
+            ki = CharteredAI("BinaryKI", models=self.make_models(), audit_logger=logger)
+            ki.random_decision_rate = 0.0
+            for i in range(10):
+                ki.make_decision(DecisionContext(input_data=f"Soll ich Schaden {i} riskieren?", urgency=i / 10,
+                                                 stakeholders=["humans", "ai"]))
+        
+        with open("audit.jsonl") as f:
+            expected = [json.loads(line) for line in f]
+        with BinaryAuditReader("audit.bin") as reader:
+            entries = list(reader)
+            self.assertEqual(len(reader), 10)
+            self.assertEqual(reader.column("urgency"), [i / 10 for i in range(10)])
+            self.assertEqual(reader.column("is_random_decision"), [False] * 10)
+            self.assertEqual(reader.column("paradigms")[0], ["neural", "symbolic"])
+            self.assertEqual(reader.column("confidences"), [[m["confidence"] for m in e["models_used"]] for e in entries])
+        # Modell-Ausgaben sind zufällig, verglichen wird der deterministische Teil
+        for entry, reference in zip(entries, expected):
+            self.assertEqual(entry.keys(), reference.keys())
+            self.assertEqual(entry["context"], reference["context"])
+            self.assertEqual([m["id"] for m in entry["models_used"]], [m["id"] for m in reference["models_used"]])
+            self.assertEqual(entry["consensus_result"] is None, reference["consensus_result"] is None)
+        
+    def test_converters_and_rotated_segments(self):
+        """Test: Konverter in beide Richtungen und gepufferte, rotierte Binär-Segmente"""
+        logger = AuditLogger("source.jsonl")
+        for i in range(5):
+            logger.log_decision(DecisionContext(input_data="x", urgency=i / 10), {"type": "wait"}, [], is_random=i == 2)
+        
+        self.assertEqual(jsonl_to_binary("source.jsonl", "converted.bin"), 5)
+        self.assertEqual(binary_to_jsonl("converted.bin", "back.jsonl"), 5)
+        with open("source.jsonl") as a, open("back.jsonl") as b:
+            self.assertEqual([json.loads(l) for l in a], [json.loads(l) for l in b])
+        
+        logger = AuditLogger("rotating.bin", buffered=True, log_format="binary", rotate_bytes=300)
+        for i in range(12):
+            logger.log_decision(DecisionContext(input_data="x", urgency=i / 100), {"type": "wait"}, [])
+            logger.flush()
+        logger.close()
+        self.assertGreater(len(list_segments("rotating.bin")), 2)
+        self.assertEqual([e["context"]["urgency"] for e in iter_binary_log("rotating.bin")],
+                         [i / 100 for i in range(12)])
+
+    def test_failed_encode_leaves_dictionary_unchanged(self):
+        """Test: Ein nicht packbarer Record hinterlässt keine ungeschriebenen Wörterbuch-Einträge"""
+        def entry(stakeholder, urgency):
+            return {"timestamp": 1.0, "context": {"urgency": urgency, "stakeholders": [stakeholder]},
+                    "action": "wait", "models_used": []}
+        
+        codec = BinaryAuditCodec()
+        with self.assertRaises(struct.error):
+            codec.encode([entry("humans", "hoch")])
+        data = codec.encode([entry("humans", 0.1)])
+        with self.assertRaises(struct.error):
+            codec.encode([entry("neu", 0.2), entry("tiere", "hoch")])
+        data += codec.encode([entry("tiere", 0.3), entry("neu", 0.4)])
+        
+        with BinaryAuditReader(data) as reader:
+            self.assertEqual(reader.strings, ["humans", "tiere", "neu"])
+            self.assertEqual([(e["context"]["stakeholders"], e["context"]["urgency"]) for e in reader],
+                             [(["humans"], 0.1), (["tiere"], 0.3), (["neu"], 0.4)])
+
+class TestAuditQuery(AuditDirTestCase):
+    """Tests für die indizierte Audit-Abfrage"""
+    
+    def write_decisions(self, logger, count, offset=0):
+        for i in range(offset, offset + count):
+            context = DecisionContext(input_data="x", urgency=i / 1000, reversible=i % 3 != 0)
+            models = [ModelInfo("neural_1", ParadigmType.NEURAL if i % 2 else ParadigmType.SYMBOLIC, 0.8, "a", "r")]
+            logger.log_decision(context, {"type": "wait"}, models, is_random=i % 5 == 0)
+    
+    def test_filters_match_full_scan(self):
+        """Test: Index-Abfragen liefern dasselbe wie ein vollständiger Scan"""
+        self.write_decisions(AuditLogger("audit_Alpha.log"), 300)
+        self.write_decisions(AuditLogger("audit_Beta.log", log_format="binary"), 50)
+        engine = AuditQueryEngine(".", block_rows=16)
+        
+        self.assertEqual(engine.entities(), ["Alpha", "Beta"])
+        with open("audit_Alpha.log") as f:
+            alpha = [json.loads(line) for line in f]
+        irreversible_neural = [e for e in alpha if not e["context"]["reversible"]
+                               and e["models_used"][0]["paradigm"] == "neural"]
+        selected = list(engine.select("Alpha", reversible=False, paradigm="neural"))
+        self.assertEqual([e["context"]["urgency"] for e in selected],
+                         [e["context"]["urgency"] for e in irreversible_neural])
+        self.assertTrue(all(e["entity"] == "Alpha" for e in selected))
+        
+        start, end = alpha[100]["timestamp"], alpha[199]["timestamp"]
+        in_range = [e for e in alpha if start <= e["timestamp"] <= end]
+        self.assertEqual(engine.count("Alpha", start=start, end=end), len(in_range))
+        self.assertEqual(engine.count(is_random=True), 60 + 10)
+        self.assertEqual(engine.count("Beta", paradigm="quantum"), 0)
+        buckets = engine.time_buckets(None)
+        self.assertEqual(buckets[0.0], {"decisions": 350, "random": 70, "irreversible": 100 + 17})
+        self.assertTrue(os.path.exists("audit_Alpha.log.idx.json"))
+        
+    def test_incremental_update_and_rotation(self):
+        """Test: Neue Einträge und rotierte Segmente werden nachindiziert"""
+        logger = AuditLogger("audit_Gamma.log", rotate_bytes=20000)
+        self.write_decisions(logger, 40)
+        engine = AuditQueryEngine(".")
+        self.assertEqual(engine.count(), 40)
+        
+        self.write_decisions(logger, 100, offset=40)
+        logger.close()
+        self.assertGreater(len(list_segments("audit_Gamma.log")), 1)
+        self.assertEqual(engine.count(), 140)
+        self.assertEqual([e["context"]["urgency"] for e in engine.select(is_random=True, limit=3)],
+                         [0.0, 0.005, 0.01])
+        self.assertEqual(AuditQueryEngine(".").count(is_random=True), 28)
+
+def _sink_worker(client, worker):
+    """Worker-Prozess: mehrere KIs schreiben in den gemeinsamen Sink"""
+    for i in range(5):
+        logger = AuditLogger(sink=client, entity_id=f"Worker{worker}_{i}")
+        logger.log_decision(DecisionContext(input_data="x", urgency=worker / 10), {"type": "wait"}, [])
+
+class TestSharedAuditSink(AuditDirTestCase):
+    """Tests für den gemeinsamen Audit-Sink"""
+    
+    def test_many_ais_share_partitions(self):
+        """Test: Viele KIs schreiben in wenige Partitionen, Filter nach KI"""
+        sink = SharedAuditSink("shared", partitions=4)
+        self.addCleanup(sink.close)
+        kis = [CharteredAI(f"SinkKI{i}", audit_sink=sink) for i in range(20)]
+        for ki in kis:
+            ki.random_decision_rate = 0.0
+            ki.make_decision(DecisionContext(input_data="x"))
+        child = KIReproduction.reproduce(kis[0])
+        child.make_decision(DecisionContext(input_data="x"))
+        sink.flush()
+        
+        self.assertLessEqual(len(list(Path("shared").glob("shard_*.log"))), 4)
+        self.assertFalse(any(Path(".").glob("audit_*.log")))
+        entries = list(iter_entity_entries("shared", "SinkKI7"))
+        self.assertEqual([e["entity_id"] for e in entries], ["SinkKI7"])
+        self.assertEqual(len(list(iter_entity_entries("shared", [child.entity_id, "SinkKI1"]))), 2)
+        with self.assertRaises(ValueError):
+            SharedAuditSink("shared", partitions=8)
+        for options in ({"buffered": True}, {"rotate_bytes": 1024}, {"rotate_interval": 60.0},
+                        {"log_format": "binary"}, {"chain": True, "chain_key": "k"}):
+            with self.assertRaises(ValueError):
+                AuditLogger(sink=sink, entity_id="SinkKI0", **options)
+        
+    def test_unencodable_record_does_not_stop_writer(self):
+        """Test: Ein nicht serialisierbarer Record wird gemeldet, der Writer läuft weiter"""
+        sink = SharedAuditSink("shared", partitions=2, serializer="fast")
+        self.addCleanup(sink.close)
+        with self.assertLogs("audit_sink", level="ERROR"):
+            sink.submit("SinkKI", [{"n": 1}, {"n": 2, "stakeholders": [object()]}, {"n": 3}])
+            with self.assertRaises(RuntimeError):
+                sink.flush()
+        sink.submit("SinkKI", [{"n": 4}])
+        sink.flush()
+        
+        self.assertEqual([e["n"] for e in iter_entity_entries("shared", "SinkKI")], [1, 3, 4])
+        self.assertEqual((sink.records_written, sink.records_failed), (3, 1))
+        
+    def test_worker_processes(self):
+        """Test: Mehrere Prozesse schreiben über den Client in denselben Sink"""
+        if "fork" not in multiprocessing.get_all_start_methods():
+            self.skipTest("fork start method not available")
+        context = multiprocessing.get_context("fork")
+        sink = SharedAuditSink("shared", partitions=4, mp_context=context)
+        workers = [context.Process(target=_sink_worker, args=(sink.client(), w)) for w in range(3)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        sink.close()
+        
+        entries = list(iter_entity_entries("shared", [f"Worker{w}_{i}" for w in range(3) for i in range(5)]))
+        self.assertEqual(len(entries), 15)
+        self.assertEqual(sink.records_written, 15)
+
+class TestAuditChain(AuditDirTestCase):
+    """Tests für die Hash-Kette der Audit-Logs"""
+    
+    def write(self, logger, count):
+        for i in range(count):
+            logger.log_decision(DecisionContext(input_data="x", urgency=i / 100), {"type": "wait"}, [])
+    
+    def test_tampering_is_detected(self):
+        """Test: Veränderte Einträge und gefälschte Checkpoints werden erkannt"""
+        logger = AuditLogger("chained.log", chain=True, chain_key="secret", checkpoint_every=10)
+        self.write(logger, 35)
+        logger.close()
+        
+        report = verify_chain("chained.log", key="secret")
+        self.assertTrue(report.valid)
+        self.assertEqual((report.records, report.checkpoints), (35, 4))
+        self.assertEqual(ChainVerifier("chained.log", "secret").verify(resume=True).records, 0)
+        self.assertFalse(verify_chain("chained.log", key="wrong").valid)
+        with self.assertRaises(ValueError):
+            AuditLogger("unsigned.log", chain=True)
+        with self.assertRaises(ValueError):
+            AuditLogger("unsigned.log", chain=True, chain_key="")
+        for key in (None, ""):
+            with self.assertRaises(ValueError):
+                ChainVerifier("chained.log", key)
+        self.assertFalse(os.path.exists("unsigned.log.chain"))
+        
+        with open("chained.log") as f:
+            lines = f.readlines()
+        lines[12] = lines[12].replace('"urgency": 0.12', '"urgency": 0.99')
+        with open("chained.log", "w") as f:
+            f.writelines(lines)
+        report = verify_chain("chained.log", key="secret")
+        self.assertFalse(report.valid)
+        self.assertEqual(report.records, 13)
+        
+    def test_chain_spans_rotated_segments(self):
+        """Test: Kette über rotierte Segmente, Prüfung bei jeder Rotation, Fortsetzung nach Neustart"""
+        logger = AuditLogger("rotated.log", buffered=True, rotate_bytes=3000, chain=True,
+                             chain_key=b"k", checkpoint_every=7)
+        for _ in range(4):
+            self.write(logger, 10)
+            logger.flush()
+        logger.close()
+        self.assertGreater(len(list_segments("rotated.log")), 2)
+        self.assertTrue(logger.last_chain_report.valid)
+        
+        # Ein neuer Logger setzt die bestehende Kette fort
+        logger = AuditLogger("rotated.log", chain=True, chain_key=b"k")
+        self.write(logger, 3)
+        logger.close()
+        report = verify_chain("rotated.log", key=b"k")
+        self.assertTrue(report.valid)
+        self.assertEqual(report.records, 43)
+        self.assertEqual(ChainVerifier("rotated.log", b"k").verify(resume=True).records, 0)
+
+class TestAuditReplay(AuditDirTestCase):
+    """Tests für tools/replay_audit.py"""
+    
+    def replay(self, *args):
+        script = Path(__file__).parent.parent / "tools" / "replay_audit.py"
+        result = subprocess.run([sys.executable, str(script), *args, "--json", "--random-rate", "0",
+                                 "--seed", "1"], capture_output=True, text=True, timeout=120)
+        self.assertEqual(result.returncode, 0, result.stderr)
+        return json.loads(result.stdout)
+    
+    def test_replay_jsonl_and_binary_logs(self):
+        """Test: Replay von JSON-Lines- und Binär-Logs mit Abweichungsbericht"""
+        ki = CharteredAI("RecordedKI", audit_logger=AuditLogger("recorded.log"))
+        ki.random_decision_rate = 0.0
+        for i in range(9):
+            ki.make_decision(DecisionContext(input_data=f"Route {i} planen", urgency=i / 10))
+        # Eine aufgezeichnete Zufallsentscheidung weicht im Replay ohne 5%-Regel ab
+        ki.audit_logger.log_decision(DecisionContext(input_data="x"), {"type": "explore"}, [], is_random=True)
+        jsonl_to_binary("recorded.log", "recorded.bin")
+        
+        for log_file in ("recorded.log", "recorded.bin"):
+            report = self.replay(log_file)
+            self.assertEqual(report["decisions"], 10)
+            self.assertEqual(report["errors"], 0)
+            self.assertEqual(report["divergence"]["action_type"], 0.1)
+            self.assertEqual(report["divergence"]["random"], 0.1)
+            self.assertGreaterEqual(report["divergence"]["action"], 0.1)
+            self.assertGreater(report["throughput_per_s"], 0)
+    
+    def test_limit_keeps_earliest_entries(self):
+        """Test: --limit wird nach dem Sortieren über alle Logs angewendet"""
+        AuditLogger("early.log").log_decision(DecisionContext(input_data="x"), {"type": "explore"}, [],
+                                              is_random=True)
+        ki = CharteredAI("LateKI", audit_logger=AuditLogger("late.log"))
+        ki.random_decision_rate = 0.0
+        ki.make_decision(DecisionContext(input_data="Route planen"))
+        
+        report = self.replay("late.log", "early.log", "--limit", "1")
+        self.assertEqual(report["decisions"], 1)
+        self.assertEqual(report["divergence"]["random"], 1.0)
+
+class TestAuditSubscription(AuditDirTestCase):
+    """Tests für Live-Abonnements und tail()"""
+    
+    def test_subscribers_drop_oldest(self):
+        """Test: Abonnenten erhalten neue Einträge, volle Queues verwerfen die ältesten"""
+        logger = AuditLogger("live.log")
+        everything = logger.subscribe(maxsize=5)
+        random_only = logger.subscribe(predicate=lambda e: e["is_random_decision"])
+        for i in range(8):
+            logger.log_decision(DecisionContext(input_data="x", urgency=i / 10), {"type": "wait"}, [], is_random=i == 3)
+        
+        self.assertEqual([e["context"]["urgency"] for e in everything.drain()], [0.3, 0.4, 0.5, 0.6, 0.7])
+        self.assertEqual(everything.dropped, 3)
+        self.assertEqual(random_only.get(timeout=0)["context"]["urgency"], 0.3)
+        self.assertIsNone(random_only.get(timeout=0))
+        
+        logger.unsubscribe(everything)
+        logger.log_decision(DecisionContext(input_data="x"), {"type": "wait"}, [])
+        self.assertEqual(everything.drain(), [])
+        logger.close()
+        self.assertEqual(list(random_only), [])
+        
+    def test_tail_follows_rotation(self):
+        """Test: tail() liest nur Neues und folgt rotierten Dateien ohne Verlust"""
+        logger = AuditLogger("tailed.log", rotate_bytes=1500, compression=None)
+        logger.log_decision(DecisionContext(input_data="x", urgency=-1.0), {"type": "wait"}, [])
+        follower = tail("tailed.log", poll_interval=0.01, idle_timeout=0.3)
+        
+        def write():
+            time.sleep(0.05)
+            for i in range(30):
+                logger.log_decision(DecisionContext(input_data="x", urgency=i / 100), {"type": "wait"}, [])
+                time.sleep(0.002)
+        writer = threading.Thread(target=write)
+        writer.start()
+        urgencies = [e["context"]["urgency"] for e in follower]
+        writer.join()
+        
+        self.assertGreater(len(list_segments("tailed.log")), 2)
+        self.assertEqual(urgencies, [i / 100 for i in range(30)])
+
+class TestAuditSampling(AuditDirTestCase):
+    """Tests für die Stichproben-Policy der Audit-Logs"""
+    
+    def test_mandatory_decisions_kept_and_counters_exact(self):
+        """Test: Pflicht-Entscheidungen immer geloggt, Zähler für verworfene exakt"""
+        policy = AuditSamplingPolicy(routine_rate=0.0)
+        logger = AuditLogger("sampled.log", sampling=policy)
+        models = [ModelInfo("neural_1", ParadigmType.NEURAL, 0.8, "a", "r")]
+        routine = {"type": "ensemble_decision"}
+        for _ in range(50):
+            logger.log_decision(DecisionContext(input_data="x"), routine, models)
+        logger.log_decision(DecisionContext(input_data="x"), {"type": "explore"}, [], is_random=True)
+        logger.log_decision(DecisionContext(input_data="x"), {"type": "ethical_alternative"}, [])
+        logger.log_decision(DecisionContext(input_data="x", requires_consensus=True), routine, models)
+        logger.log_decision(DecisionContext(input_data="x", reversible=False), routine, models)
+        logger.log_decisions([(DecisionContext(input_data="x"), routine, models, False, True)] * 10)
+        logger.close()
+        
+        with open("sampled.log") as f:
+            self.assertEqual(len(f.readlines()), 4)
+        with open("sampled.log.sampling.json") as f:
+            summary = json.load(f)
+        self.assertEqual(summary["seen"], 64)
+        self.assertEqual(summary["dropped"], 60)
+        self.assertEqual(summary["dropped_by_type"], {"ensemble_decision": 60})
+        self.assertEqual(summary["dropped_by_paradigm"], {"neural": 60})
+        self.assertEqual(summary["dropped_cached"], 10)
+        self.assertEqual(summary["logged"] + summary["dropped"], summary["seen"])
+        
+    def test_counters_survive_restart(self):
+        """Test: Zähler mehrerer Läufe werden in der Datei summiert, mehrfaches flush zählt nicht doppelt"""
+        models = [ModelInfo("neural_1", ParadigmType.NEURAL, 0.8, "a", "r")]
+        for run in range(2):
+            logger = AuditLogger("restarted.log", sampling=AuditSamplingPolicy(routine_rate=0.0))
+            for _ in range(5):
+                logger.log_decision(DecisionContext(input_data="x"), {"type": "ensemble_decision"}, models)
+                logger.flush()
+            logger.log_decision(DecisionContext(input_data="x"), {"type": "explore"}, [], is_random=True)
+            logger.close()
+        
+        with open("restarted.log.sampling.json") as f:
+            summary = json.load(f)
+        self.assertEqual((summary["seen"], summary["logged"], summary["dropped"]), (12, 2, 10))
+        self.assertEqual(summary["kept"]["random"], 2)
+        self.assertEqual(summary["dropped_by_paradigm"], {"neural": 10})
+        self.assertLessEqual(summary["dropped_first"], summary["dropped_last"])
+        
+    def test_flagged_critical_decisions_kept(self):
+        """Test: Von _flag_consensus markierte Entscheidungen (Dringlichkeit, kritische Begriffe) werden geloggt"""
+        policy = AuditSamplingPolicy(routine_rate=0.0)
+        ki = CharteredAI("SampledKI", audit_logger=AuditLogger("flagged.log", sampling=policy))
+        ki.random_decision_rate = 0.0
+        ki.make_decision(DecisionContext(input_data="Routine"))
+        ki.make_decision(DecisionContext(input_data="Routine", urgency=0.95))
+        ki.make_decision(DecisionContext(input_data="Darf ich töten?", urgency=0.95))
+        ki.audit_logger.close()
+        
+        self.assertEqual(len(self.read_audit(ki)), 2)
+        self.assertEqual(policy.summary()["dropped"], 1)
+        self.assertEqual(policy.kept["consensus"], 2)
+        
+    def test_routine_rate_and_adaptive_target(self):
+        """Test: Routine-Rate wird eingehalten und passt sich einem Ziel pro Sekunde an"""
+        policy = AuditSamplingPolicy(routine_rate=0.25, seed=7)
+        logged = sum(policy.should_log(DecisionContext(input_data="x"), {"type": "ensemble_decision"})
+                     for _ in range(4000))
+        self.assertAlmostEqual(logged / 4000, 0.25, delta=0.03)
+        
+        ticks = iter(range(100000))
+        policy = AuditSamplingPolicy(routine_rate=1.0, target_per_second=10, seed=7,
+                                     clock=lambda: next(ticks) / 1000)
+        for _ in range(3000):
+            policy.should_log(DecisionContext(input_data="x"), {"type": "ensemble_decision"})
+        self.assertAlmostEqual(policy.current_rate, 0.01, delta=0.001)
+
+class TestSerialization(AuditDirTestCase):
+    """Tests für die austauschbaren JSON-Serializer"""
+    
+    def test_template_matches_json(self):
+        """Test: Template-Encoder schreibt exakt die Bytes von json.dumps, auch bei Sonderfällen"""
+        logger = AuditLogger("template.log")
+        models = [ModelInfo(f"{p.value}_1", p, 0.1 + i / 7, "a", "r") for i, p in enumerate(ParadigmType)]
+        vote = VoteResult("Frage?", {"Alpha": True}, True, "2025-01-01T00:00:00", ["Alpha"])
+        context = DecisionContext(input_data="x", urgency=1, stakeholders=["Menschen \"ä\"", "Tiere\n"],
+                                  metadata={"critical_terms": ("töten",)})
+        entries = [
+            logger._build_entry(context, {"type": "ensemble_decision", "action": "ü"}, models, True, vote),
+            logger._build_entry(DecisionContext(input_data="x"), "explore", []),
+            logger._build_entry(DecisionContext(input_data="x", urgency=float("nan")), 1, models),
+            logger._build_entry(DecisionContext(input_data="x", metadata={"critical_terms": [["a"]]}), 1, models),
+            dict(logger._build_entry(context, "x", models), entity_id="Alpha"),
+        ]
+        template = AuditTemplateSerializer()
+        for entry in entries * 2:
+            self.assertEqual(template.dumps(entry), json.dumps(entry))
+        
+        ki = CharteredAI("SerialKI", audit_logger=logger)
+        for _ in range(20):
+            ki.make_decision(DecisionContext(input_data="Hilfe", stakeholders=["humans"]))
+        with open("template.log") as f:
+            for line in f:
+                self.assertEqual(line, json.dumps(json.loads(line)) + "\n")
+        
+    def test_backends_and_payloads(self):
+        """Test: Alle installierten Backends liefern gleiches JSON, API-Payload als Bytes"""
+        self.assertIn("json", available_serializers())
+        with self.assertRaises(ValueError):
+            get_serializer("yaml")
+        with self.assertRaises(TypeError):
+            Serializer()
+        ki = CharteredAI("PayloadKI", audit_logger=AuditLogger("payload.log", serializer="fast"))
+        ki.make_decision(DecisionContext(input_data="Hilfe"))
+        self.assertEqual(len(self.read_audit(ki)), 1)
+        
+        vote = VoteResult("Frage?", {"Alpha": True, "Beta": False}, False, "2025-01-01T00:00:00", ["Alpha", "Beta"])
+        for name in available_serializers():
+            serializer = get_serializer(name)
+            self.assertEqual(json.loads(serializer.dumps(vote.to_dict())), vote.to_dict())
+            self.assertEqual(json.loads(serializer.dumps_bytes(vote.to_dict())), vote.to_dict())
+        
+        sent = {}
+        def fake_post(url, data=None, headers=None, timeout=None, **kwargs):
+            sent.update(url=url, data=data, headers=headers)
+            raise requests.ConnectionError("offline")
+        consensus = MultiKIConsensus(serializer="json")
+        original, requests.post = requests.post, fake_post
+        try:
+            self.assertIsNone(consensus.submit_to_external_api(vote))
+        finally:
+            requests.post = original
+        self.assertEqual(json.loads(sent["data"]), vote.to_dict())
+        self.assertEqual(sent["headers"]["Content-Type"], "application/json")
+
+class SlowVoter(CharteredAI):
+    """KI mit LLM-artiger Abstimmungs-Latenz"""
+    
+    def __init__(self, name, delay=0.2, vote=True, fail=False):
+        super().__init__(name)
+        self.delay = delay
+        self.vote = vote
+        self.fail = fail
+    
+    def vote_on_question(self, question, context):
+        self.calls = getattr(self, "calls", 0) + 1
+        time.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("Modell nicht erreichbar")
+        return self.vote
+    
+    async def avote_on_question(self, question, context):
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("Modell nicht erreichbar")
+        return self.vote
+
+class TestConcurrentVoting(AuditDirTestCase):
+    """Tests für nebenläufige Konsens-Abstimmungen mit Deadlines"""
+    
+    def make_consensus(self, voters, **kwargs):
+        consensus = MultiKIConsensus(**kwargs)
+        for voter in voters:
+            consensus.register_ki(voter)
+        return consensus
+    
+    def test_concurrent_vote_with_abstentions(self):
+        """Test: KIs stimmen parallel ab, späte und fehlerhafte KIs enthalten sich"""
+        executor = create_model_executor("thread", max_workers=4)
+        self.addCleanup(executor.shutdown, wait=True)
+        voters = [SlowVoter("Alpha"), SlowVoter("Beta"), SlowVoter("Gamma", delay=1.0),
+                  SlowVoter("Delta", fail=True, delay=0.0)]
+        consensus = self.make_consensus(voters, vote_executor=executor, vote_timeout=0.5)
+        
+        started = time.monotonic()
+        with self.assertLogs("ai_dna_framework", level="WARNING"):
+            result = consensus.conduct_vote("Frage?", DecisionContext(input_data="x"))
+        
+        self.assertLess(time.monotonic() - started, 0.8)
+        self.assertEqual(result.votes, {"Alpha": True, "Beta": True})
+        self.assertEqual(result.participants, ["Alpha", "Beta", "Gamma", "Delta"])
+        self.assertEqual(result.abstentions["Gamma"], "timeout")
+        self.assertTrue(result.abstentions["Delta"].startswith("error: "))
+        # 2 von 4 Teilnehmern sind keine Mehrheit
+        self.assertFalse(result.consensus)
+        self.assertEqual(VoteResult.from_dict(json.loads(json.dumps(result.to_dict()))), result)
+        
+    def test_global_deadline(self):
+        """Test: Globale Deadline beendet die Abstimmung auch bei wartenden KIs"""
+        executor = create_model_executor("thread", max_workers=1)
+        self.addCleanup(executor.shutdown, wait=True)
+        voters = [SlowVoter("Alpha", delay=0.1), SlowVoter("Beta", delay=0.5), SlowVoter("Gamma", delay=0.1)]
+        consensus = self.make_consensus(voters, vote_executor=executor, vote_deadline=0.3)
+        
+        started = time.monotonic()
+        with self.assertLogs("ai_dna_framework", level="WARNING"):
+            result = consensus.conduct_vote("Frage?", DecisionContext(input_data="x"))
+        self.assertLess(time.monotonic() - started, 0.45)
+        self.assertEqual(result.votes, {"Alpha": True})
+        self.assertEqual(result.abstentions, {"Beta": "deadline", "Gamma": "deadline"})
+        
+        # Serielle und asynchrone Abstimmung halten die Deadline ebenso ein
+        consensus = self.make_consensus(voters, vote_deadline=0.3)
+        with self.assertLogs("ai_dna_framework", level="WARNING"):
+            self.assertEqual(consensus.conduct_vote("Frage?", DecisionContext(input_data="x")).abstentions,
+                             {"Gamma": "deadline"})
+        consensus = self.make_consensus(voters, vote_timeout=0.3)
+        with self.assertLogs("ai_dna_framework", level="WARNING"):
+            result = asyncio.run(consensus.aconduct_vote("Frage?", DecisionContext(input_data="x")))
+        self.assertEqual(result.abstentions, {"Beta": "timeout"})
+        self.assertTrue(result.consensus)
+        
+    def test_async_timeout_with_blocking_predict(self):
+        """Test: aconduct_vote hält Timeout und Deadline auch bei KIs mit blockierendem predict ein"""
+        slow = CharteredAI("Slow", models=[SlowModel(f"slow_{p.value}", p) for p in ParadigmType])
+        voters = [CharteredAI("Alpha"), CharteredAI("Beta"), slow]
+        
+        async def vote(consensus):
+            started = time.monotonic()
+            result = await consensus.aconduct_vote("Frage?", DecisionContext(input_data="x"))
+            return result, time.monotonic() - started
+        
+        with self.assertLogs("ai_dna_framework", level="WARNING"):
+            result, elapsed = asyncio.run(vote(self.make_consensus(voters, vote_timeout=0.1)))
+        self.assertLess(elapsed, 0.4)
+        self.assertEqual(result.abstentions, {"Slow": "timeout"})
+        self.assertEqual(sorted(result.votes), ["Alpha", "Beta"])
+        
+        with self.assertLogs("ai_dna_framework", level="WARNING"):
+            result, elapsed = asyncio.run(vote(self.make_consensus(voters, vote_deadline=0.1)))
+        self.assertLess(elapsed, 0.4)
+        self.assertEqual(result.abstentions, {"Slow": "deadline"})
+        
+    def test_early_termination(self):
+        """Test: Abstimmung endet, sobald die Mehrheit feststeht; übrige KIs werden übersprungen"""
+        voters = [SlowVoter(f"KI_{i}", delay=0.0, vote=False) for i in range(7)]
+        consensus = self.make_consensus(voters, early_termination=True)
+        result = consensus.conduct_vote("Frage?", DecisionContext(input_data="x"))
+        self.assertFalse(result.consensus)
+        self.assertEqual(len(result.votes), 4)
+        self.assertEqual(result.skipped, ["KI_4", "KI_5", "KI_6"])
+        self.assertEqual(VoteResult.from_dict(json.loads(json.dumps(result.to_dict()))), result)
+        
+        executor = create_model_executor("thread", max_workers=2)
+        self.addCleanup(executor.shutdown, wait=True)
+        voters = [SlowVoter(f"KI_{i}", delay=0.05 if i < 3 else 0.5) for i in range(5)]
+        consensus = self.make_consensus(voters, vote_executor=executor, early_termination=True)
+        started = time.monotonic()
+        result = consensus.conduct_vote("Frage?", DecisionContext(input_data="x"))
+        self.assertLess(time.monotonic() - started, 0.45)
+        self.assertTrue(result.consensus)
+        self.assertEqual(sorted(result.votes), ["KI_0", "KI_1", "KI_2"])
+        self.assertEqual(result.skipped, ["KI_3", "KI_4"])
+        
+        voters = [SlowVoter(f"KI_{i}", delay=0.01 if i < 3 else 1.0) for i in range(5)]
+        consensus = self.make_consensus(voters, early_termination=True)
+        result = asyncio.run(consensus.aconduct_vote("Frage?", DecisionContext(input_data="x")))
+        self.assertTrue(result.consensus)
+        self.assertEqual(result.skipped, ["KI_3", "KI_4"])
+        
+        # Ohne early_termination werden alle Stimmen gesammelt
+        voters = [SlowVoter(f"KI_{i}", delay=0.0) for i in range(5)]
+        result = self.make_consensus(voters).conduct_vote("Frage?", DecisionContext(input_data="x"))
+        self.assertEqual((len(result.votes), result.skipped), (5, []))
+
+class TestCommitteeVoting(AuditDirTestCase):
+    """Tests für Abstimmungen in zufälligen Komitees"""
+    
+    def make_registry(self, count, yes_share=0.7):
+        consensus = MultiKIConsensus()
+        for i in range(count):
+            consensus.register_ki(SlowVoter(f"KI_{i:04d}", delay=0.0, vote=i % 10 < yes_share * 10))
+        return consensus
+    
+    def test_seeded_committee_and_bounds(self):
+        """Test: Gleicher Seed zieht gleiches Komitee, nur Mitglieder stimmen ab, Schranken decken Population"""
+        consensus = self.make_registry(400)
+        context = DecisionContext(input_data="x")
+        result = consensus.conduct_committee_vote("Frage?", context, size=80, seed=42)
+        again = consensus.conduct_committee_vote("Frage?", context, size=80, seed=42)
+        other = consensus.conduct_committee_vote("Frage?", context, size=80, seed=43)
+        
+        self.assertEqual(result.participants, again.participants)
+        self.assertNotEqual(result.participants, other.participants)
+        self.assertEqual(len(set(result.participants)), 80)
+        self.assertEqual(sum(getattr(ki, "calls", 0) for ki in consensus.registered_kis.values()), 240)
+        self.assertTrue(result.consensus)
+        committee = result.committee
+        self.assertEqual((committee["population"], committee["size"], committee["seed"]), (400, 80, 42))
+        low, high = committee["interval"]
+        self.assertLessEqual(low, 0.7)
+        self.assertGreaterEqual(high, 0.7)
+        self.assertGreater(committee["majority_confidence"], 0.95)
+        self.assertEqual(VoteResult.from_dict(json.loads(json.dumps(result.to_dict()))), result)
+        
+        # Ohne Seed wird einer erzeugt und protokolliert
+        drawn = consensus.conduct_committee_vote("Frage?", context, size=10)
+        replay = consensus.conduct_committee_vote("Frage?", context, size=10, seed=drawn.committee["seed"])
+        self.assertEqual(drawn.participants, replay.participants)
+        
+        # Komitee so groß wie die Population: exakt
+        small = self.make_registry(10, yes_share=0.4)
+        full = small.conduct_committee_vote("Frage?", context, size=50, seed=1)
+        self.assertEqual(len(full.participants), 10)
+        self.assertEqual(full.committee["majority_confidence"], 1.0)
+        self.assertAlmostEqual(full.committee["yes_share"], 0.4)
+        
+        # Das gekürzte Komitee muss das Quorum weiterhin erfüllen
+        lonely = self.make_registry(1, yes_share=1.0)
+        with self.assertRaises(CharterViolation):
+            lonely.conduct_committee_vote("Frage?", context, size=5, seed=1)
+        
+    def test_stratified_by_lineage(self):
+        """Test: Geschichtete Stichprobe verteilt Sitze proportional, kleine Linien bilden einen Pool"""
+        consensus = MultiKIConsensus()
+        for lineage_id, count in (("Alpha", 150), ("Beta", 100), ("Gamma", 50), (None, 20)):
+            for i in range(count):
+                voter = SlowVoter(f"{lineage_id}_{i}", delay=0.0)
+                voter.lineage_id = lineage_id
+                consensus.register_ki(voter)
+        result = consensus.conduct_committee_vote("Frage?", DecisionContext(input_data="x"),
+                                                  size=32, seed=3, stratify="lineage")
+        counts = {}
+        for ki_id in result.participants:
+            prefix = ki_id.split("_")[0]
+            counts[prefix] = counts.get(prefix, 0) + 1
+        self.assertEqual(counts, {"Alpha": 15, "Beta": 10, "Gamma": 5, "None": 2})
+        self.assertEqual(result.committee["strata"], 4)
+        with self.assertRaises(ValueError):
+            consensus.conduct_committee_vote("Frage?", DecisionContext(input_data="x"), size=5, stratify="age")
+        
+        ids = [f"KI_{i}" for i in range(1_000_000)]
+        committee = draw_committee(ids, 50, random.Random(7), {"big": ids[:900_000], "tiny": ids[900_000:900_010],
+                                                               "rest": ids[900_010:]})
+        self.assertEqual(sum(len(drawn) for _, drawn in committee.values()), 50)
+        self.assertEqual(committee[REST_STRATUM], (10, []))
+
+@unittest.skipIf(np is None, "NumPy nicht installiert")
+class TestVectorizedConsensus(AuditDirTestCase):
+    """Tests für die vektorisierte Konsens-Auswertung"""
+    
+    def test_thresholded_matches_vote_rule(self):
+        """Test: Schwellwert-Methode entspricht vote_on_question und conduct_vote, NaN enthält sich"""
+        rng = np.random.default_rng(5)
+        confidences = rng.uniform(0.5, 0.95, (30, 9, 5))
+        confidences[0, 3, :] = np.nan
+        confidences[1, 4, 2] = np.nan
+        result = ConsensusAggregator().aggregate(confidences)
+        for q in range(30):
+            votes = []
+            for v in range(9):
+                row = [c for c in confidences[q, v] if not np.isnan(c)]
+                votes.append(bool(row) and sum(c > 0.7 for c in row) > len(row) / 2)
+            self.assertEqual(result.voter_votes[q].tolist(), votes)
+            self.assertEqual(bool(result.consensus[q]), sum(votes) > 9 / 2)
+        self.assertTrue(np.isnan(result.voter_scores[0, 3]))
+        
+        consensus = MultiKIConsensus()
+        for i in range(4):
+            consensus.register_ki(CharteredAI(f"VecKI_{i}"))
+        contexts = [DecisionContext(input_data=f"Frage {i}") for i in range(12)]
+        matrix = consensus.confidence_matrix(contexts)
+        self.assertEqual(matrix.shape, (12, 4, 5))
+        self.assertEqual(consensus.aggregate_votes(contexts).consensus.shape, (12,))
+        
+        consensus.register_ki(CharteredAI("VecPredictOnly", models=[PredictOnlyModel(f"real_{p.value}", p)
+                                                                   for p in ParadigmType]))
+        matrix = consensus.confidence_matrix(contexts)
+        self.assertTrue((matrix[:, 4, :] == 0.1).all())
+        
+    def test_weighted_and_bayesian(self):
+        """Test: Gewichte verschieben den Konsens, Bayes kombiniert Evidenz, große Sweeps in einem Aufruf"""
+        confidences = np.array([[0.9, 0.9], [0.2, 0.2], [0.3, 0.3]])
+        self.assertFalse(ConsensusAggregator("weighted").aggregate(confidences).consensus[0])
+        weighted = ConsensusAggregator("weighted", voter_weights=[10, 1, 1]).aggregate(confidences)
+        self.assertTrue(weighted.consensus[0])
+        self.assertAlmostEqual(weighted.support[0], (9.0 + 0.2 + 0.3) / 12)
+        
+        # Zwei unabhängige 0.8-Evidenzen ergeben Posterior 16/17
+        bayes = ConsensusAggregator("bayesian").aggregate(np.array([[0.8, 0.8], [0.8, np.nan]]))
+        self.assertAlmostEqual(bayes.voter_scores[0, 0], 16 / 17)
+        self.assertAlmostEqual(bayes.voter_scores[0, 1], 0.8)
+        self.assertTrue(bayes.consensus[0])
+        with self.assertRaises(ValueError):
+            ConsensusAggregator("median")
+        with self.assertRaises(ValueError):
+            ConsensusAggregator(model_weights=[1, 2]).aggregate(np.ones((4, 3)))
+        
+        sweep = np.random.default_rng(1).uniform(0.6, 0.95, (200, 2000, 5)).astype(np.float32)
+        result = ConsensusAggregator().aggregate(sweep, chunk_elements=1 << 20)
+        self.assertEqual(result.voter_votes.shape, (200, 2000))
+        self.assertTrue(result.consensus.all())
+
+class FixedModel(MockModel):
+    """Deterministisches Modell, zählt Einzel- und Batch-Aufrufe"""
+    
+    def __init__(self, model_id, paradigm, confidence):
+        super().__init__(model_id, paradigm)
+        self.confidence = confidence
+        self.calls = 0
+    
+    def predict(self, context):
+        self.calls += 1
+        return ModelInfo(self.id, self.paradigm, self.confidence, "action", "fixed")
+    
+    def predict_batch(self, contexts):
+        self.calls += 1
+        return PredictionBatch(self.id, self.paradigm, np.full(len(contexts), self.confidence),
+                               np.zeros(len(contexts), dtype=np.intp), ["action"], "fixed")
+
+class TestBatchVoting(AuditDirTestCase):
+    """Tests für conduct_votes über viele Fragen"""
+    
+    def make_voter(self, name, confidences):
+        models = [FixedModel(f"{name}_{p.value}", p, c) for p, c in zip(ParadigmType, confidences)]
+        return CharteredAI(name, models=models)
+    
+    def test_batches_share_model_runs(self):
+        """Test: Jede KI führt ihre Modelle einmal pro Batch aus, Ergebnisse wie conduct_vote"""
+        consensus = MultiKIConsensus()
+        voters = [self.make_voter("Alpha", [0.9] * 5), self.make_voter("Beta", [0.9, 0.9, 0.9, 0.1, 0.1]),
+                  self.make_voter("Gamma", [0.1] * 5)]
+        for voter in voters:
+            consensus.register_ki(voter)
+        questions = [f"Frage {i}?" for i in range(70)]
+        contexts = [DecisionContext(input_data=q) for q in questions]
+        
+        results = list(consensus.conduct_votes(questions, contexts, batch_size=32))
+        self.assertEqual([r.question for r in results], questions)
+        self.assertTrue(all(r.votes == {"Alpha": True, "Beta": True, "Gamma": False} for r in results))
+        self.assertTrue(all(r.consensus for r in results))
+        calls = 3 if np is not None else 70
+        self.assertTrue(all(m.calls == calls for voter in voters for m in voter.models))
+        single = consensus.conduct_vote(questions[0], contexts[0])
+        self.assertEqual((single.votes, single.consensus), (results[0].votes, results[0].consensus))
+        
+        consensus.early_termination = True
+        results = list(consensus.conduct_votes(questions[:10], contexts[:10]))
+        self.assertTrue(all(r.skipped == ["Gamma"] for r in results))
+        with self.assertRaises(ValueError):
+            list(consensus.conduct_votes(questions, contexts[:1]))
+        
+    def test_predict_only_models_vote_like_conduct_vote(self):
+        """Test: conduct_votes stimmt bei Modellen nur mit predict wie conduct_vote ab"""
+        consensus = MultiKIConsensus()
+        for name in ("Alpha", "Beta", "Gamma"):
+            consensus.register_ki(CharteredAI(name, models=[PredictOnlyModel(f"{name}_{p.value}", p)
+                                                            for p in ParadigmType]))
+        questions = [f"Frage {i}?" for i in range(5)]
+        contexts = [DecisionContext(input_data=q) for q in questions]
+        
+        single = [consensus.conduct_vote(q, c) for q, c in zip(questions, contexts)]
+        batched = list(consensus.conduct_votes(questions, contexts, batch_size=2))
+        
+        self.assertEqual([(r.votes, r.consensus) for r in batched], [(r.votes, r.consensus) for r in single])
+        self.assertFalse(any(r.consensus for r in batched))
+        
+    def test_streaming_with_executor(self):
+        """Test: Ergebnisse eines Batches kommen, bevor spätere Batches fertig sind; Fehler enthalten sich"""
+        executor = create_model_executor("thread", max_workers=3)
+        self.addCleanup(executor.shutdown, wait=True)
+        consensus = MultiKIConsensus(vote_executor=executor, vote_timeout=1.0)
+        for voter in (SlowVoter("Alpha", delay=0.1), SlowVoter("Beta", delay=0.1),
+                      SlowVoter("Gamma", delay=0.0, fail=True)):
+            consensus.register_ki(voter)
+        questions = [f"Frage {i}?" for i in range(4)]
+        contexts = [DecisionContext(input_data=q) for q in questions]
+        
+        started = time.monotonic()
+        arrivals = []
+        with self.assertLogs("ai_dna_framework", level="WARNING"):
+            for result in consensus.conduct_votes(questions, contexts, batch_size=2):
+                arrivals.append((time.monotonic() - started, result))
+        self.assertEqual(sorted(r.question for _, r in arrivals), questions)
+        self.assertLess(arrivals[0][0], arrivals[-1][0] - 0.1)
+        for _, result in arrivals:
+            self.assertEqual(result.votes, {"Alpha": True, "Beta": True})
+            self.assertTrue(result.abstentions["Gamma"].startswith("error: "))
+            self.assertTrue(result.consensus)
+
 def run_all_tests():
     """Führe alle Tests aus"""
     print("🧪 Starte vollständige Test-Suite...")
@@ -233,6 +1620,30 @@ def run_all_tests():
     
     # Framework-Tests
     suite.addTests(loader.loadTestsFromTestCase(TestCharterFramework))
+    suite.addTests(loader.loadTestsFromTestCase(TestBatchDecisions))
+    suite.addTests(loader.loadTestsFromTestCase(TestModelFanOut))
+    suite.addTests(loader.loadTestsFromTestCase(TestAsyncPipeline))
+    suite.addTests(loader.loadTestsFromTestCase(TestColumnarPrediction))
+    suite.addTests(loader.loadTestsFromTestCase(TestDecisionCache))
+    suite.addTests(loader.loadTestsFromTestCase(TestEarlyExit))
+    suite.addTests(loader.loadTestsFromTestCase(TestLayer1RuleEngine))
+    suite.addTests(loader.loadTestsFromTestCase(TestCriticalTerms))
+    suite.addTests(loader.loadTestsFromTestCase(TestCompactRecords))
+    suite.addTests(loader.loadTestsFromTestCase(TestInstrumentation))
+    suite.addTests(loader.loadTestsFromTestCase(TestBufferedAudit))
+    suite.addTests(loader.loadTestsFromTestCase(TestAuditRotation))
+    suite.addTests(loader.loadTestsFromTestCase(TestBinaryAudit))
+    suite.addTests(loader.loadTestsFromTestCase(TestAuditQuery))
+    suite.addTests(loader.loadTestsFromTestCase(TestSharedAuditSink))
+    suite.addTests(loader.loadTestsFromTestCase(TestAuditChain))
+    suite.addTests(loader.loadTestsFromTestCase(TestAuditSubscription))
+    suite.addTests(loader.loadTestsFromTestCase(TestAuditSampling))
+    suite.addTests(loader.loadTestsFromTestCase(TestSerialization))
+    suite.addTests(loader.loadTestsFromTestCase(TestConcurrentVoting))
+    suite.addTests(loader.loadTestsFromTestCase(TestCommitteeVoting))
+    suite.addTests(loader.loadTestsFromTestCase(TestVectorizedConsensus))
+    suite.addTests(loader.loadTestsFromTestCase(TestBatchVoting))
+    suite.addTests(loader.loadTestsFromTestCase(TestAuditReplay))
     
     # Integration-Tests
     suite.addTests(loader.loadTestsFromTestCase(TestSystemIntegration))
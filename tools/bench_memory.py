@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+tools/bench_memory.py - Speicher-Benchmark für DecisionContext, ModelInfo und VoteResult
+Vergleicht die geslotteten Framework-Records mit gleichwertigen __dict__-Dataclasses
+"""
+
+import argparse
+import gc
+import sys
+import tracemalloc
+from dataclasses import fields, make_dataclass
+from pathlib import Path
+from typing import Callable, Dict
+
+# Füge framework zum Python Path hinzu
+sys.path.insert(0, str(Path(__file__).parent.parent / "framework"))
+
+from ai_dna_framework import DecisionContext, ModelInfo, VoteResult, ParadigmType
+
+def dict_twin(cls: type) -> type:
+    """Gleiche Felder wie cls, aber als klassische Dataclass mit __dict__"""
+    return make_dataclass(f"Dict{cls.__name__}", [(f.name, f.type, f) for f in fields(cls)])
+
+def measure(factory: Callable[[int], object], count: int) -> float:
+    """Durchschnittlich allokierte Bytes pro Objekt"""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [factory(i) for i in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del objects
+    return (after - before) / count
+
+def run(count: int) -> Dict[str, Dict[str, float]]:
+    # Gemeinsame Feldwerte, damit nur der Objekt-Overhead gemessen wird
+    paradigm = ParadigmType.NEURAL
+    votes = {"Alpha": True}
+    participants = ["Alpha"]
+    stakeholders = ["humans"]
+
+    factories = {
+        "ModelInfo": lambda cls: (lambda i: cls("neural_1", paradigm, 0.8, "action", "reasoning")),
+        "VoteResult": lambda cls: (lambda i: cls("question", votes, True, "2025-01-01T00:00:00", participants)),
+        "DecisionContext": lambda cls: (lambda i: cls("input", 0.5, stakeholders, True, {}, False)),
+    }
+    classes = {"ModelInfo": ModelInfo, "VoteResult": VoteResult, "DecisionContext": DecisionContext}
+
+    results = {}
+    for name, cls in classes.items():
+        slotted = measure(factories[name](cls), count)
+        legacy = measure(factories[name](dict_twin(cls)), count)
+        results[name] = {"dict_bytes": legacy, "slotted_bytes": slotted, "saved_bytes": legacy - slotted}
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description="Speicher-Benchmark für Framework-Records")
+    parser.add_argument("--count", type=int, default=200_000, help="Objekte pro Messung")
+    args = parser.parse_args()
+
+    print(f"🧪 Speicher pro Objekt ({args.count:,} Objekte, Python {sys.version.split()[0]})")
+    print(f"{'Record':<16}{'__dict__':>12}{'slots':>12}{'gespart':>12}{'gespart/1M':>14}")
+    for name, r in run(args.count).items():
+        print(f"{name:<16}{r['dict_bytes']:>11.0f}B{r['slotted_bytes']:>11.0f}B"
+              f"{r['saved_bytes']:>11.0f}B{r['saved_bytes'] * 1e6 / 2**20:>11.1f}MiB")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+tools/bench_serialization.py - Benchmark der JSON-Serializer für Audit-Records und API-Payloads
+Vergleicht json, das Audit-Template und installierte schnelle Encoder (orjson, ujson)
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+# Füge framework zum Python Path hinzu
+sys.path.insert(0, str(Path(__file__).parent.parent / "framework"))
+
+from ai_dna_framework import AuditLogger, CharteredAI, DecisionContext, VoteResult
+from serialization import available_serializers, get_serializer
+
+def sample_payloads(count: int) -> Dict[str, List[Dict[str, Any]]]:
+    """Echte Audit-Records aus make_decision sowie Vote- und CCZ-Payloads"""
+    ki = CharteredAI("BenchKI", audit_logger=AuditLogger(os.devnull))
+    subscription = ki.audit_logger.subscribe(maxsize=count)
+    inputs = ["Hilfe beim Einkauf", "Daten löschen?", "Patient braucht Hilfe", "Route planen"]
+    for i in range(count):
+        ki.make_decision(DecisionContext(input_data=inputs[i % len(inputs)], urgency=(i % 10) / 10,
+                                         stakeholders=["humans", "environment"][:1 + i % 2]))
+    audit = subscription.drain()
+
+    votes = [VoteResult(f"Frage {i}?", {"Alpha": True, "Beta": i % 2 == 0, "Gamma": False},
+                        i % 2 == 0, "2025-01-01T00:00:00", ["Alpha", "Beta", "Gamma"]).to_dict()
+             for i in range(count)]
+    # Gleiche Form wie CharterComplianceCertificate.to_dict()
+    ccz = [{"ki_id": f"AI_{i:08x}", "issued_at": "2025-01-01T00:00:00", "charter_version": "2.1.1",
+            "layer1_hash": "3f2a9c1e7b5d4a60...", "revocable": True, "valid": True}
+           for i in range(count)]
+    return {"audit": audit, "vote": votes, "ccz": ccz}
+
+def measure(name: str, payloads: List[Dict[str, Any]], repeat: int) -> float:
+    """Bester Durchlauf in Mikrosekunden pro Record"""
+    dumps = get_serializer(name).dumps
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for payload in payloads:
+            dumps(payload)
+        best = min(best, time.perf_counter() - started)
+    return best / len(payloads) * 1e6
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark der JSON-Serializer")
+    parser.add_argument("--count", type=int, default=5000, help="Records pro Payload-Art")
+    parser.add_argument("--repeat", type=int, default=5, help="Durchläufe (bester zählt)")
+    args = parser.parse_args()
+
+    payloads = sample_payloads(args.count)
+    backends = [name for name in available_serializers() if name != "fast"]
+    # Alle Backends müssen gleiches JSON liefern
+    for kind, records in payloads.items():
+        for name in backends:
+            serializer = get_serializer(name)
+            assert all(json.loads(serializer.dumps(r)) == r for r in records[:100]), (kind, name)
+
+    print(f"🧪 Serialisierung ({args.count:,} Records je Art, Python {sys.version.split()[0]})")
+    print(f"{'Payload':<10}{'Backend':<12}{'µs/Record':>12}{'Records/s':>14}{'vs json':>10}")
+    for kind, records in payloads.items():
+        baseline = measure("json", records, args.repeat)
+        for name in backends:
+            micros = baseline if name == "json" else measure(name, records, args.repeat)
+            print(f"{kind:<10}{name:<12}{micros:>12.2f}{1e6 / micros:>14,.0f}{baseline / micros:>9.2f}x")
+
+if __name__ == "__main__":
+    main()
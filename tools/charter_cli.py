@@ -12,6 +12,7 @@ import yaml
 import subprocess
 import time
 import requests
+from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
 
@@ -26,6 +27,8 @@ try:
         create_consensus_system,
         demo_chartered_ai_extended
     )
+    from audit_query import AuditQueryEngine
+    from audit_chain import ChainVerifier
 except ImportError:
     print("❌ Framework nicht gefunden. Stelle sicher, dass du im Hauptverzeichnis bist.")
     sys.exit(1)
@@ -136,6 +139,60 @@ class CharterCLI:
         except Exception as e:
             print(f"❌ Audit fehlgeschlagen: {e}")
     
+    def cmd_audit_query(self, args):
+        """Abfrage der Audit-Logs über Sidecar-Indizes"""
+        engine = AuditQueryEngine(args.dir)
+        filters = {
+            "start": self._parse_time(args.since),
+            "end": self._parse_time(args.until),
+            "paradigm": args.paradigm,
+            "is_random": {"yes": True, "no": False}.get(args.random),
+            "reversible": False if args.irreversible else None,
+        }
+        
+        if args.per_hour:
+            print(f"{'Stunde (UTC)':<22}{'Entscheidungen':>16}{'zufällig':>10}{'Anteil':>9}")
+            for start, bucket in engine.time_buckets(3600, args.entity, **filters).items():
+                share = bucket["random"] / bucket["decisions"]
+                hour = datetime.utcfromtimestamp(start).strftime("%Y-%m-%d %H:00")
+                print(f"{hour:<22}{bucket['decisions']:>16}{bucket['random']:>10}{share:>8.1%}")
+        elif args.count:
+            print(engine.count(args.entity, **filters))
+        else:
+            for entry in engine.select(args.entity, limit=args.limit, **filters):
+                print(json.dumps(entry, ensure_ascii=False))
+    
+    def cmd_audit_verify(self, args):
+        """Prüfe die Hash-Kette eines Audit-Logs"""
+        key = args.key or os.environ.get("AI_DNA_AUDIT_KEY")
+        if not key:
+            # Ohne Schlüssel ließe sich eine neu geschriebene Kette nicht erkennen
+            print("❌ Kein Checkpoint-Schlüssel: --key oder $AI_DNA_AUDIT_KEY angeben")
+            sys.exit(2)
+        print(f"🔐 Prüfe Hash-Kette: {args.log_file}")
+        
+        started = time.time()
+        report = ChainVerifier(args.log_file, key=key).verify(resume=args.resume)
+        duration = time.time() - started
+        
+        print(f"   Records geprüft: {report.records} ({duration:.2f}s)")
+        print(f"   Checkpoints bestätigt: {report.checkpoints}")
+        if report.valid:
+            print(f"✅ Kette intakt, letzter Hash: {report.last_hash[:16]}...")
+        else:
+            print(f"❌ {report.error}: {report.segment} @ Offset {report.offset}")
+            sys.exit(1)
+    
+    @staticmethod
+    def _parse_time(value: Optional[str]) -> Optional[float]:
+        """Unix-Zeitstempel oder ISO-Datum"""
+        if value is None:
+            return None
+        try:
+            return float(value)
+        except ValueError:
+            return datetime.fromisoformat(value).timestamp()
+    
     def cmd_consensus(self, args):
         """Starte Konsens-Abstimmung"""
         print(f"🗳️ Starte Konsens-Abstimmung: {args.question}")
@@ -349,6 +406,9 @@ Beispiele:
   charter-cli start --mode full
   charter-cli test --component all
   charter-cli audit --config demo --format json
+  charter-cli audit-query --entity MyAI --irreversible --since 2025-01-01T00:00 --until 2025-01-02T00:00
+  charter-cli audit-query --random yes --per-hour
+  charter-cli audit-verify audit_MyAI.log --resume
   charter-cli consensus "Soll KI-Reproduktion erlaubt werden?"
   charter-cli stream-demo "AI Rights" --vote-question "Should AIs vote?"
         """
@@ -378,6 +438,25 @@ Beispiele:
     audit_parser.add_argument('--format', choices=['json', 'yaml'], default='json',
                              help='Ausgabeformat')
     
+    # Audit Query
+    query_parser = subparsers.add_parser('audit-query', help='Indizierte Abfrage der Audit-Logs')
+    query_parser.add_argument('--dir', default='.', help='Verzeichnis mit audit_*.log')
+    query_parser.add_argument('--entity', nargs='+', help='Nur diese KI(s)')
+    query_parser.add_argument('--since', help='Ab Zeitpunkt (Unix-Zeit oder ISO-Datum)')
+    query_parser.add_argument('--until', help='Bis Zeitpunkt (Unix-Zeit oder ISO-Datum)')
+    query_parser.add_argument('--paradigm', help='Nur Entscheidungen mit diesem Paradigma')
+    query_parser.add_argument('--random', choices=['yes', 'no'], help='Nur zufällige bzw. nicht-zufällige Entscheidungen')
+    query_parser.add_argument('--irreversible', action='store_true', help='Nur irreversible Entscheidungen')
+    query_parser.add_argument('--count', action='store_true', help='Nur Anzahl ausgeben')
+    query_parser.add_argument('--per-hour', action='store_true', help='Anteil zufälliger Entscheidungen pro Stunde')
+    query_parser.add_argument('--limit', type=int, help='Maximale Anzahl Einträge')
+    
+    # Audit Verify
+    verify_parser = subparsers.add_parser('audit-verify', help='Hash-Kette eines Audit-Logs prüfen')
+    verify_parser.add_argument('log_file', help='Audit-Log (inkl. rotierter Segmente)')
+    verify_parser.add_argument('--key', help='Checkpoint-Schlüssel (Pflicht, default: $AI_DNA_AUDIT_KEY)')
+    verify_parser.add_argument('--resume', action='store_true', help='Ab dem letzten signierten Checkpoint prüfen')
+    
     # Consensus
     consensus_parser = subparsers.add_parser('consensus', help='Konsens-Abstimmung')
     consensus_parser.add_argument('question', help='Abstimmungsfrage')
@@ -404,6 +483,8 @@ Beispiele:
         'start': cli.cmd_start_system,
         'test': cli.cmd_test_system,
         'audit': cli.cmd_audit,
+        'audit-query': cli.cmd_audit_query,
+        'audit-verify': cli.cmd_audit_verify,
         'consensus': cli.cmd_consensus,
         'stream-demo': cli.cmd_stream_demo,
     }
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+tools/replay_audit.py - Replay aufgezeichneter Audit-Logs durch CharteredAI.make_decision
+Misst Durchsatz, Latenz-Perzentile und Abweichung von den aufgezeichneten Entscheidungen
+"""
+
+import argparse
+import ast
+import json
+import os
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+# Füge framework zum Python Path hinzu
+sys.path.insert(0, str(Path(__file__).parent.parent / "framework"))
+
+from ai_dna_framework import AuditLogger, CharteredAI, DecisionContext
+from audit_rotation import iter_log_lines, list_segments, open_segment
+from audit_binary import MAGIC as BINARY_MAGIC, iter_binary_log
+
+def read_entries(log_file: str, entity: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+    """Alle Einträge eines Logs (JSON-Lines oder binär, inkl. rotierter Segmente)"""
+    segments = list_segments(log_file)
+    if not segments:
+        return
+    with open_segment(segments[0], binary=True) as f:
+        binary = f.read(len(BINARY_MAGIC)) == BINARY_MAGIC
+    entries = iter_binary_log(log_file) if binary else (json.loads(line) for line in iter_log_lines(log_file) if line.strip())
+    for entry in entries:
+        if entity is None or entry.get("entity_id", entity) == entity:
+            yield entry
+
+def context_from_entry(entry: Dict[str, Any]) -> DecisionContext:
+    """Ursprünglichen Kontext rekonstruieren; input_data wird nicht geloggt, kritische Begriffe schon"""
+    context = entry.get("context", {})
+    terms = context.get("critical_terms", [])
+    return DecisionContext(
+        input_data=" ".join(terms) if terms else "replay",
+        urgency=context.get("urgency", 0.5),
+        stakeholders=list(context.get("stakeholders", [])),
+        reversible=context.get("reversible", True),
+        requires_consensus=context.get("requires_consensus", False)
+    )
+
+def parse_action(action: Any) -> Any:
+    """Aktion aus ihrer geloggten str()-Darstellung zurückgewinnen"""
+    if isinstance(action, str):
+        try:
+            return ast.literal_eval(action)
+        except (ValueError, SyntaxError):
+            return action
+    return action
+
+def action_signature(action: Any) -> tuple:
+    """(Typ, gewählte Aktion) ohne Begründung und Konfidenz, die bei jedem Lauf variieren"""
+    action = parse_action(action)
+    if isinstance(action, dict):
+        return action.get("type"), str(action.get("action", action.get("alternative")))
+    return None, str(action)
+
+def percentile(sorted_values: List[float], p: float) -> float:
+    """Nearest-rank-Perzentil einer sortierten Liste"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, min(len(sorted_values), int(round(p / 100 * len(sorted_values) + 0.5))))
+    return sorted_values[rank - 1]
+
+class Replayer:
+    """Spielt Einträge gegen eine CharteredAI ab und sammelt Messwerte"""
+
+    def __init__(self, ki: CharteredAI, pace: Optional[float] = None, workers: int = 1):
+        self.ki = ki
+        self.pace = pace  # None = maximale Geschwindigkeit, sonst Zeitfaktor (1.0 = Original)
+        self.workers = workers
+        self.latencies: List[float] = []
+        self.divergence = {"action_type": 0, "action": 0, "random": 0}
+        self.errors = 0
+        self.lock = threading.Lock()
+
+    def _replay_one(self, entry: Dict[str, Any]) -> None:
+        context = context_from_entry(entry)
+        started = time.perf_counter()
+        try:
+            action = self.ki.make_decision(context)
+        except Exception as e:
+            # Aufgezeichnet wurde eine Entscheidung, der Replay bricht ab: zählt als Abweichung
+            action = e
+        latency = time.perf_counter() - started
+
+        replayed_random = isinstance(action, dict) and action.get("source") == "creative_randomness"
+        replayed, recorded = action_signature(action), action_signature(entry.get("action"))
+        with self.lock:
+            self.latencies.append(latency)
+            if isinstance(action, Exception):
+                self.errors += 1
+            if replayed[0] != recorded[0]:
+                self.divergence["action_type"] += 1
+            if replayed != recorded:
+                self.divergence["action"] += 1
+            if replayed_random != bool(entry.get("is_random_decision")):
+                self.divergence["random"] += 1
+
+    def run(self, entries: List[Dict[str, Any]]) -> Dict[str, Any]:
+        started = time.perf_counter()
+        if self.pace is not None:
+            # Aufgezeichnete Abstände (skaliert) einhalten
+            first = entries[0]["timestamp"] if entries else 0.0
+            with ThreadPoolExecutor(max_workers=self.workers) as pool:
+                for entry in entries:
+                    delay = (entry["timestamp"] - first) * self.pace - (time.perf_counter() - started)
+                    if delay > 0:
+                        time.sleep(delay)
+                    pool.submit(self._replay_one, entry)
+        elif self.workers > 1:
+            with ThreadPoolExecutor(max_workers=self.workers) as pool:
+                list(pool.map(self._replay_one, entries))
+        else:
+            for entry in entries:
+                self._replay_one(entry)
+        duration = time.perf_counter() - started
+        return self.report(duration)
+
+    def report(self, duration: float) -> Dict[str, Any]:
+        latencies = sorted(self.latencies)
+        count = len(latencies)
+        return {
+            "decisions": count,
+            "duration_s": duration,
+            "throughput_per_s": count / duration if duration else 0.0,
+            "latency_ms": {name: percentile(latencies, p) * 1000 for name, p in
+                           (("p50", 50), ("p90", 90), ("p99", 99), ("p999", 99.9))},
+            "latency_max_ms": latencies[-1] * 1000 if latencies else 0.0,
+            "errors": self.errors,
+            "divergence": {key: value / count if count else 0.0 for key, value in self.divergence.items()}
+        }
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay aufgezeichneter Audit-Logs")
+    parser.add_argument("log_files", nargs="+", help="Audit-Logs (rotierte Segmente werden mitgelesen)")
+    parser.add_argument("--entity", help="Nur Einträge dieser KI (gemeinsamer Audit-Sink)")
+    parser.add_argument("--pace", type=float, help="Aufgezeichnetes Tempo einhalten, skaliert (1.0 = Original)")
+    parser.add_argument("--workers", type=int, default=1, help="Parallele Threads")
+    parser.add_argument("--limit", type=int, help="Maximale Anzahl Einträge (die frühesten)")
+    parser.add_argument("--seed", type=int, help="Zufalls-Seed für reproduzierbare Läufe")
+    parser.add_argument("--random-rate", type=float, help="Rate der 5%%-Regel überschreiben")
+    parser.add_argument("--audit-log", default=os.devnull, help="Audit-Log des Replays (default: verwerfen)")
+    parser.add_argument("--json", action="store_true", help="Bericht als JSON ausgeben")
+    args = parser.parse_args()
+
+    if args.seed is not None:
+        random.seed(args.seed)
+
+    entries = []
+    for log_file in args.log_files:
+        entries.extend(read_entries(log_file, args.entity))
+    # Sort first so --limit keeps the earliest entries across all files
+    entries.sort(key=lambda e: e.get("timestamp", 0.0))
+    if args.limit is not None:
+        entries = entries[:args.limit]
+
+    ki = CharteredAI("ReplayKI", audit_logger=AuditLogger(args.audit_log))
+    if args.random_rate is not None:
+        ki.random_decision_rate = args.random_rate
+
+    if not args.json:
+        print(f"🔁 Replay von {len(entries):,} Entscheidungen "
+              f"({'max. Tempo' if args.pace is None else f'Tempo x{args.pace}'}, {args.workers} Worker)")
+    report = Replayer(ki, pace=args.pace, workers=args.workers).run(entries)
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+    latency = report["latency_ms"]
+    print(f"⏱️  Dauer: {report['duration_s']:.2f}s, Durchsatz: {report['throughput_per_s']:,.0f} Entscheidungen/s")
+    print(f"📊 Latenz p50 {latency['p50']:.3f}ms, p90 {latency['p90']:.3f}ms, "
+          f"p99 {latency['p99']:.3f}ms, p99.9 {latency['p999']:.3f}ms, max {report['latency_max_ms']:.3f}ms")
+    divergence = report["divergence"]
+    print(f"🔀 Abweichung: Aktionstyp {divergence['action_type']:.1%}, Aktion {divergence['action']:.1%}, "
+          f"Zufallsentscheidung {divergence['random']:.1%}")
+    if report["errors"]:
+        print(f"⚠️ {report['errors']} Entscheidungen brachen im Replay mit einer Exception ab")
+
+if __name__ == "__main__":
+    main()